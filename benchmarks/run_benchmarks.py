@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite for the bracket scripts.
+Runs against recorded plaintextsports fixtures and synthetic issue sets, and
+reports wall time, peak memory and API calls per benchmark as JSON so results
+can be compared across commits.
+"""
+
+import os
+import sys
+import io
+import json
+import time
+import argparse
+import itertools
+import platform
+import subprocess
+import tracemalloc
+from contextlib import redirect_stdout
+from typing import Callable, Dict, List
+
+import requests
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+FIXTURES_DIR = os.path.join(BENCH_DIR, 'fixtures')
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+os.environ.setdefault('GITHUB_TOKEN', 'benchmark-token')
+os.environ.setdefault('HOST_MIN_INTERVAL', '0')
+os.environ.pop('HTTP_CACHE_DIR', None)
+os.environ.pop('PAGE_CACHE_DIR', None)
+os.environ['MATCHUP_INDEX_DIR'] = ''
+
+import generate_bracket  # noqa: E402
+import score_playoffs  # noqa: E402
+import scoring_engine  # noqa: E402
+from bracket_model import Bracket  # noqa: E402
+from elimination import outlook  # noqa: E402
+from issue_records import records_from_page  # noqa: E402
+from rate_limit import RequestScheduler  # noqa: E402
+from transport import build_response  # noqa: E402
+from standin_server import GitHubStandin, RepoState, read_fixture  # noqa: E402
+from synthetic import make_game_states, make_issues, make_labels  # noqa: E402
+
+# (issues, players) per scale preset
+SCALES = {
+    'small': [(53, 3)],
+    'medium': [(53, 3), (5000, 100)],
+    'full': [(53, 3), (5000, 100), (100000, 10000)]
+}
+
+# Wall-time changes smaller than this are treated as timer noise
+MIN_SIGNIFICANT_SECONDS = 0.002
+
+
+class FakeSession:
+    """In-process requests.Session replacement routed through the GitHub stand-in."""
+
+    def __init__(self, issues: List[Dict], labels: List[Dict]):
+        self.standin = GitHubStandin(lambda owner, name: RepoState(owner, name, issues, labels))
+        self.calls = 0
+
+    def request(self, method: str, url: str, params=None, data=None, json=None, headers=None, **kwargs) -> requests.Response:
+        self.calls += 1
+        prepared = requests.Request(method, url, params=params, data=data, json=json).prepare()
+        status, response_headers, content = self.standin.handle(prepared.method, prepared.url, prepared.body or b'', headers)
+        return build_response(prepared, status, response_headers, content)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request('PATCH', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+
+def install_session(session: FakeSession):
+    """Point both scripts at the fake session and reset their caches and counters."""
+    generate_bracket.SESSION = session
+    score_playoffs.SESSION = session
+    generate_bracket.SCHEDULER = RequestScheduler(session, write_rate=0)
+    score_playoffs.SCHEDULER = RequestScheduler(session, write_rate=0)
+    generate_bracket.HTTP_CACHE = generate_bracket.HttpCache(None)
+    score_playoffs.HTTP_CACHE = score_playoffs.HttpCache(None)
+    # Every run fetches its pages again rather than hitting the previous run's in-memory copies
+    generate_bracket.PAGE_CACHE = generate_bracket.PageCache(None)
+    for key in generate_bracket.stats:
+        generate_bracket.stats[key] = 0
+
+
+def measure(name: str, params: Dict, setup: Callable[[], Callable[[], object]], repeat: int) -> Dict:
+    """Time the best of `repeat` runs, then measure peak memory and API calls in one traced run."""
+    best = float('inf')
+    for _ in range(repeat):
+        run = setup()
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+
+    run = setup()
+    session = generate_bracket.SESSION
+    calls_before = session.calls if isinstance(session, FakeSession) else 0
+    tracemalloc.start()
+    with redirect_stdout(io.StringIO()):
+        run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    api_calls = session.calls - calls_before if isinstance(session, FakeSession) else 0
+
+    result = {'name': name, 'params': params, 'wall_seconds': best, 'peak_kib': peak / 1024, 'api_calls': api_calls}
+    print(f"  {name:<40} {format_params(params):<28} {best * 1000:>10.2f} ms {peak / 1024:>12.0f} KiB {api_calls:>7} calls")
+    return result
+
+
+def format_params(params: Dict) -> str:
+    return ' '.join(f'{key}={value}' for key, value in params.items())
+
+
+def benchmark_extract(repeat: int) -> List[Dict]:
+    results = []
+    for fixture in ['game_final', 'game_scheduled']:
+        html = read_fixture(f'{fixture}.html')
+        expected = read_fixture(f'{fixture}.expected.txt')
+        if generate_bracket.extract_game_content(html) != expected:
+            raise AssertionError(f"extract_game_content output changed for {fixture}.html")
+
+        def setup(html=html):
+            return lambda: [generate_bracket.extract_game_content(html) for _ in range(50)]
+        results.append(measure('extract_game_content x50', {'fixture': fixture}, setup, repeat))
+    return results
+
+
+def benchmark_schedule(repeat: int) -> List[Dict]:
+    def setup():
+        install_session(FakeSession([], []))
+        return lambda: generate_bracket.parse_schedule_for_games(2025)
+    return [measure('parse_schedule_for_games', {'year': 2025}, setup, repeat)]
+
+
+def calculate_scores_without_numpy(issues: List[Dict]):
+    """Score through the engine's pure-Python fallback."""
+    numpy = scoring_engine.np
+    scoring_engine.np = None
+    try:
+        return score_playoffs.calculate_scores(issues)
+    finally:
+        scoring_engine.np = numpy
+
+
+def benchmark_scoring(scale: List, repeat: int) -> List[Dict]:
+    results = []
+    for num_issues, num_players in scale:
+        issues = records_from_page(make_issues(num_issues, num_players))
+        params = {'issues': num_issues, 'players': num_players}
+        results.append(measure('calculate_scores', params, lambda: lambda: score_playoffs.calculate_scores(issues), repeat))
+        results.append(measure('calculate_scores without numpy', params,
+                               lambda: lambda: calculate_scores_without_numpy(issues), repeat))
+
+        scores = score_playoffs.calculate_scores(issues)
+        results.append(measure('generate_readme', params, lambda: lambda: score_playoffs.generate_readme(scores), repeat))
+    return results
+
+
+def benchmark_listing(scale: List, repeat: int) -> List[Dict]:
+    """Page through a repository's issues and keep what the scripts retain."""
+    results = []
+    for num_issues, num_players in scale:
+        issues = make_issues(num_issues, num_players)
+
+        def setup(issues=issues, num_players=num_players):
+            install_session(FakeSession(issues, make_labels(num_players)))
+            return lambda: list(score_playoffs.get_all_issues())
+        results.append(measure('get_all_issues', {'issues': num_issues, 'players': num_players}, setup, repeat))
+    return results
+
+
+def benchmark_main_flows(scale: List, repeat: int) -> List[Dict]:
+    results = []
+    labels = make_labels(3)
+
+    for mode, argv in [('placeholders', []), ('graphql', ['--graphql']), ('crawl', ['--crawl']),
+                       ('graphql x3 repos', ['--graphql', '--repos', 'pool/one', 'pool/two', 'pool/three'])]:
+        def setup(argv=argv):
+            install_session(FakeSession([], labels))
+            sys.argv = ['generate_bracket.py'] + argv
+            return generate_bracket.main
+        results.append(measure('generate_bracket.main', {'mode': mode}, setup, repeat))
+
+    for num_issues, num_players in scale:
+        issues = make_issues(num_issues, num_players)
+
+        def setup(issues=issues, num_players=num_players):
+            install_session(FakeSession(issues, make_labels(num_players)))
+            sys.argv = ['score_playoffs.py']
+            return score_playoffs.main
+        results.append(measure('score_playoffs.main', {'issues': num_issues, 'players': num_players}, setup, repeat))
+    return results
+
+
+def limits_by_enumeration(games: List[Dict], totals: Dict[str, int]) -> Dict[str, Dict]:
+    """Maximum points and elimination by trying every combination of final series lengths."""
+    bracket = Bracket()
+    played: Dict[str, int] = {}
+    open_games = []
+    for game in games:
+        series = bracket.series_for(game['key'])
+        game_num = int(game['key'].rsplit('-G', 1)[1])
+        if game['status'] == 'played':
+            played[series.key] = max(played.get(series.key, 0), game_num)
+        elif game['players']:
+            open_games.append((series.key, game_num, game))
+
+    names = list(totals) + sorted({label.replace('player:', '') for _, _, game in open_games
+                                   for label in game['players']} - set(totals))
+    series_keys = sorted({key for key, _, _ in open_games})
+    # A series may end as soon as it could be decided, including at the games already played
+    choices = [range(max(bracket.series[key].best_of // 2 + 1, played.get(key, 0)), bracket.series[key].best_of + 1)
+               for key in series_keys]
+    maximum = {name: totals.get(name, 0) for name in names}
+    can_win = set()
+    for combo in itertools.product(*choices):
+        lengths = dict(zip(series_keys, combo))
+        final = {name: totals.get(name, 0) for name in names}
+        for key, game_num, game in open_games:
+            if game_num <= lengths[key]:
+                for label in game['players']:
+                    final[label.replace('player:', '')] += score_playoffs.SERIES_POINTS[game['series']]
+        top = max(final.values(), default=0)
+        can_win.update(name for name, points in final.items() if points == top)
+        for name, points in final.items():
+            maximum[name] = max(maximum[name], points)
+    return {name: {'max': maximum[name], 'eliminated': name not in can_win} for name in names}
+
+
+def benchmark_elimination(scale: List, repeat: int) -> List[Dict]:
+    """Check the elimination search against full enumeration on small brackets, then time it."""
+    # Two games of a best-of-3 played and Game 3 not yet pruned: the series may already be over
+    cases = [([{'key': f'2026-ALWC-3v6-G{game_num}', 'status': 'played' if game_num < 3 else 'open',
+                'series': 'series:wc', 'players': ['player:a'] if game_num == 3 else []} for game_num in (1, 2, 3)],
+              {'a': 10, 'b': 10})]
+    cases += [make_game_states(num_series, 6, seed=seed) for seed in range(200) for num_series in (1, 2, 4)]
+    for games, totals in cases:
+        expected = limits_by_enumeration(games, totals)
+        if outlook(games, totals, score_playoffs.SERIES_POINTS) != expected:
+            raise AssertionError(f"elimination disagrees with full enumeration for {games} with totals {totals}")
+
+    results = []
+    for num_issues, num_players in scale:
+        games, totals = make_game_states(11, num_players)
+        results.append(measure('outlook', {'series': 11, 'players': num_players},
+                               lambda: lambda: outlook(games, totals, score_playoffs.SERIES_POINTS), repeat))
+    return results
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def result_key(result: Dict) -> str:
+    return f"{result['name']} {format_params(result['params'])}"
+
+
+def compare(previous: Dict, current: Dict, threshold: float) -> int:
+    """Print per-benchmark changes against a previous run and return the number of regressions."""
+    baseline = {result_key(result): result for result in previous['results']}
+    regressions = 0
+
+    print(f"\nComparison against {previous.get('revision', 'unknown')} (threshold {threshold:.0f}%)")
+    for result in current['results']:
+        old = baseline.get(result_key(result))
+        if not old:
+            continue
+        changes = []
+        for metric in ['wall_seconds', 'peak_kib', 'api_calls']:
+            if old[metric]:
+                change = (result[metric] - old[metric]) / old[metric] * 100
+                changes.append(f"{metric} {change:+.1f}%")
+                significant = metric != 'wall_seconds' or result[metric] - old[metric] > MIN_SIGNIFICANT_SECONDS
+                if change > threshold and significant:
+                    regressions += 1
+                    changes[-1] += ' REGRESSION'
+        print(f"  {result_key(result):<70} {', '.join(changes)}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the offline benchmark suite.')
+    parser.add_argument('--scale', choices=sorted(SCALES), default='medium',
+                        help='Synthetic issue set sizes to run (default: medium)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per benchmark; the best is kept (default: 3)')
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    parser.add_argument('--compare', help='Compare against a previous JSON results file')
+    parser.add_argument('--threshold', type=float, default=15.0,
+                        help='Percent slowdown reported as a regression (default: 15)')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit non-zero when a regression is found')
+    args = parser.parse_args()
+
+    scale = SCALES[args.scale]
+    print(f"⚾ Benchmarks @ {git_revision()} (scale: {args.scale}, repeat: {args.repeat})\n")
+
+    results = []
+    results += benchmark_extract(args.repeat)
+    results += benchmark_schedule(args.repeat)
+    results += benchmark_scoring(scale, args.repeat)
+    results += benchmark_listing(scale, args.repeat)
+    results += benchmark_elimination(scale, args.repeat)
+    results += benchmark_main_flows(scale, args.repeat)
+
+    report = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'scale': args.scale,
+        'results': results
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
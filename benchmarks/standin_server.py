@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the GitHub REST/GraphQL endpoints and plaintextsports pages
+the bracket scripts use, for load testing and profiling offline.
+
+Implements issues (with Link-header pagination, since= and ETags), labels,
+README contents GET/PUT, the git data calls the README publisher makes, the
+GraphQL queries generate_bracket.py sends, and rate-limit headers, with
+optional latency injection.
+
+    python3 benchmarks/standin_server.py --port 8765 --issues 5000 --players 100 --latency-ms 40
+    GITHUB_API_URL=http://127.0.0.1:8765 PLAINTEXTSPORTS_URL=http://127.0.0.1:8765 \\
+        GITHUB_TOKEN=local python3 score_playoffs.py
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import base64
+import random
+import hashlib
+import re
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlencode, urlparse
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(BENCH_DIR, 'fixtures')
+sys.path.insert(0, BENCH_DIR)
+
+from synthetic import make_issues, make_labels  # noqa: E402
+
+REPO_PATTERN = re.compile(r'^/repos/([^/]+)/([^/]+)(/.*)?$')
+GAME_PAGE_PATTERN = re.compile(r'^/mlb/\d{4}-\d{2}-\d{2}/[^/]+$')
+SCHEDULE_PATTERN = re.compile(r'^/mlb/\d{4}/schedule$')
+
+Response = Tuple[int, Dict[str, str], bytes]
+
+
+def read_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def timestamp() -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+
+class RepoState:
+    """Issues, labels and README history of one stand-in repository."""
+
+    def __init__(self, owner: str, name: str, issues: List[Dict], labels: List[Dict]):
+        self.owner = owner
+        self.name = name
+        self.issues = {issue['number']: issue for issue in issues}
+        self.labels = {label['name']: label for label in labels}
+        self.next_label_id = max((label['id'] for label in labels), default=0) + 1
+        # The branch only holds README.md: trees map to its text, commits to a tree and parents
+        self.trees: Dict[str, str] = {}
+        self.commits: Dict[str, Dict] = {}
+        self.head = self.commit(self.tree('# ⚾ World Series Bracket Tracker 🏆\n'), [], 'Initial commit')
+
+    @staticmethod
+    def sha(content: str) -> str:
+        return hashlib.sha1(content.encode()).hexdigest()
+
+    def tree(self, readme: str) -> str:
+        tree_sha = self.sha(f'tree {readme}')
+        self.trees[tree_sha] = readme
+        return tree_sha
+
+    def commit(self, tree_sha: str, parents: List[str], message: str) -> str:
+        commit_sha = self.sha(f'commit {tree_sha} {parents} {message} {len(self.commits)}')
+        self.commits[commit_sha] = {'tree': tree_sha, 'parents': parents, 'message': message}
+        return commit_sha
+
+    def readme_at(self, commit_sha: str) -> Optional[str]:
+        commit = self.commits.get(commit_sha)
+        return self.trees[commit['tree']] if commit else None
+
+    def is_ancestor(self, ancestor: str, commit_sha: str) -> bool:
+        pending = [commit_sha]
+        while pending:
+            sha = pending.pop()
+            if sha == ancestor:
+                return True
+            pending.extend(self.commits.get(sha, {}).get('parents', []))
+        return False
+
+    @property
+    def readme(self) -> str:
+        return self.readme_at(self.head)
+
+    @property
+    def readme_sha(self) -> str:
+        return self.sha(self.readme)
+
+    def label_object(self, name: str) -> Dict:
+        if name not in self.labels:
+            label_id = self.next_label_id
+            self.next_label_id += 1
+            self.labels[name] = {'id': label_id, 'node_id': f'LA_{label_id:012d}', 'name': name,
+                                 'color': 'ededed', 'default': False, 'description': None}
+        return self.labels[name]
+
+
+class GitHubStandin:
+    """Request router shared by the HTTP server and the in-process benchmark session."""
+
+    def __init__(self, seed: Optional[Callable[[str, str], RepoState]] = None, rate_limit: int = 5000,
+                 secondary_limit: int = 0, secondary_window: float = 60.0):
+        self.seed = seed or (lambda owner, name: RepoState(owner, name, [], make_labels(3)))
+        self.repos: Dict[str, RepoState] = {}
+        self.lock = threading.RLock()
+        self.rate_limit = rate_limit
+        self.remaining = rate_limit
+        self.reset_at = int(time.time()) + 3600
+        self.secondary_limit = secondary_limit
+        self.secondary_window = secondary_window
+        self.recent_writes: List[float] = []
+        self.requests = 0
+        self.pages = {'/mlb/': read_fixture('mlb_index.html')}
+        self.schedule = read_fixture('schedule_2025.html')
+        self.game_pages = [read_fixture('game_final.html'), read_fixture('game_scheduled.html')]
+
+    def repo(self, owner: str, name: str) -> RepoState:
+        key = f'{owner}/{name}'
+        if key not in self.repos:
+            self.repos[key] = self.seed(owner, name)
+        return self.repos[key]
+
+    # Responses
+
+    def rate_headers(self) -> Dict[str, str]:
+        return {
+            'X-RateLimit-Limit': str(self.rate_limit),
+            'X-RateLimit-Remaining': str(max(self.remaining, 0)),
+            'X-RateLimit-Reset': str(self.reset_at),
+            'X-RateLimit-Used': str(self.rate_limit - max(self.remaining, 0))
+        }
+
+    def json_response(self, status: int, payload, extra: Optional[Dict[str, str]] = None) -> Response:
+        headers = {'Content-Type': 'application/json; charset=utf-8'}
+        headers.update(self.rate_headers())
+        headers.update(extra or {})
+        return status, headers, json.dumps(payload).encode()
+
+    def error(self, status: int, message: str, extra: Optional[Dict[str, str]] = None) -> Response:
+        return self.json_response(status, {'message': message}, extra)
+
+    def handle(self, method: str, url: str, body: bytes = b'', headers: Optional[Dict[str, str]] = None) -> Response:
+        """Route one request and return (status, headers, body)."""
+        parsed = urlparse(url)
+        headers = {key.lower(): value for key, value in (headers or {}).items()}
+        with self.lock:
+            self.requests += 1
+            if parsed.path.startswith('/mlb/'):
+                return self.plaintextsports(parsed.path)
+
+            if self.remaining <= 0:
+                return self.error(403, 'API rate limit exceeded')
+
+            payload = json.loads(body) if body else None
+            if method in ('POST', 'PATCH', 'PUT', 'DELETE') and self.secondary_limited():
+                return self.error(403, 'You have exceeded a secondary rate limit. Please wait a few minutes before you try again.',
+                                  {'Retry-After': str(int(self.secondary_window))})
+
+            status, response_headers, content = self.route(method, parsed, payload, headers)
+            etag = response_headers.get('ETag')
+            if status == 200 and etag and headers.get('if-none-match') == etag:
+                # Conditional hits are not charged against the rate limit
+                return 304, dict(self.rate_headers(), ETag=etag), b''
+            self.remaining -= 1
+            response_headers.update(self.rate_headers())
+            return status, response_headers, content
+
+    def secondary_limited(self) -> bool:
+        if not self.secondary_limit:
+            return False
+        now = time.monotonic()
+        self.recent_writes = [t for t in self.recent_writes if now - t < self.secondary_window]
+        if len(self.recent_writes) >= self.secondary_limit:
+            return True
+        self.recent_writes.append(now)
+        return False
+
+    def plaintextsports(self, path: str) -> Response:
+        html_headers = {'Content-Type': 'text/html; charset=utf-8'}
+        if path in self.pages:
+            return 200, html_headers, self.pages[path].encode()
+        if SCHEDULE_PATTERN.match(path):
+            return 200, html_headers, self.schedule.encode()
+        if GAME_PAGE_PATTERN.match(path):
+            page = self.game_pages[zlib.crc32(path.encode()) % len(self.game_pages)]
+            return 200, html_headers, page.encode()
+        return 404, html_headers, b'Not Found'
+
+    def route(self, method: str, parsed, payload, headers: Dict[str, str]) -> Response:
+        if parsed.path == '/graphql' and method == 'POST':
+            return self.graphql(payload)
+        if parsed.path == '/rate_limit':
+            return self.json_response(200, {'resources': {'core': {'limit': self.rate_limit, 'remaining': self.remaining,
+                                                                    'reset': self.reset_at}}})
+
+        match = REPO_PATTERN.match(parsed.path)
+        if not match:
+            return self.error(404, 'Not Found')
+        repo = self.repo(match.group(1), match.group(2))
+        resource = (match.group(3) or '').strip('/').split('/')
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+
+        if resource[0] == 'issues':
+            return self.issues(method, repo, resource[1:], query, payload, parsed)
+        if resource[0] == 'labels':
+            return self.labels(method, repo, [unquote(part) for part in resource[1:]], query, payload, parsed)
+        if resource == ['contents', 'README.md']:
+            return self.contents(method, repo, payload, query)
+        if resource[0] == 'git':
+            return self.git(method, repo, resource[1:], payload)
+        return self.error(404, 'Not Found')
+
+    def paginate(self, items: List, query: Dict[str, str], parsed) -> Response:
+        per_page = min(int(query.get('per_page', 30)), 100)
+        page = int(query.get('page', 1))
+        last = max(1, -(-len(items) // per_page))
+        page_items = items[(page - 1) * per_page:page * per_page]
+
+        links = []
+        base = f'{parsed.scheme or "http"}://{parsed.netloc}{parsed.path}' if parsed.netloc else parsed.path
+        for rel, number in [('prev', page - 1), ('next', page + 1), ('last', last), ('first', 1)]:
+            if (rel in ('prev', 'first') and page > 1) or (rel in ('next', 'last') and page < last):
+                link_query = dict(query, page=str(number))
+                links.append(f'<{base}?{urlencode(link_query)}>; rel="{rel}"')
+
+        content = json.dumps(page_items).encode()
+        headers = {'Content-Type': 'application/json; charset=utf-8',
+                   'ETag': '"' + hashlib.sha1(content).hexdigest() + '"'}
+        if links:
+            headers['Link'] = ', '.join(links)
+        return 200, headers, content
+
+    def issues(self, method: str, repo: RepoState, rest: List[str], query: Dict[str, str], payload, parsed) -> Response:
+        if not rest and method == 'GET':
+            state = query.get('state', 'open')
+            since = query.get('since')
+            items = [issue for issue in repo.issues.values()
+                     if (state == 'all' or issue['state'] == state) and (not since or issue['updated_at'] >= since)]
+            items.sort(key=lambda issue: issue['number'], reverse=True)
+            return self.paginate(items, query, parsed)
+
+        if not rest and method == 'POST':
+            number = max(repo.issues, default=0) + 1
+            now = timestamp()
+            issue = {
+                'number': number,
+                'node_id': f'I_{number:016d}',
+                'title': payload['title'],
+                'body': payload.get('body', ''),
+                'labels': [repo.label_object(name) for name in payload.get('labels', [])],
+                'state': 'open',
+                'created_at': now,
+                'updated_at': now,
+                'closed_at': None
+            }
+            repo.issues[number] = issue
+            return self.json_response(201, issue)
+
+        if len(rest) == 1 and rest[0].isdigit():
+            issue = repo.issues.get(int(rest[0]))
+            if not issue:
+                return self.error(404, 'Not Found')
+            if method == 'PATCH':
+                for field in ('title', 'body', 'state', 'state_reason'):
+                    if field in payload:
+                        issue[field] = payload[field]
+                if 'labels' in payload:
+                    issue['labels'] = [repo.label_object(name) for name in payload['labels']]
+                issue['updated_at'] = timestamp()
+            content = json.dumps(issue).encode()
+            return 200, {'Content-Type': 'application/json; charset=utf-8',
+                         'ETag': '"' + hashlib.sha1(content).hexdigest() + '"'}, content
+        return self.error(404, 'Not Found')
+
+    def labels(self, method: str, repo: RepoState, rest: List[str], query: Dict[str, str], payload, parsed) -> Response:
+        if not rest and method == 'GET':
+            return self.paginate(list(repo.labels.values()), query, parsed)
+        if not rest and method == 'POST':
+            if payload['name'] in repo.labels:
+                return self.json_response(422, {'message': 'Validation Failed',
+                                                 'errors': [{'resource': 'Label', 'code': 'already_exists', 'field': 'name'}]})
+            label = repo.label_object(payload['name'])
+            label.update(color=payload.get('color', 'ededed'), description=payload.get('description'))
+            return self.json_response(201, label)
+
+        name = rest[0] if rest else ''
+        label = repo.labels.get(name)
+        if not label:
+            return self.error(404, 'Not Found')
+        if method == 'DELETE':
+            del repo.labels[name]
+            for issue in repo.issues.values():
+                issue['labels'] = [item for item in issue['labels'] if item['name'] != name]
+            return 204, {}, b''
+        if method == 'PATCH':
+            new_name = payload.get('new_name') or payload.get('name') or name
+            label.update(color=payload.get('color', label['color']), description=payload.get('description', label['description']))
+            if new_name != name:
+                del repo.labels[name]
+                label['name'] = new_name
+                repo.labels[new_name] = label
+        return self.json_response(200, label)
+
+    def contents(self, method: str, repo: RepoState, payload, query: Dict[str, str]) -> Response:
+        if method == 'GET':
+            readme = repo.readme_at(query.get('ref', repo.head))
+            if readme is None:
+                return self.error(404, 'No commit found for the ref')
+            encoded = base64.encodebytes(readme.encode()).decode()
+            return self.json_response(200, {'name': 'README.md', 'path': 'README.md', 'sha': repo.sha(readme),
+                                            'encoding': 'base64', 'content': encoded})
+        if method == 'PUT':
+            if payload.get('sha') != repo.readme_sha:
+                return self.error(409, f"README.md does not match {payload.get('sha')}")
+            readme = base64.b64decode(payload['content']).decode()
+            repo.head = repo.commit(repo.tree(readme), [repo.head], payload.get('message', ''))
+            return self.json_response(200, {'content': {'path': 'README.md', 'sha': repo.readme_sha},
+                                            'commit': {'sha': repo.head, 'message': payload.get('message')}})
+        return self.error(405, 'Method Not Allowed')
+
+    def git(self, method: str, repo: RepoState, rest: List[str], payload) -> Response:
+        if rest[:2] in (['ref', 'heads'], ['refs', 'heads']) and len(rest) == 3:
+            ref = {'ref': f'refs/heads/{rest[2]}', 'object': {'sha': repo.head, 'type': 'commit'}}
+            if method == 'GET':
+                return self.json_response(200, ref)
+            if method == 'PATCH':
+                new_head = payload['sha']
+                if new_head not in repo.commits:
+                    return self.error(422, 'Object does not exist')
+                if not payload.get('force') and not repo.is_ancestor(repo.head, new_head):
+                    return self.error(422, 'Update is not a fast forward')
+                repo.head = new_head
+                ref['object']['sha'] = new_head
+                return self.json_response(200, ref)
+        if rest[0] == 'commits':
+            if method == 'GET' and len(rest) == 2 and rest[1] in repo.commits:
+                commit = repo.commits[rest[1]]
+                return self.json_response(200, {'sha': rest[1], 'tree': {'sha': commit['tree']}, 'message': commit['message'],
+                                                'parents': [{'sha': parent} for parent in commit['parents']]})
+            if method == 'POST' and len(rest) == 1:
+                if payload['tree'] not in repo.trees:
+                    return self.error(422, 'Tree does not exist')
+                commit_sha = repo.commit(payload['tree'], payload.get('parents', []), payload.get('message', ''))
+                return self.json_response(201, {'sha': commit_sha, 'tree': {'sha': payload['tree']}})
+        if rest == ['trees'] and method == 'POST':
+            readme = repo.trees.get(payload.get('base_tree'), '')
+            for entry in payload.get('tree', []):
+                if entry.get('path') == 'README.md':
+                    readme = entry['content']
+            return self.json_response(201, {'sha': repo.tree(readme)})
+        return self.error(404, 'Not Found')
+
+    def graphql(self, payload) -> Response:
+        query = payload.get('query', '')
+        variables = payload.get('variables') or {}
+
+        if 'repository(' in query:
+            repo = self.repo(variables['owner'], variables['name'])
+            labels = list(repo.labels.values())
+            start = int(variables.get('after') or 0)
+            nodes = [{'id': label['node_id'], 'name': label['name']} for label in labels[start:start + 100]]
+            has_next = start + 100 < len(labels)
+            return self.json_response(200, {'data': {'repository': {
+                'id': f'R_{repo.owner}/{repo.name}',
+                'labels': {'nodes': nodes, 'pageInfo': {'hasNextPage': has_next,
+                                                        'endCursor': str(start + 100) if has_next else None}}}}})
+
+        data = {}
+        for alias, issue_input in variables.items():
+            owner, name = issue_input['repositoryId'][2:].split('/', 1)
+            repo = self.repo(owner, name)
+            names = {label['node_id']: label['name'] for label in repo.labels.values()}
+            body = json.dumps({'title': issue_input['title'], 'body': issue_input.get('body', ''),
+                               'labels': [names[node_id] for node_id in issue_input.get('labelIds', []) if node_id in names]})
+            _, _, content = self.issues('POST', repo, [], {}, json.loads(body), urlparse(''))
+            issue = json.loads(content)
+            data[alias] = {'issue': {'number': issue['number'], 'title': issue['title']}}
+        return self.json_response(200, {'data': data})
+
+
+def make_handler(standin: GitHubStandin, latency_ms: float, jitter_ms: float, verbose: bool):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def dispatch(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            body = self.rfile.read(length) if length else b''
+            if latency_ms or jitter_ms:
+                time.sleep(max(0.0, random.gauss(latency_ms, jitter_ms)) / 1000)
+            host = self.headers.get('Host', 'localhost')
+            status, headers, content = standin.handle(self.command, f'http://{host}{self.path}', body, dict(self.headers))
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = dispatch
+
+        def log_message(self, format, *args):
+            if verbose:
+                super().log_message(format, *args)
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a local GitHub API / plaintextsports stand-in.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--issues', type=int, default=53, help='Synthetic issues per repository (default: 53)')
+    parser.add_argument('--players', type=int, default=3, help='Synthetic player labels per repository (default: 3)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Mean injected latency per request')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Standard deviation of injected latency')
+    parser.add_argument('--rate-limit', type=int, default=5000, help='Core rate limit per hour (default: 5000)')
+    parser.add_argument('--secondary-limit', type=int, default=0,
+                        help='Writes allowed per --secondary-window before 403 + Retry-After (default: off)')
+    parser.add_argument('--secondary-window', type=float, default=60.0)
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+
+    def seed(owner: str, name: str) -> RepoState:
+        return RepoState(owner, name, make_issues(args.issues, args.players), make_labels(args.players))
+
+    standin = GitHubStandin(seed, rate_limit=args.rate_limit, secondary_limit=args.secondary_limit,
+                            secondary_window=args.secondary_window)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(standin, args.latency_ms, args.jitter_ms, args.verbose))
+    print(f"⚾ Stand-in listening on http://{args.host}:{args.port} "
+          f"({args.issues} issues, {args.players} players, {args.latency_ms:.0f}±{args.jitter_ms:.0f} ms latency)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
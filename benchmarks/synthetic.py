@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Synthetic GitHub data for the benchmark suite.
+Issues are shaped like real REST payloads (user object, URLs, reactions, body)
+so listing and memory benchmarks see realistic page sizes.
+"""
+
+import random
+from typing import Dict, List
+
+SERIES_LABELS = ['series:wc', 'series:ds', 'series:cs', 'series:ws']
+LEAGUE_LABELS = ['american', 'national']
+
+
+def make_label(label_id: int, name: str) -> Dict:
+    """A label object as returned inside an issue payload."""
+    return {
+        'id': label_id,
+        'node_id': f'LA_{label_id:012d}',
+        'url': f'https://api.github.com/repos/oraweb/world-series-bracket/labels/{name}',
+        'name': name,
+        'color': 'c5def5',
+        'default': False,
+        'description': name
+    }
+
+
+def make_labels(num_players: int) -> List[Dict]:
+    """Series, league and player label objects."""
+    names = SERIES_LABELS + LEAGUE_LABELS + [f'player:p{index:05d}' for index in range(num_players)]
+    return [make_label(index + 1, name) for index, name in enumerate(names)]
+
+
+def make_issues(num_issues: int, num_players: int, seed: int = 2025, picks_per_game: int = 3) -> List[Dict]:
+    """Generate game issues; roughly two thirds are closed and carry player labels."""
+    rng = random.Random(seed)
+    labels = make_labels(num_players)
+    series_labels = labels[:4]
+    league_labels = labels[4:6]
+    player_labels = labels[6:]
+
+    issues = []
+    for number in range(1, num_issues + 1):
+        issue_labels = [rng.choice(series_labels), rng.choice(league_labels)]
+        state = 'closed' if rng.random() < 0.66 else 'open'
+        if player_labels:
+            issue_labels += rng.sample(player_labels, min(len(player_labels), rng.randint(0, picks_per_game)))
+
+        day = 1 + number % 28
+        issues.append({
+            'url': f'https://api.github.com/repos/oraweb/world-series-bracket/issues/{number}',
+            'repository_url': 'https://api.github.com/repos/oraweb/world-series-bracket',
+            'html_url': f'https://github.com/oraweb/world-series-bracket/issues/{number}',
+            'id': 3000000000 + number,
+            'node_id': f'I_{number:016d}',
+            'number': number,
+            'title': f'{issue_labels[0]["name"].split(":")[1].upper()} Game {number % 7 + 1}: 2025-10-{day:02d}/g{number}',
+            'user': {'login': 'github-actions[bot]', 'id': 41898282, 'type': 'Bot', 'site_admin': False,
+                     'avatar_url': 'https://avatars.githubusercontent.com/in/15368?v=4'},
+            'labels': issue_labels,
+            'state': state,
+            'locked': False,
+            'assignees': [],
+            'comments': rng.randint(0, 5),
+            'created_at': f'2025-10-{day:02d}T12:00:00Z',
+            'updated_at': f'2025-10-{day:02d}T{number % 24:02d}:00:00Z',
+            'closed_at': f'2025-10-{day:02d}T23:00:00Z' if state == 'closed' else None,
+            'author_association': 'NONE',
+            'body': 'Game URL: https://plaintextsports.com/mlb/2025-10-17/tor-sea\n\n```\n' + 'TOR   0  0  0  0  1  1  0  0  0    2  7  0\n' * 8 + '```\n',
+            'reactions': {'total_count': 0, '+1': 0, '-1': 0, 'laugh': 0, 'hooray': 0,
+                          'confused': 0, 'heart': 0, 'rocket': 0, 'eyes': 0},
+            'state_reason': 'completed' if state == 'closed' else None
+        })
+    return issues
+
+
+def make_game_states(num_series: int, num_players: int, seed: int = 2025, season: int = 2026):
+    """Game records as score_playoffs.py keeps them, plus current totals, for a bracket in progress.
+
+    Each chosen series has some games played and the rest open and picked;
+    no games are pruned, as right after a series-ending game is closed.
+    """
+    rng = random.Random(seed)
+    players = [f'player:p{index:05d}' for index in range(num_players)]
+    best_of = {'WC': 3, 'DS': 5, 'CS': 7, 'WS': 7}
+    series_keys = ['ALWC-3v6', 'ALWC-4v5', 'NLWC-3v6', 'NLWC-4v5', 'ALDS-1vWC', 'ALDS-2vWC', 'NLDS-1vWC',
+                   'NLDS-2vWC', 'ALCS-DS1vDS2', 'NLCS-DS1vDS2', 'WS-ALvNL']
+    games = []
+    for series in rng.sample(series_keys, min(num_series, len(series_keys))):
+        round_name = series.split('-')[0][-2:]
+        played = rng.randint(0, best_of[round_name] - 1)
+        for game_num in range(1, best_of[round_name] + 1):
+            games.append({
+                'key': f'{season}-{series}-G{game_num}',
+                'status': 'played' if game_num <= played else 'open',
+                'series': f'series:{round_name.lower()}',
+                'players': rng.sample(players, rng.randint(0, min(len(players), 3)))
+            })
+    totals = {player.replace('player:', ''): rng.randint(0, 12) for player in players}
+    return games, totals
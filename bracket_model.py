@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Postseason bracket model for generate_bracket.py.
+The bracket is a tree of best-of-N series: Wild Card winners feed the Division
+Series, Division Series winners the Championship Series and the two pennant
+winners the World Series. Results of played games update each series' wins,
+winners propagate into the next round, and a series that has been decided
+marks its remaining games as no longer possible.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from issue_records import key_season, season_key, slot_key
+
+# Games per series by round
+BEST_OF = {'WC': 3, 'DS': 5, 'CS': 7, 'WS': 7}
+
+# Matchup keys of games crawled from their pages: series, game number, then the page's date and teams
+PAGE_KEY_PATTERN = re.compile(r'^([A-Z]{2,4})-G(\d+)-(\d{4})-\d{2}-\d{2}/')
+
+
+class Slot:
+    """One side of a series: a seeded team or the winner of an earlier series."""
+
+    def __init__(self, placeholder: str, league: Optional[str] = None, seed: Optional[int] = None,
+                 feeder: Optional['Series'] = None):
+        self.placeholder = placeholder
+        self.league = league
+        self.seed = seed
+        self.feeder = feeder
+
+
+class Series:
+    """A best-of-N series and the wins recorded in it."""
+
+    def __init__(self, key: str, round_name: str, slots: Tuple[Slot, Slot]):
+        self.key = key
+        self.round = round_name
+        self.best_of = BEST_OF[round_name]
+        self.slots = slots
+        self.wins: Dict[str, int] = {}
+        self.played = 0
+        self.last_game = 0
+        # Teams seen on this series' own game pages, which beat anything inferred
+        self.observed: List[str] = []
+
+    @property
+    def wins_needed(self) -> int:
+        return self.best_of // 2 + 1
+
+    @property
+    def winner(self) -> Optional[str]:
+        return next((team for team, wins in self.wins.items() if wins >= self.wins_needed), None)
+
+    def record(self, game_num: int, winner: str):
+        """Count game `game_num` as won by `winner`."""
+        self.wins[winner] = self.wins.get(winner, 0) + 1
+        self.played += 1
+        self.last_game = max(self.last_game, game_num)
+
+    def max_game(self) -> int:
+        """Highest game number that can still be played."""
+        # A game whose page was missed still happened, so never go below the last one seen
+        played = max(self.played, self.last_game)
+        if self.winner:
+            return played
+        # Every remaining game goes to whichever team keeps the series alive
+        leading, trailing = (sorted(self.wins.values(), reverse=True) + [0, 0])[:2]
+        return min(played + (self.wins_needed - leading) + (self.wins_needed - trailing) - 1, self.best_of)
+
+    def game_key(self, game_num: int) -> str:
+        return f'{self.key}-G{game_num}'
+
+
+class Bracket:
+    """The twelve-team postseason: 4 Wild Card, 4 Division, 2 Championship series and the World Series."""
+
+    def __init__(self):
+        self.series: Dict[str, Series] = {}
+        # (league, seed) -> team, learned from game pages
+        self.seeds: Dict[Tuple[str, int], str] = {}
+
+        pennants = []
+        for league in ('AL', 'NL'):
+            wild_card = {}
+            for high, low in ((3, 6), (4, 5)):
+                wild_card[high] = self.add(f'{league}WC-{high}v{low}', 'WC',
+                                           Slot(f'{league}{high}', league, high), Slot(f'{league}{low}', league, low))
+            # The 1 seed meets the 4/5 winner and the 2 seed the 3/6 winner
+            division = [
+                self.add(f'{league}DS-{seed}vWC', 'DS', Slot(f'{league}{seed}', league, seed),
+                         Slot(f'{league}WC', feeder=wild_card[4 if seed == 1 else 3]))
+                for seed in (1, 2)
+            ]
+            pennants.append(self.add(f'{league}CS-DS1vDS2', 'CS', Slot(f'{league}DS1', feeder=division[0]),
+                                     Slot(f'{league}DS2', feeder=division[1])))
+        self.add('WS-ALvNL', 'WS', Slot('AL', feeder=pennants[0]), Slot('NL', feeder=pennants[1]))
+
+    def add(self, key: str, round_name: str, first: Slot, second: Slot) -> Series:
+        series = self.series[key] = Series(key, round_name, (first, second))
+        return series
+
+    def series_for(self, matchup_key: str) -> Optional[Series]:
+        """The series a game's matchup key (e.g. '2025-ALDS-1vWC-G3') belongs to."""
+        return self.series.get(slot_key(matchup_key).rsplit('-G', 1)[0])
+
+    def apply(self, games: Iterable[Dict]):
+        """Learn seeds and record results from games keyed by bracket slot.
+
+        Each game needs 'matchup_key', 'series' and 'game_num' and, to count,
+        'teams' as (team, seed) pairs and a 'winner' once it is final.
+        """
+        by_series: Dict[str, List[Dict]] = {}
+        for game_data in games:
+            series = self.series_for(game_data['matchup_key'])
+            if series:
+                by_series.setdefault(series.key, []).append(game_data)
+            # World Series seeds are per league, so they say nothing about which league's seed a team is
+            league = game_data['series'][:2]
+            if league in ('AL', 'NL'):
+                for team, seed in game_data.get('teams', ()):
+                    if seed:
+                        self.seeds.setdefault((league, seed), team)
+
+        for key, series in self.series.items():
+            for game_data in sorted(by_series.get(key, ()), key=lambda game: game['game_num']):
+                for team, _ in game_data.get('teams', ()):
+                    if team not in series.observed:
+                        series.observed.append(team)
+                if game_data.get('winner'):
+                    series.record(game_data['game_num'], game_data['winner'])
+
+    def team(self, slot: Slot) -> Optional[str]:
+        if slot.feeder:
+            return slot.feeder.winner
+        return self.seeds.get((slot.league, slot.seed))
+
+    def teams(self, series: Series) -> Tuple[str, str]:
+        """The series' two teams, falling back to slot placeholders (e.g. 'AL3', 'ALWC') while unknown."""
+        if len(series.observed) == 2:
+            return series.observed[0], series.observed[1]
+        first, second = (self.team(slot) or slot.placeholder for slot in series.slots)
+        return first, second
+
+    def is_possible(self, matchup_key: str) -> bool:
+        """Whether a game can still be played (games of a decided series beyond the last one cannot)."""
+        series = self.series_for(matchup_key)
+        if not series:
+            return True
+        game_num = int(matchup_key.rsplit('-G', 1)[1])
+        return game_num <= series.max_game()
+
+
+def bracket_slot(game_data: Dict) -> Optional[str]:
+    """The generated matchup key a crawled game fills, from its season, series and the teams' seeds."""
+    season = game_data['season']
+    series = game_data['series']
+    game_num = game_data['game_num']
+    seeds = sorted(game_data.get('seeds', []))
+    league = series[:2]
+
+    if series == 'WS':
+        return season_key(season, f'WS-ALvNL-G{game_num}')
+    if series.endswith('CS'):
+        return season_key(season, f'{league}CS-DS1vDS2-G{game_num}')
+    if len(seeds) != 2:
+        return None
+    if series.endswith('WC') and seeds in ([3, 6], [4, 5]):
+        return season_key(season, f'{league}WC-{seeds[0]}v{seeds[1]}-G{game_num}')
+    if series.endswith('DS') and seeds[0] in (1, 2):
+        # The other team is whichever Wild Card winner advanced
+        return season_key(season, f'{league}DS-{seeds[0]}vWC-G{game_num}')
+    return None
+
+
+def placed_key(matchup_key: str) -> Optional[str]:
+    """The bracket slot key of a game: slot keys as they are, crawled page keys through bracket_slot.
+
+    Wild Card and Division Series page keys do not carry the teams' seeds, so
+    those give None.
+    """
+    match = PAGE_KEY_PATTERN.match(slot_key(matchup_key))
+    if not match:
+        return matchup_key
+    series, game_num, year = match.groups()
+    return bracket_slot({'season': key_season(matchup_key) or int(year), 'series': series, 'game_num': int(game_num)})
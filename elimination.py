@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Maximum possible points and elimination for score_playoffs.py.
+Points still to come depend only on how long each unfinished series runs, so
+every series contributes a small table of gains per possible final length.
+A player's maximum takes every series to its longest length. Whether a player
+can still finish first (ties included) is a search over the series' lengths
+for one where nobody else ends up ahead; it runs series by series, memoized
+on the score differences to the players who could still pass them, and drops
+rivals that can no longer pass and branches that can no longer catch one.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from projection import ProjectionModel
+
+
+def series_gains(model: ProjectionModel) -> List:
+    """Per series, a lengths x players array of the points its picked games add at each final length."""
+    gains = []
+    for column, (support, _) in enumerate(model.lengths):
+        rows = model.game_series == column
+        game_nums, weights = model.game_nums[rows], model.weights[rows]
+        # A series with no final length left to play adds nothing
+        gains.append(np.stack([weights[game_nums <= length].sum(axis=0) for length in support or [0]]).astype(np.int64))
+    return gains
+
+
+def can_finish_first(player: int, base, gains: List) -> bool:
+    """Whether some combination of series lengths leaves nobody ahead of `player`."""
+    # How much the player's lead over each rival can still change from each series on
+    swings = [gains_s[:, player:player + 1] - gains_s for gains_s in gains]
+    best = np.zeros((len(gains) + 1, len(base)), dtype=np.int64)
+    worst = np.zeros((len(gains) + 1, len(base)), dtype=np.int64)
+    for index in range(len(gains) - 1, -1, -1):
+        best[index] = best[index + 1] + swings[index].max(axis=0)
+        worst[index] = worst[index + 1] + swings[index].min(axis=0)
+
+    lead = base[player] - base
+    if (lead + best[0] < 0).any():
+        return False
+    # Rivals the player stays level with or ahead of whatever happens do not matter
+    rivals = np.flatnonzero(lead + worst[0] < 0)
+    if not len(rivals):
+        return True
+
+    @lru_cache(maxsize=None)
+    def search(index: int, leads: tuple) -> bool:
+        if index == len(gains):
+            return True
+        rival_ids = rivals[[i for i, value in enumerate(leads) if value is not None]]
+        for row in np.argsort(-swings[index][:, player]):
+            after = [None if value is None else value + int(swings[index][row, rivals[i]])
+                     for i, value in enumerate(leads)]
+            values = np.array([value for value in after if value is not None], dtype=np.int64)
+            if (values + best[index + 1][rival_ids] < 0).any():
+                continue
+            # A rival the player now leads by more than they can lose is settled
+            settled = values + worst[index + 1][rival_ids] >= 0
+            next_leads, position = [], 0
+            for value in after:
+                if value is None:
+                    next_leads.append(None)
+                    continue
+                next_leads.append(None if settled[position] else value)
+                position += 1
+            if search(index + 1, tuple(next_leads)):
+                return True
+        return False
+
+    return search(0, tuple(int(value) for value in lead[rivals]))
+
+
+def outlook(games: Iterable[Dict], totals: Dict[str, int], series_points: Dict[str, int]) -> Dict[str, Dict]:
+    """Each player's maximum possible points and whether they can no longer finish first.
+
+    `games` and `totals` are what `projection.project` takes. Raises
+    UnplacedGames when an open picked game cannot be placed in the bracket.
+    """
+    if np is None:
+        raise RuntimeError('the elimination calculator needs numpy')
+    model = ProjectionModel(games, totals, series_points)
+    base = model.base.astype(np.int64)
+    gains = series_gains(model)
+    maximum = base + sum((gains_s.max(axis=0) for gains_s in gains), np.zeros(len(base), dtype=np.int64))
+    minimum = base + sum((gains_s.min(axis=0) for gains_s in gains), np.zeros(len(base), dtype=np.int64))
+    # Nobody can catch a player who finishes ahead of them for sure
+    floor = minimum.max(initial=0)
+
+    players = {}
+    for index, name in enumerate(model.players):
+        eliminated = maximum[index] < floor or not can_finish_first(index, base, gains)
+        players[name] = {'max': int(maximum[index]), 'eliminated': bool(eliminated)}
+    return players
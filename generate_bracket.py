@@ -5,16 +5,37 @@ Generate World Series bracket by crawling plaintextsports.com and creating GitHu
 
 import os
 import sys
-import requests
+import time
+import argparse
+import threading
 import re
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import partial
 from html import unescape
-from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from typing import Dict, Iterator, List, Tuple, Optional
+from urllib.parse import parse_qs, urlparse
+
+from http_cache import HttpCache
+from issue_records import (IssueRecord, content_hash, content_hash_marker, matchup_marker, parse_content_hash,
+                           key_season, records_from_page, season_key)
+from bracket_model import Bracket, bracket_slot
+from matchup_index import MatchupIndex
+from page_cache import PageCache
+from pagination import PAGE_WORKERS, iter_issues
+from rate_limit import RequestScheduler
+from readme_publisher import ReadmePublisher, get_section, set_section
+from run_metrics import RunMetrics
+from tenants import REPO_WORKERS, bind_repository, current_repository, run_for_repositories
+from transport import GITHUB_API_URL, PLAINTEXTSPORTS_URL, create_session
 
 GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
 REPO_OWNER = 'oraweb'
 REPO_NAME = 'world-series-bracket'
-BASE_URL = f'https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}'
+REPO = f'{REPO_OWNER}/{REPO_NAME}'
 
 HEADERS = {
     'Authorization': f'token {GITHUB_TOKEN}',
@@ -29,71 +50,184 @@ SERIES_CONFIG = {
     'WS': {'rounds': 7, 'label': 'series:ws', 'name': 'World Series'}
 }
 
+# Game page parsing
+SERIES_GAME_PATTERN = re.compile(r'(ALWC|NLWC|ALDS|NLDS|ALCS|NLCS|WS|World Series)\s*Game\s*(\d+)', re.IGNORECASE)
+SEED_PATTERN = re.compile(r'<div>(\d+) [^<]*<br>')
+GAME_STATUS_PATTERN = re.compile(r'(?:ALWC|NLWC|ALDS|NLDS|ALCS|NLCS|WS|World Series)\s*Game\s*\d+<b>([^<]*)</b>', re.IGNORECASE)
+LINE_SCORE_PATTERN = re.compile(r'<pre>(.*?)</pre>', re.DOTALL)
+START_TIME_PATTERN = re.compile(r'^([A-Z][a-z]{2} \d{1,2}, \d{1,2}:\d{2} [AP]M) ET$')
+BODY_PATTERN = re.compile(r'<body>(.*?)</body>', re.DOTALL)
+SCRIPT_STYLE_PATTERN = re.compile(r'<script[^>]*>.*?</script>|<style[^>]*>.*?</style>', re.DOTALL)
+LINK_PATTERN = re.compile(r'<a[^>]*href="([^"]*)"[^>]*>([^<]*)</a>')
+HTML_TOKEN_PATTERN = re.compile(r'<a href="([^"]*)">([^<]*)</a>|<a href=\'([^\']*)\'>([^<]*)</a>|<br\s*/?>|</div>|</p>|[<>]')
+TAG_BRACKET_PATTERN = re.compile(r'([<>])')
+# Bracket section written before README sections were marked
+LEGACY_BRACKET_PATTERN = re.compile(r'## 🏆 \d{4} MLB Postseason Bracket\n.*?\n---\n+', re.DOTALL)
+SKIP_LINK_TEXT = ['dark mode', 'light mode', 'all sports', 'twitter', 'instagram', 'twitch']
+SKIP_LINE_PATTERNS = ['all sports', 'dark mode', 'light mode', 'plaintextsports.com',
+                      'twitter', 'instagram', 'twitch', 'mobile app', 'page loaded',
+                      'data loaded', 'built by']
+
+GRAPHQL_URL = f'{GITHUB_API_URL}/graphql'
+GRAPHQL_BATCH_SIZE = int(os.environ.get('GRAPHQL_BATCH_SIZE', '20'))
+
+# Crawler configuration
+CRAWL_WORKERS = int(os.environ.get('CRAWL_WORKERS', '8'))
+HOST_CONCURRENCY = int(os.environ.get('HOST_CONCURRENCY', '4'))
+HOST_MIN_INTERVAL = float(os.environ.get('HOST_MIN_INTERVAL', '0.1'))
+# Seasons crawled in parallel processes during a backfill
+SEASON_WORKERS = int(os.environ.get('SEASON_WORKERS', '4'))
+
+# Shared session so every request reuses pooled keep-alive connections
+SESSION = create_session(pool_maxsize=CRAWL_WORKERS)
+
+# GitHub requests are paced and retried on rate limits
+SCHEDULER = RequestScheduler(SESSION)
+
+METRICS = RunMetrics('generate_bracket')
+METRICS.instrument(SESSION, SCHEDULER)
+
+# Conditional-request cache for GitHub listings (enabled when HTTP_CACHE_DIR is set)
+HTTP_CACHE = HttpCache(os.environ.get('HTTP_CACHE_DIR'))
+
+# plaintextsports.com pages, kept on disk between runs when PAGE_CACHE_DIR is set
+PAGE_CACHE = PageCache(os.environ.get('PAGE_CACHE_DIR'))
+# Seconds a page stays fresh by game state (final game pages are kept forever)
+PAGE_TTL_LIVE = float(os.environ.get('PAGE_TTL_LIVE', '30'))
+PAGE_TTL_SCHEDULED = float(os.environ.get('PAGE_TTL_SCHEDULED', '10800'))
+PAGE_TTL_DEFAULT = float(os.environ.get('PAGE_TTL_DEFAULT', '3600'))
+
+# Watch mode: poll intervals (seconds) while games are live, around first pitch and when nothing is on
+WATCH_LIVE_INTERVAL = float(os.environ.get('WATCH_LIVE_INTERVAL', '60'))
+WATCH_PREGAME_INTERVAL = float(os.environ.get('WATCH_PREGAME_INTERVAL', '300'))
+WATCH_IDLE_INTERVAL = float(os.environ.get('WATCH_IDLE_INTERVAL', '10800'))
+# How long before first pitch a scheduled game starts being polled
+WATCH_PREGAME_WINDOW = float(os.environ.get('WATCH_PREGAME_WINDOW', '1800'))
+
+# Game dates and start times on plaintextsports.com are US Eastern
+EASTERN = ZoneInfo('America/New_York')
+
 # Statistics tracking
 stats = {
     'api_calls': 0,
     'games_found': 0,
     'games_created': 0,
+    'games_updated': 0,
     'games_skipped': 0,
+    'games_pruned': 0,
     'errors': 0
 }
 
+# Per-repository counters in multi-tenant runs
+repo_stats: Dict[str, Dict[str, int]] = {}
+
+_stats_lock = threading.Lock()
+_log_lock = threading.Lock()
+
+# Per-host politeness state
+_host_lock = threading.Lock()
+_host_slots: Dict[str, threading.Semaphore] = {}
+_host_next_request: Dict[str, float] = {}
+
 
 def log(message: str, level: str = 'INFO'):
     """Log a message with timestamp."""
     timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
-    print(f"[{timestamp}] [{level}] {message}")
+    with _log_lock:
+        print(f"[{timestamp}] [{level}] {message}")
+
+
+def increment_stat(key: str, amount: int = 1) -> int:
+    """Increment a statistics counter and return its new value."""
+    with _stats_lock:
+        stats[key] += amount
+        repo = current_repository()
+        if repo in repo_stats:
+            repo_stats[repo][key] += amount
+        return stats[key]
+
+
+def count_api_call() -> int:
+    """Count an API call and return its sequence number."""
+    return increment_stat('api_calls')
+
+
+@contextmanager
+def host_slot(url: str):
+    """Limit concurrent requests per host and space them at least HOST_MIN_INTERVAL apart."""
+    host = urlparse(url).netloc
+    with _host_lock:
+        slot = _host_slots.setdefault(host, threading.Semaphore(HOST_CONCURRENCY))
+    with slot:
+        with _host_lock:
+            now = time.monotonic()
+            start = max(now, _host_next_request.get(host, now))
+            _host_next_request[host] = start + HOST_MIN_INTERVAL
+        if start > now:
+            time.sleep(start - now)
+        yield
+
+
+def page_ttl(url: str, html: str) -> Optional[float]:
+    """How long a fetched page stays fresh, from the state of the game on it."""
+    date_match = re.search(r'/mlb/(\d{4})-\d{2}-\d{2}/', url)
+    state, starts_at = parse_game_state(html, int(date_match.group(1)) if date_match else None)
+    if state == 'final':
+        return None
+    if state == 'live':
+        return PAGE_TTL_LIVE
+    if state == 'scheduled':
+        # A scheduled game's page changes at first pitch at the latest
+        if starts_at:
+            until_start = (starts_at - datetime.now(EASTERN)).total_seconds()
+            return min(PAGE_TTL_SCHEDULED, max(until_start, PAGE_TTL_LIVE))
+        return PAGE_TTL_SCHEDULED
+    return PAGE_TTL_DEFAULT
 
 
 def fetch_url(url: str, timeout: int = 10) -> Optional[str]:
-    """Fetch a URL and return the content."""
-    stats['api_calls'] += 1
-    log(f"API Call #{stats['api_calls']}: {url}")
+    """Fetch a URL and return the content, from the page cache while it is fresh."""
+    def fetch(headers: Dict[str, str]):
+        call_number = count_api_call()
+        log(f"API Call #{call_number}: {url}")
+        with host_slot(url):
+            return SESSION.get(url, headers=headers, timeout=timeout)
+    
     try:
-        response = requests.get(url, timeout=timeout)
-        response.raise_for_status()
-        return response.text
+        return PAGE_CACHE.get(url, fetch, page_ttl)
     except Exception as e:
         log(f"Error fetching {url}: {e}", 'ERROR')
-        stats['errors'] += 1
+        increment_stat('errors')
         return None
 
 
-def get_existing_issues() -> Dict[str, dict]:
-    """Fetch all existing issues from the repository."""
-    log("Checking existing issues...")
-    issues = {}
-    page = 1
-    
-    while True:
-        url = f"{BASE_URL}/issues?state=all&per_page=100&page={page}"
-        stats['api_calls'] += 1
-        log(f"API Call #{stats['api_calls']}: Fetching issues page {page}")
-        
-        try:
-            response = requests.get(url, headers=HEADERS)
-            response.raise_for_status()
-            page_issues = response.json()
-            
-            if not page_issues:
-                break
-            
-            for issue in page_issues:
-                issues[issue['title']] = issue
-            
-            page += 1
-        except Exception as e:
-            log(f"Error fetching issues: {e}", 'ERROR')
-            stats['errors'] += 1
-            break
-    
-    log(f"Found {len(issues)} existing issue(s)")
-    return issues
+def repo_url(repo: str) -> str:
+    """REST API base URL for an owner/name repository."""
+    return f'{GITHUB_API_URL}/repos/{repo}'
+
+
+def fetch_issues_page(url: str):
+    """GET one page of an issue listing."""
+    page = parse_qs(urlparse(url).query).get('page', ['1'])[0]
+    call_number = count_api_call()
+    log(f"API Call #{call_number}: Fetching issues page {page}")
+    response = HTTP_CACHE.get(SCHEDULER, url, headers=HEADERS)
+    response.raise_for_status()
+    return response
+
+
+def iter_existing_issues(repo: str = REPO, page_workers: int = PAGE_WORKERS,
+                         since: Optional[str] = None) -> Iterator[IssueRecord]:
+    """Stream the repository's existing issues as compact records, optionally only those updated since a timestamp."""
+    since_param = f"&since={since}" if since else ""
+    url = f"{repo_url(repo)}/issues?state=all&per_page=100{since_param}"
+    # Pages are prefetched on another thread, which must count against this repository
+    return iter_issues(bind_repository(fetch_issues_page), url, workers=page_workers)
 
 
 def parse_series_from_text(text: str) -> Optional[Tuple[str, int]]:
     """Parse series information from text (e.g., 'ALCS Game 5' -> ('ALCS', 5))."""
-    match = re.search(r'(ALWC|NLWC|ALDS|NLDS|ALCS|NLCS|WS|World Series)\s*Game\s*(\d+)', text, re.IGNORECASE)
+    match = SERIES_GAME_PATTERN.search(text)
     if match:
         series = match.group(1).upper()
         if 'WORLD' in series:
@@ -126,83 +260,194 @@ def get_league_label(series: str) -> str:
     return None
 
 
-def extract_game_content(html: str) -> str:
-    """Extract the game content from the HTML body."""
-    # Extract body content
-    body_match = re.search(r'<body>(.*?)</body>', html, re.DOTALL)
-    if not body_match:
-        return ""
+class _GameContentExtractor:
+    """Single-pass state machine that turns a game page body into the captured game section.
     
-    body = body_match.group(1)
-    
-    # Remove script and style tags
-    body = re.sub(r'<script[^>]*>.*?</script>', '', body, flags=re.DOTALL)
-    body = re.sub(r'<style[^>]*>.*?</style>', '', body, flags=re.DOTALL)
-    
-    # Replace HTML entities
-    body = unescape(body)
-    
-    # Keep links by replacing them with markdown format
-    # Extract links before removing tags
-    links = re.findall(r'<a[^>]*href="([^"]*)"[^>]*>([^<]*)</a>', body)
-    for href, text in links:
-        if text.strip() and not any(skip in text.lower() for skip in ['dark mode', 'light mode', 'all sports', 'twitter', 'instagram', 'twitch']):
-            # Convert to full URL if relative
-            if href.startswith('/'):
-                href = f'https://plaintextsports.com{href}'
-            body = body.replace(f'<a href="{href}">{text}</a>', f'[{text}]({href})')
-            body = body.replace(f"<a href='{href}'>{text}</a>", f'[{text}]({href})')
-    
-    # Convert line breaks
-    body = re.sub(r'<br\s*/?>', '\n', body)
-    body = re.sub(r'</div>', '\n', body)
-    body = re.sub(r'</p>', '\n\n', body)
-    body = re.sub(r'<[^>]+>', '', body)
-    
-    # Clean up whitespace while preserving structure
-    lines = []
-    skip_patterns = ['all sports', 'dark mode', 'light mode', 'plaintextsports.com', 
-                     'twitter', 'instagram', 'twitch', 'mobile app', 'page loaded', 
-                     'data loaded', 'built by']
-    
-    for line in body.split('\n'):
-        stripped = line.strip()
-        if stripped:
-            # Skip navigation and metadata elements
-            if any(skip in stripped.lower() for skip in skip_patterns):
-                continue
-            lines.append(stripped)
+    Emulates the original cascade exactly: links become markdown, <br>, </div> and </p>
+    become line breaks, remaining tags are stripped, navigation lines are dropped, and the
+    lines around the "<series> Game N" header are captured until the game time.
+    """
     
-    # Find the game information section
-    content = []
-    found_series = False
-    capture_lines = 0
+    def __init__(self, link_pairs):
+        self.link_pairs = link_pairs
+        self.in_tag = False
+        self.tag_buffer = []
+        self.partial_line = []
+        self.previous_lines = []
+        self.content = []
+        self.found_series = False
+        self.capture_lines = 0
+        self.done = False
     
-    for i, line in enumerate(lines):
+    def feed_text(self, text: str):
+        if self.in_tag:
+            self.tag_buffer.append(text)
+            return
+        
+        # Complete lines are processed as soon as their line break arrives
+        pieces = text.split('\n')
+        if len(pieces) == 1:
+            self.partial_line.append(text)
+            return
+        
+        self.partial_line.append(pieces[0])
+        self.finish_line(''.join(self.partial_line))
+        for piece in pieces[1:-1]:
+            if self.done:
+                return
+            self.finish_line(piece)
+        self.partial_line = [pieces[-1]]
+    
+    def feed_open(self):
+        if self.in_tag:
+            self.tag_buffer.append('<')
+        else:
+            self.in_tag = True
+            self.tag_buffer = []
+    
+    def feed_close(self):
+        if not self.in_tag:
+            self.feed_text('>')
+            return
+        
+        self.in_tag = False
+        if not any(self.tag_buffer):
+            # "<>" is not a tag, both characters are kept
+            self.feed_text('<>')
+    
+    def feed_markup(self, text: str):
+        """Feed generated text that may itself contain angle brackets."""
+        for piece in TAG_BRACKET_PATTERN.split(text):
+            if piece == '<':
+                self.feed_open()
+            elif piece == '>':
+                self.feed_close()
+            elif piece:
+                self.feed_text(piece)
+    
+    def finish_line(self, line: str):
+        stripped = line.strip()
+        if not stripped:
+            return
+        
+        # Skip navigation and metadata elements
+        lowered = stripped.lower()
+        if any(skip in lowered for skip in SKIP_LINE_PATTERNS):
+            return
+        
         # Look for series information (e.g., "ALCS Game 5")
-        if re.search(r'(ALWC|NLWC|ALDS|NLDS|ALCS|NLCS|WS|World Series)\s*Game\s*\d+', line, re.IGNORECASE):
-            found_series = True
+        if SERIES_GAME_PATTERN.search(stripped):
+            self.found_series = True
             # Go back to capture team info
-            start_idx = max(0, i - 2)
-            for idx in range(start_idx, i):
-                if lines[idx] not in content:
-                    content.append(lines[idx])
+            for previous in self.previous_lines:
+                if previous not in self.content:
+                    self.content.append(previous)
         
-        if found_series:
-            content.append(line)
-            capture_lines += 1
+        if self.found_series:
+            self.content.append(stripped)
+            self.capture_lines += 1
             
             # Stop after we get the game time (around 10-15 lines)
-            if 'Game Time' in line or capture_lines > 15:
+            if 'Game Time' in stripped or self.capture_lines > 15:
+                self.done = True
+        
+        self.previous_lines = (self.previous_lines + [stripped])[-2:]
+    
+    def finish(self) -> str:
+        if not self.done:
+            if self.in_tag:
+                # An unterminated "<" is literal text
+                self.in_tag = False
+                buffered = ''.join(self.tag_buffer)
+                self.feed_text('<')
+                self.feed_text(buffered)
+            if not self.done:
+                self.finish_line(''.join(self.partial_line))
+        return '\n'.join(self.content)
+    
+    def run(self, text: str) -> str:
+        pos = 0
+        search = HTML_TOKEN_PATTERN.search
+        
+        while not self.done:
+            match = search(text, pos)
+            if not match:
+                if pos < len(text):
+                    self.feed_text(text[pos:])
                 break
+            
+            if match.start() > pos:
+                self.feed_text(text[pos:match.start()])
+                if self.done:
+                    break
+            
+            token = match.group(0)
+            pos = match.end()
+            
+            if token == '<':
+                self.feed_open()
+            elif token == '>':
+                self.feed_close()
+            elif token[1] == 'a':
+                if token[8] == '"':
+                    href, link_text = match.group(1), match.group(2)
+                    convert = not href.startswith('/') and is_content_link(link_text)
+                else:
+                    href, link_text = match.group(3), match.group(4)
+                    convert = (href, link_text) in self.link_pairs()
+                
+                if convert:
+                    self.feed_markup(f'[{link_text}]({href})')
+                else:
+                    # Not converted: strip the anchor's tags like any other markup
+                    self.feed_open()
+                    pos = match.start() + 1
+            elif token == '</p>':
+                self.feed_text('\n\n')
+            else:
+                # <br>, <br/> and </div>
+                self.feed_text('\n')
+        
+        return self.finish()
+
+
+def is_content_link(text: str) -> bool:
+    """Whether a link's text should be kept as a markdown link."""
+    return bool(text.strip()) and not any(skip in text.lower() for skip in SKIP_LINK_TEXT)
+
+
+def extract_game_content(html: str) -> str:
+    """Extract the game content from the HTML body."""
+    # Extract body content
+    body_match = BODY_PATTERN.search(html)
+    if not body_match:
+        return ""
     
-    return '\n'.join(content)
+    # Remove script and style tags, then replace HTML entities
+    body = unescape(SCRIPT_STYLE_PATTERN.sub('', body_match.group(1)))
+    
+    link_pairs_cache = []
+    
+    def link_pairs():
+        # Single-quoted anchors are only converted when a double-quoted anchor with the same
+        # (absolute) href and text exists, so those pairs are collected lazily.
+        if not link_pairs_cache:
+            pairs = set()
+            for href, text in LINK_PATTERN.findall(body):
+                if is_content_link(text):
+                    if href.startswith('/'):
+                        href = f'https://plaintextsports.com{href}'
+                    pairs.add((href, text))
+            link_pairs_cache.append(pairs)
+        return link_pairs_cache[0]
+    
+    return _GameContentExtractor(link_pairs).run(body)
 
 
 def parse_schedule_for_games(year: int) -> Dict[str, str]:
     """Parse the schedule page to find playoff games and return a mapping of game keys to URLs."""
     log(f"Fetching schedule for year {year}")
-    schedule_url = f'https://plaintextsports.com/mlb/{year}/schedule'
+    schedule_url = f'{PLAINTEXTSPORTS_URL}/mlb/{year}/schedule'
     html = fetch_url(schedule_url)
     
     game_url_map = {}
@@ -220,11 +465,8 @@ def parse_schedule_for_games(year: int) -> Dict[str, str]:
                 year_month = date_match.group(1)
                 # Only include October games (month 10)
                 if year_month.endswith('-10') and link not in seen:
-                    # Extract teams from link for mapping
-                    teams_match = re.search(r'/([^/]+)$', link)
-                    if teams_match:
-                        teams = teams_match.group(1)
-                        game_url_map[teams] = link
+                    # Key by date and teams: the same teams meet several times in a series
+                    game_url_map[link.split('/mlb/', 1)[1]] = link
                     seen.add(link)
         
         log(f"Found {len(game_url_map)} actual playoff game(s) from schedule")
@@ -253,7 +495,8 @@ def generate_all_playoff_games(year: int) -> List[Dict]:
                 'game_num': game_num,
                 'team1': f'{league}{seed1}',
                 'team2': f'{league}{seed2}',
-                'matchup_key': f'{league}WC-{seed1}v{seed2}-G{game_num}',
+                'matchup_key': season_key(year, f'{league}WC-{seed1}v{seed2}-G{game_num}'),
+                'season': year,
                 'is_generated': True
             })
     
@@ -273,7 +516,8 @@ def generate_all_playoff_games(year: int) -> List[Dict]:
                 'game_num': game_num,
                 'team1': f'{league}{seed1}',
                 'team2': f'{league}{seed2}',
-                'matchup_key': f'{league}DS-{seed1}v{seed2}-G{game_num}',
+                'matchup_key': season_key(year, f'{league}DS-{seed1}v{seed2}-G{game_num}'),
+                'season': year,
                 'is_generated': True
             })
     
@@ -290,7 +534,8 @@ def generate_all_playoff_games(year: int) -> List[Dict]:
                 'game_num': game_num,
                 'team1': f'{league}{seed1}',
                 'team2': f'{league}{seed2}',
-                'matchup_key': f'{league}CS-{seed1}v{seed2}-G{game_num}',
+                'matchup_key': season_key(year, f'{league}CS-{seed1}v{seed2}-G{game_num}'),
+                'season': year,
                 'is_generated': True
             })
     
@@ -301,7 +546,8 @@ def generate_all_playoff_games(year: int) -> List[Dict]:
             'game_num': game_num,
             'team1': 'AL',
             'team2': 'NL',
-            'matchup_key': f'WS-ALvNL-G{game_num}',
+            'matchup_key': season_key(year, f'WS-ALvNL-G{game_num}'),
+            'season': year,
             'is_generated': True
         })
     
@@ -314,33 +560,129 @@ def generate_all_playoff_games(year: int) -> List[Dict]:
 
 
 
-def fetch_game_data_for_generated_game(game_info: Dict, game_url_map: Dict[str, str]) -> Dict:
-    """Fetch actual game data if available, otherwise create placeholder."""
+def slot_game(game_data: Dict, matchup_index: MatchupIndex) -> Dict:
+    """Key a crawled game by the bracket slot it fills, as placeholder runs do.
+
+    A game whose issue was already created under its page key keeps that key.
+    """
+    slot = bracket_slot(game_data) if 'path' in game_data else None
+    if slot and (slot in matchup_index or game_data['matchup_key'] not in matchup_index):
+        return {**game_data, 'matchup_key': slot}
+    return game_data
+
+
+def match_schedule_games(game_url_map: Dict[str, str], year: int, max_workers: int = CRAWL_WORKERS) -> Dict[str, Dict]:
+    """Crawl the schedule's game pages and key the season's games by the generated matchup they fill."""
+    real_games = {}
+    for game_data in crawl_game_pages(sorted(set(game_url_map.values())), max_workers=max_workers):
+        # The schedule can list a neighbouring season's games; they must not decide this bracket
+        if game_data['season'] != year:
+            continue
+        slot = bracket_slot(game_data)
+        if slot:
+            real_games[slot] = game_data
+    log(f"Matched {len(real_games)} scheduled game(s) to bracket slots")
+    return real_games
+
+
+def build_bracket(real_games: Dict[str, Dict]) -> Bracket:
+    """Build the bracket from the scheduled games matched to bracket slots."""
+    bracket = Bracket()
+    bracket.apply(real_games.values())
+    decided = [f"{key} ({series.winner})" for key, series in bracket.series.items() if series.winner]
+    if decided:
+        log(f"Series decided: {', '.join(decided)}")
+    return bracket
+
+
+def fetch_game_data_for_generated_game(game_info: Dict, real_games: Dict[str, Dict],
+                                       bracket: Optional[Bracket] = None) -> Dict:
+    """Use the matched game's real data if it has been scheduled, otherwise create a placeholder.
+
+    Placeholders take the teams the bracket knows so far, and games of a
+    series that is already decided are marked as not needed.
+    """
     series = game_info['series']
     game_num = game_info['game_num']
     
-    # Check if we have a real game URL for this matchup
-    # This is a best-effort match - we won't have exact matches for generated games
+    # Keep the generated key so the placeholder's issue is updated rather than a new one created
+    real_game = real_games.get(game_info['matchup_key'])
+    if real_game:
+        return {**real_game, 'matchup_key': game_info['matchup_key']}
+    
+    team1, team2 = game_info['team1'], game_info['team2']
+    series_node = bracket.series_for(game_info['matchup_key']) if bracket else None
+    if series_node:
+        team1, team2 = bracket.teams(series_node)
+    
     game_data = {
         'series': series,
         'game_num': game_num,
-        'team1': game_info['team1'],
-        'team2': game_info['team2'],
+        'team1': team1,
+        'team2': team2,
         'matchup_key': game_info['matchup_key'],
+        'season': game_info['season'],
         'placeholder': True,
-        'content': f"Placeholder for {series} Game {game_num}\nTeams: {game_info['team1']} vs {game_info['team2']}\n\nThis game will be updated with actual data when played."
+        'content': f"Placeholder for {series} Game {game_num}\nTeams: {team1} vs {team2}\n\nThis game will be updated with actual data when played."
     }
+    if bracket and not bracket.is_possible(game_info['matchup_key']):
+        game_data['not_needed'] = True
     
     return game_data
 
 
+def parse_game_state(html: str, year: Optional[int] = None) -> Tuple[str, Optional[datetime]]:
+    """Read a page's game status: ('final' | 'scheduled' | 'postponed' | 'live' | 'page', first pitch if scheduled).
+
+    Pages without a game status (the schedule, the front page) are 'page'.
+    """
+    match = GAME_STATUS_PATTERN.search(html)
+    if not match:
+        return 'page', None
+    status = unescape(match.group(1)).strip()
+    if status.startswith('Final'):
+        return 'final', None
+    start = START_TIME_PATTERN.match(status)
+    if start:
+        if year is None:
+            return 'scheduled', None
+        starts_at = datetime.strptime(f"{year} {start.group(1)}", '%Y %b %d, %I:%M %p').replace(tzinfo=EASTERN)
+        return 'scheduled', starts_at
+    if not status or status.startswith(('Postponed', 'Cancelled', 'Canceled', 'Suspended')):
+        return 'postponed', None
+    # Innings ("Top 5th"), "Delayed" and the like
+    return 'live', None
+
+
+def parse_game_winner(html: str, teams: List[str]) -> Optional[str]:
+    """The winning team of a final game, from the runs column of its line score."""
+    if parse_game_state(html)[0] != 'final':
+        return None
+    runs = {}
+    match = LINE_SCORE_PATTERN.search(html)
+    for line in (match.group(1) if match else '').splitlines():
+        # TEAM  innings...  R  H  E
+        parts = line.split()
+        if len(parts) >= 4 and parts[0] in teams and parts[-3].isdigit():
+            runs[parts[0]] = int(parts[-3])
+    if len(runs) != 2 or len(set(runs.values())) != 2:
+        return None
+    return max(runs, key=runs.get)
+
+
 def fetch_game_data(game_path: str) -> Optional[Dict]:
     """Fetch and parse game data from a game URL."""
-    game_url = f'https://plaintextsports.com{game_path}'
-    html = fetch_url(game_url)
+    html = fetch_url(f'{PLAINTEXTSPORTS_URL}{game_path}')
     
     if not html:
         return None
+    with METRICS.span('parse'):
+        return parse_game_page(game_path, html)
+
+
+def parse_game_page(game_path: str, html: str) -> Optional[Dict]:
+    """Parse game data from a game page."""
+    game_url = f'{PLAINTEXTSPORTS_URL}{game_path}'
     
     # Parse series information
     series_info = parse_series_from_text(html)
@@ -355,6 +697,11 @@ def fetch_game_data(game_path: str) -> Optional[Dict]:
     
     # Determine if game is a placeholder (no content means future game)
     is_placeholder = not content or len(content) < 100
+    seeds = [int(seed) for seed in SEED_PATTERN.findall(html)]
+    # Teams in page order (away, home), as in the path
+    abbreviations = [team.upper() for team in game_path.rsplit('/', 1)[-1].split('-')]
+    if len(seeds) != len(abbreviations):
+        seeds = [None] * len(abbreviations)
     
     if is_placeholder:
         log(f"Game {game_path} appears to be a future game (placeholder)")
@@ -363,14 +710,107 @@ def fetch_game_data(game_path: str) -> Optional[Dict]:
         teams = teams_match.group(1) if teams_match else "TBD"
         content = f"Game not yet played. Teams: {teams}"
     
-    return {
+    season = int(game_path.split('/mlb/', 1)[-1][:4])
+    game_data = {
         'path': game_path,
         'series': series,
         'game_num': game_num,
         'content': content,
         'url': game_url,
+        'matchup_key': season_key(season, f"{series}-G{game_num}-{game_path.split('/mlb/', 1)[-1]}"),
+        'season': season,
+        'seeds': [seed for seed in seeds if seed],
+        'teams': list(zip(abbreviations, seeds)),
+        'winner': parse_game_winner(html, abbreviations),
         'placeholder': is_placeholder
     }
+    
+    if is_placeholder:
+        team1, _, team2 = teams.partition('-')
+        game_data['team1'] = team1.upper()
+        game_data['team2'] = (team2 or 'TBD').upper()
+    
+    return game_data
+
+
+def crawl_game_pages(game_paths: List[str], max_workers: int = CRAWL_WORKERS) -> List[Dict]:
+    """Fetch and parse game pages concurrently, returning game data in input order."""
+    log(f"Crawling {len(game_paths)} game page(s) with {max_workers} worker(s)...")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = [game_data for game_data in executor.map(fetch_game_data, game_paths) if game_data]
+    log(f"Crawled {len(results)} game(s) with series information")
+    return results
+
+
+def parse_year_range(value: str) -> List[int]:
+    """Parse a year list such as '2019-2024' or '2016,2018,2020-2022'."""
+    years = set()
+    for part in value.split(','):
+        start, _, end = part.strip().partition('-')
+        try:
+            first, last = int(start), int(end or start)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid year range '{value}'")
+        if first > last:
+            raise argparse.ArgumentTypeError(f"invalid year range '{value}'")
+        years.update(range(first, last + 1))
+    return sorted(years)
+
+
+def crawl_season(year: int, workers: int = CRAWL_WORKERS) -> Dict:
+    """Crawl one season's schedule and game pages (runs in a backfill worker process)."""
+    before = {key: stats[key] for key in ('api_calls', 'errors')}
+    cache_before = PAGE_CACHE.counts()
+    metrics_before = METRICS.snapshot()
+    game_url_map = parse_schedule_for_games(year)
+    games = crawl_game_pages(sorted(set(game_url_map.values())), max_workers=workers)
+    return {
+        'year': year,
+        'games': games,
+        'api_calls': stats['api_calls'] - before['api_calls'],
+        'errors': stats['errors'] - before['errors'],
+        'page_cache': {key: count - cache_before[key] for key, count in PAGE_CACHE.counts().items()},
+        'metrics': METRICS.delta(metrics_before)
+    }
+
+
+def backfill_seasons(years: List[int], season_workers: int = SEASON_WORKERS,
+                     workers: int = CRAWL_WORKERS) -> List[Dict]:
+    """Crawl several seasons in a process pool and return their games ordered by year.
+
+    Workers only read plaintextsports.com; every GitHub write stays in this
+    process so it goes through the one rate-limited SCHEDULER.
+    """
+    season_workers = max(1, min(season_workers, len(years)))
+    # Split the page-fetch budget so the pool as a whole stays within --workers
+    crawl = partial(crawl_season, workers=max(1, workers // season_workers))
+    log(f"Backfilling {len(years)} season(s) with {season_workers} process(es)...")
+
+    seasons = []
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=season_workers, mp_context=context) as executor:
+        futures = {executor.submit(crawl, year): year for year in years}
+        for future in as_completed(futures):
+            try:
+                season = future.result()
+            except Exception as e:
+                log(f"Season {futures[future]} failed: {e}", 'ERROR')
+                increment_stat('errors')
+                continue
+            increment_stat('api_calls', season['api_calls'])
+            increment_stat('errors', season['errors'])
+            PAGE_CACHE.add_counts(season['page_cache'])
+            METRICS.merge(season['metrics'])
+            log(f"Season {season['year']}: {len(season['games'])} game(s)")
+            seasons.append(season)
+
+    # A schedule page can list games from a neighbouring season, so keep each path once
+    seasons.sort(key=lambda season: season['year'])
+    games = {}
+    for season in seasons:
+        for game_data in season['games']:
+            games.setdefault(game_data['path'], game_data)
+    return list(games.values())
 
 
 def create_issue_title(game_data: Dict) -> str:
@@ -378,8 +818,8 @@ def create_issue_title(game_data: Dict) -> str:
     series = game_data['series']
     game_num = game_data['game_num']
     
-    # Handle placeholder games
-    if game_data.get('placeholder', False):
+    # Handle generated placeholder games (crawled games are titled by their path)
+    if game_data.get('placeholder', False) and 'path' not in game_data:
         team1 = game_data['team1']
         team2 = game_data['team2']
         return f"{series} Game {game_num}: {team1} vs {team2}"
@@ -393,8 +833,8 @@ def create_issue_title(game_data: Dict) -> str:
     return f"{series} Game {game_num}: {game_data['path']}"
 
 
-def create_github_issue(game_data: Dict):
-    """Create a GitHub issue for a game."""
+def build_issue_payload(game_data: Dict) -> Dict:
+    """Build the title, body and label names for a game's issue."""
     title = create_issue_title(game_data)
     
     # Create body based on whether it's a placeholder or real game
@@ -402,7 +842,10 @@ def create_github_issue(game_data: Dict):
         body = f"**Series:** {game_data['series']}\n"
         body += f"**Game:** {game_data['game_num']}\n"
         body += f"**Teams:** {game_data['team1']} vs {game_data['team2']}\n\n"
-        body += "_This is a placeholder for a future game. It will be updated when the game is played._\n"
+        if game_data.get('not_needed'):
+            body += "_This game was not needed: the series was decided before it._\n"
+        else:
+            body += "_This is a placeholder for a future game. It will be updated when the game is played._\n"
         if 'url' in game_data:
             body += f"\nGame URL: {game_data['url']}\n"
     else:
@@ -417,32 +860,215 @@ def create_github_issue(game_data: Dict):
     if league_label:
         labels.append(league_label)
     
-    issue_data = {
+    # Hidden markers so the issue can be found by matchup key whatever its title becomes,
+    # and a re-run can tell whether its rendered content changed
+    digest = content_hash(title, body)
+    body += f"\n{matchup_marker(game_data['matchup_key'])}\n{content_hash_marker(digest)}\n"
+    
+    payload = {
         'title': title,
         'body': body,
         'labels': labels
     }
+    # Games the bracket ruled out are closed so they do not count as picks
+    if game_data.get('not_needed'):
+        payload['state'] = 'closed'
+        payload['state_reason'] = 'not_planned'
+    return payload
+
+
+def find_created_issue(title: str, matchup_key: str, repo: str = REPO) -> Optional[IssueRecord]:
+    """Look for a recently created issue with this matchup key or title (used before retrying a create)."""
+    url = f"{repo_url(repo)}/issues?state=all&sort=created&direction=desc&per_page=100"
+    call_number = count_api_call()
+    log(f"API Call #{call_number}: Rechecking for issue '{title}'")
+    
+    response = SCHEDULER.get(url, headers=HEADERS)
+    if response.status_code != 200:
+        return None
+    return next((issue for issue in records_from_page(response.json())
+                 if issue.matchup_key == matchup_key or issue.title == title), None)
+
+
+def create_github_issue(game_data: Dict, repo: str = REPO, matchup_index: Optional[MatchupIndex] = None) -> Optional[int]:
+    """Create a GitHub issue for a game and return its number."""
+    issue_data = build_issue_payload(game_data)
+    title = issue_data['title']
     
-    url = f"{BASE_URL}/issues"
-    stats['api_calls'] += 1
-    log(f"API Call #{stats['api_calls']}: Creating issue '{title}'")
+    url = f"{repo_url(repo)}/issues"
+    call_number = count_api_call()
+    log(f"API Call #{call_number}: Creating issue '{title}'")
     
     try:
-        response = requests.post(url, headers=HEADERS, json=issue_data)
-        response.raise_for_status()
-        stats['games_created'] += 1
+        response = SCHEDULER.post(url, headers=HEADERS, json=issue_data,
+                                  exists=lambda: find_created_issue(title, game_data['matchup_key'], repo))
+        if isinstance(response, IssueRecord):
+            log(f"Issue '{title}' was created by an earlier attempt")
+            number = response.number
+        else:
+            response.raise_for_status()
+            number = response.json()['number']
+        increment_stat('games_created')
+        if matchup_index is not None:
+            matchup_index.set(game_data['matchup_key'], number, parse_content_hash(issue_data['body']))
         log(f"✓ Created issue: {title}", 'SUCCESS')
-        return True
+        return number
     except Exception as e:
         log(f"✗ Failed to create issue '{title}': {e}", 'ERROR')
-        stats['errors'] += 1
-        return False
+        increment_stat('errors')
+        return None
+
+
+def update_github_issue(game_data: Dict, number: int, repo: str = REPO,
+                        matchup_index: Optional[MatchupIndex] = None) -> Optional[bool]:
+    """Rewrite an existing game issue's title and body (and close it if the game is not needed).
+
+    Labels are left alone so players' picks survive. Returns False if the issue
+    no longer exists and None on other failures.
+    """
+    issue_data = build_issue_payload(game_data)
+    title = issue_data['title']
+    patch = {field: issue_data[field] for field in ('title', 'body', 'state', 'state_reason') if field in issue_data}
+    
+    url = f"{repo_url(repo)}/issues/{number}"
+    call_number = count_api_call()
+    log(f"API Call #{call_number}: Updating issue #{number} '{title}'")
+    
+    try:
+        response = SCHEDULER.patch(url, headers=HEADERS, json=patch)
+        if response.status_code in (404, 410):
+            log(f"Issue #{number} is gone, it will be recreated", 'WARNING')
+            if matchup_index is not None:
+                matchup_index.discard(game_data['matchup_key'])
+            return False
+        response.raise_for_status()
+        increment_stat('games_pruned' if game_data.get('not_needed') else 'games_updated')
+        if matchup_index is not None:
+            matchup_index.set(game_data['matchup_key'], number, parse_content_hash(issue_data['body']))
+        log(f"✓ Updated issue #{number}: {title}", 'SUCCESS')
+        return True
+    except Exception as e:
+        log(f"✗ Failed to update issue #{number}: {e}", 'ERROR')
+        increment_stat('errors')
+        return None
+
+
+def graphql_request(query: str, variables: Optional[Dict] = None) -> Dict:
+    """Run a GraphQL request and return the decoded payload (data and errors)."""
+    response = SCHEDULER.post(GRAPHQL_URL, headers=HEADERS, json={'query': query, 'variables': variables or {}})
+    response.raise_for_status()
+    return response.json()
+
+
+def get_repository_ids(repo: str = REPO) -> Tuple[str, Dict[str, str]]:
+    """Resolve the repository node ID and every label's node ID up front."""
+    query = """
+query($owner: String!, $name: String!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100, after: $after) {
+      nodes { id name }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+    owner, name = repo.split('/')
+    label_ids = {}
+    after = None
+    
+    while True:
+        call_number = count_api_call()
+        log(f"API Call #{call_number}: Resolving repository and label IDs (GraphQL)")
+        payload = graphql_request(query, {'owner': owner, 'name': name, 'after': after})
+        if payload.get('errors'):
+            raise RuntimeError(payload['errors'][0].get('message', 'GraphQL error'))
+        
+        repository = payload['data']['repository']
+        for label in repository['labels']['nodes']:
+            label_ids[label['name']] = label['id']
+        
+        page_info = repository['labels']['pageInfo']
+        if not page_info['hasNextPage']:
+            return repository['id'], label_ids
+        after = page_info['endCursor']
+
+
+def create_github_issues_batched(games: List[Dict], batch_size: int = GRAPHQL_BATCH_SIZE, repo: str = REPO,
+                                 matchup_index: Optional[MatchupIndex] = None) -> int:
+    """Create issues for many games per GraphQL request using aliased createIssue mutations."""
+    if not games:
+        return 0
+    
+    try:
+        repository_id, label_ids = get_repository_ids(repo)
+    except Exception as e:
+        log(f"✗ Failed to resolve repository IDs: {e}", 'ERROR')
+        increment_stat('errors', len(games))
+        return 0
+    
+    created = 0
+    for start in range(0, len(games), batch_size):
+        batch_games = games[start:start + batch_size]
+        batch = [build_issue_payload(game_data) for game_data in batch_games]
+        
+        variables = {}
+        definitions = []
+        mutations = []
+        for index, issue_data in enumerate(batch):
+            alias = f"i{index}"
+            missing = [name for name in issue_data['labels'] if name not in label_ids]
+            if missing:
+                log(f"Label(s) {', '.join(missing)} not found; creating '{issue_data['title']}' without them", 'WARNING')
+            variables[alias] = {
+                'repositoryId': repository_id,
+                'title': issue_data['title'],
+                'body': issue_data['body'],
+                'labelIds': [label_ids[name] for name in issue_data['labels'] if name in label_ids]
+            }
+            definitions.append(f"${alias}: CreateIssueInput!")
+            mutations.append(f"  {alias}: createIssue(input: ${alias}) {{ issue {{ number title }} }}")
+        
+        query = f"mutation({', '.join(definitions)}) {{\n" + "\n".join(mutations) + "\n}"
+        
+        call_number = count_api_call()
+        log(f"API Call #{call_number}: Creating {len(batch)} issue(s) (GraphQL batch)")
+        
+        try:
+            payload = graphql_request(query, variables)
+        except Exception as e:
+            log(f"✗ Failed to create batch of {len(batch)} issue(s): {e}", 'ERROR')
+            increment_stat('errors', len(batch))
+            continue
+        
+        data = payload.get('data') or {}
+        errors_by_alias = {}
+        for error in payload.get('errors') or []:
+            path = error.get('path') or ['']
+            errors_by_alias[path[0]] = error.get('message', 'GraphQL error')
+        
+        for index, issue_data in enumerate(batch):
+            alias = f"i{index}"
+            result = data.get(alias)
+            if result and result.get('issue'):
+                created += 1
+                increment_stat('games_created')
+                if matchup_index is not None:
+                    matchup_index.set(batch_games[index]['matchup_key'], result['issue']['number'],
+                                      parse_content_hash(issue_data['body']))
+                log(f"✓ Created issue #{result['issue']['number']}: {issue_data['title']}", 'SUCCESS')
+            else:
+                message = errors_by_alias.get(alias, 'no issue returned')
+                log(f"✗ Failed to create issue '{issue_data['title']}': {message}", 'ERROR')
+                increment_stat('errors')
+    
+    return created
 
 
 def fetch_bracket_from_site() -> str:
     """Fetch the bracket visualization from plaintextsports.com."""
     log("Fetching bracket from plaintextsports.com...")
-    html = fetch_url('https://plaintextsports.com/mlb/')
+    html = fetch_url(f'{PLAINTEXTSPORTS_URL}/mlb/')
     
     if not html:
         return "*Bracket data not available*"
@@ -470,13 +1096,23 @@ WC winner ─── DS ────────┘          │              WC
 """
 
 
-def update_readme_with_bracket():
-    """Update README.md with playoff bracket information."""
+def render_bracket_section(current: str, bracket_section: str) -> str:
+    """Put the bracket section into the current README, replacing an unmarked one from older runs."""
+    if not get_section(current, 'bracket'):
+        current = LEGACY_BRACKET_PATTERN.sub('', current, count=1)
+    return set_section(current, 'bracket', bracket_section)
+
+
+def update_readme_with_bracket(repo: str = REPO, bracket_viz: Optional[str] = None, year: Optional[int] = None):
+    """Update README.md with the playoff bracket of `year` (the current year by default)."""
     log("Updating README.md with bracket information...")
     
-    bracket_viz = fetch_bracket_from_site()
+    if year is None:
+        year = datetime.now().year
+    if bracket_viz is None:
+        bracket_viz = fetch_bracket_from_site()
     
-    bracket_section = f"""## 🏆 2025 MLB Postseason Bracket
+    bracket_section = f"""## 🏆 {year} MLB Postseason Bracket
 
 {bracket_viz}
 
@@ -487,123 +1123,388 @@ def update_readme_with_bracket():
 - **World Series**: Best of 7
 
 ---
-
 """
     
-    # Get current README
-    url = f"{BASE_URL}/contents/README.md"
-    stats['api_calls'] += 1
-    log(f"API Call #{stats['api_calls']}: Fetching current README.md")
-    
+    publisher = ReadmePublisher(SCHEDULER, HEADERS, repo,
+                                on_request=lambda description: log(f"API Call #{count_api_call()}: {description}"))
     try:
-        response = requests.get(url, headers=HEADERS)
-        response.raise_for_status()
-        current_file = response.json()
-        
-        import base64
-        current_content = base64.b64decode(current_file['content']).decode()
-        
-        # Check if bracket section already exists
-        if '## 🏆 2025 MLB Postseason Bracket' in current_content:
-            log("Bracket section already exists in README.md")
-            return
-        
-        # Add bracket section at the top after the title
-        lines = current_content.split('\n')
-        new_content = []
-        for i, line in enumerate(lines):
-            new_content.append(line)
-            if i == 0 and line.startswith('#'):  # After the main title
-                new_content.append('')
-                new_content.append(bracket_section.strip())
-        
-        new_content_str = '\n'.join(new_content)
-        
-        # Update README
-        encoded_content = base64.b64encode(new_content_str.encode()).decode()
-        
-        data = {
-            'message': '🏆 Add 2025 postseason bracket section',
-            'content': encoded_content,
-            'sha': current_file['sha'],
-            'branch': 'main'
-        }
-        
-        stats['api_calls'] += 1
-        log(f"API Call #{stats['api_calls']}: Updating README.md")
-        response = requests.put(url, headers=HEADERS, json=data)
-        response.raise_for_status()
-        
-        log("✓ README.md updated successfully", 'SUCCESS')
+        commit = publisher.publish(lambda current: render_bracket_section(current, bracket_section),
+                                   f'🏆 Update {year} postseason bracket section')
+        if commit:
+            log(f"✓ README.md updated in {commit[:7]}", 'SUCCESS')
+        else:
+            log("Bracket section in README.md is already up to date")
     except Exception as e:
         log(f"✗ Failed to update README.md: {e}", 'ERROR')
-        stats['errors'] += 1
+        increment_stat('errors')
 
 
-def print_statistics():
-    """Print final statistics."""
+def print_statistics(results: Optional[List[Dict]] = None):
+    """Print final statistics, with a per-repository breakdown for multi-tenant runs."""
     log("\n" + "="*60)
     log("STATISTICS SUMMARY")
     log("="*60)
     log(f"Total API calls:        {stats['api_calls']}")
     log(f"Games found:            {stats['games_found']}")
     log(f"Games created:          {stats['games_created']}")
+    log(f"Games updated:          {stats['games_updated']}")
     log(f"Games skipped:          {stats['games_skipped']}")
+    log(f"Games pruned:           {stats['games_pruned']}")
     log(f"Errors:                 {stats['errors']}")
+    log(f"Throttling:             {SCHEDULER.summary()}")
+    if HTTP_CACHE.enabled:
+        log(f"HTTP cache:             {HTTP_CACHE.summary()}")
+    log(f"Page cache:             {PAGE_CACHE.summary()}")
+    log(f"Slowest phases:         {METRICS.phase_summary()}")
+    if results:
+        log("-"*60)
+        log(f"{'Repository':<34} {'Calls':>6} {'Created':>8} {'Updated':>8} {'Skipped':>8} {'Pruned':>7} {'Errors':>7}")
+        for result in results:
+            if 'error' in result:
+                log(f"{result['repo']:<34} failed: {result['error']}")
+                continue
+            log(f"{result['repo']:<34} {result['api_calls']:>6} {result['games_created']:>8} "
+                f"{result['games_updated']:>8} {result['games_skipped']:>8} {result['games_pruned']:>7} {result['errors']:>7}")
     log("="*60)
 
 
+def export_metrics():
+    """Write the run's metrics to METRICS_DIR, with the statistics and cache counts as counters."""
+    METRICS.set_counters(stats)
+    METRICS.set_counters(PAGE_CACHE.counts(), prefix='page_cache_')
+    if HTTP_CACHE.enabled:
+        METRICS.set_counters({'hits': HTTP_CACHE.hits, 'misses': HTTP_CACHE.misses}, prefix='http_cache_')
+    path = METRICS.write()
+    if path:
+        log(f"Metrics written to {path}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description='Generate the World Series bracket issues.')
+    parser.add_argument('--crawl', action='store_true',
+                        help='Crawl the schedule\'s game pages and create issues for real games instead of placeholders')
+    parser.add_argument('--workers', type=int, default=CRAWL_WORKERS,
+                        help=f'Concurrent page fetches in crawl mode (default: {CRAWL_WORKERS})')
+    parser.add_argument('--graphql', action='store_true',
+                        help='Create issues in batches of aliased GraphQL mutations instead of one REST call each')
+    parser.add_argument('--batch-size', type=int, default=GRAPHQL_BATCH_SIZE,
+                        help=f'Issues per GraphQL request (default: {GRAPHQL_BATCH_SIZE})')
+    parser.add_argument('--year', type=int, help='Season to generate (default: current year)')
+    parser.add_argument('--backfill', type=parse_year_range, metavar='YEARS',
+                        help='Crawl a range of past seasons (e.g. 2019-2024) in parallel processes; implies --crawl')
+    parser.add_argument('--season-workers', type=int, default=SEASON_WORKERS,
+                        help=f'Seasons crawled in parallel during a backfill (default: {SEASON_WORKERS})')
+    parser.add_argument('--page-workers', type=int, default=PAGE_WORKERS,
+                        help=f'Issue pages fetched concurrently once the last page is known (default: {PAGE_WORKERS})')
+    parser.add_argument('--rebuild-index', action='store_true',
+                        help='Ignore the saved matchup index and rebuild it from a full issue listing')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and push live game updates to existing issues, polling more often while games are on')
+    parser.add_argument('--watch-hours', type=float, metavar='HOURS',
+                        help='Stop watching after this many hours (default: when no games are left on the schedule)')
+    parser.add_argument('--repos', nargs='+', metavar='OWNER/NAME', default=[REPO],
+                        help=f'Pool repositories to generate issues in; several are processed concurrently (default: {REPO})')
+    parser.add_argument('--repo-workers', type=int, default=REPO_WORKERS,
+                        help=f'Repositories processed at the same time (default: {REPO_WORKERS})')
+    return parser.parse_args(argv)
+
+
+def sync_matchup_index(matchup_index: MatchupIndex, games: List[Dict], page_workers: int = PAGE_WORKERS):
+    """Bring a repository's matchup index up to date.
+
+    A known index only needs the issues updated since its last sync; without
+    one, the full listing is read once. Issues created before markers existed
+    are adopted by their title.
+    """
+    synced_at = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+    titles = {create_issue_title(game_data): game_data['matchup_key'] for game_data in games}
+    since = matchup_index.last_synced
+    if since:
+        log(f"Revalidating {len(matchup_index)} indexed issue(s) against changes since {since}")
+    else:
+        log("No matchup index yet, reading every issue once")
+    
+    issues = iter_existing_issues(matchup_index.repo, page_workers, since=since)
+    changed = matchup_index.apply(issues, titles)
+    matchup_index.last_synced = synced_at
+    log(f"Matchup index: {len(matchup_index)} game(s), {changed} updated")
+
+
+def reconcile_games(games: List[Dict], matchup_index: MatchupIndex, repo: str = REPO) -> List[Dict]:
+    """PATCH the indexed issues whose rendered content changed and return the games that still need an issue.
+
+    Unchanged games are recognised by the content hash kept in the index, so
+    they cost no request at all.
+    """
+    pending_games = []
+    seen = set()
+    unchanged = updated = pruned = 0
+    for game_data in games:
+        key = game_data['matchup_key']
+        if key in seen:
+            continue
+        seen.add(key)
+        # Only this season's issues are ever closed as not needed
+        if game_data.get('not_needed') and key_season(key) != matchup_index.year:
+            log(f"Not pruning {key}: it is not a {matchup_index.year} game", 'WARNING')
+            continue
+        number = matchup_index.get(key)
+        if not number:
+            # A game that can no longer happen gets no issue at all
+            if game_data.get('not_needed'):
+                pruned += 1
+                increment_stat('games_pruned')
+            else:
+                pending_games.append(game_data)
+            continue
+        digest = parse_content_hash(build_issue_payload(game_data)['body'])
+        if matchup_index.content_hash(key) == digest:
+            unchanged += 1
+            increment_stat('games_skipped')
+            continue
+        # Games are looked up by matchup key, so a retitled issue is still updated in place
+        result = update_github_issue(game_data, number, repo, matchup_index)
+        if result is False:
+            if not game_data.get('not_needed'):
+                pending_games.append(game_data)
+        elif result and game_data.get('not_needed'):
+            pruned += 1
+        elif result:
+            updated += 1
+    log(f"{unchanged} issue(s) unchanged, {updated} updated, {pruned} pruned, {len(pending_games)} to create")
+    return pending_games
+
+
+def process_season(repo: str, year: int, games: List[Dict], args: argparse.Namespace):
+    """Bring one season's game issues in a repository up to date through that season's matchup index."""
+    matchup_index = MatchupIndex(repo, year) if args.rebuild_index else MatchupIndex.load(repo, year)
+    
+    log(f"Checking existing issues for {year}...")
+    try:
+        with METRICS.span('listing'):
+            sync_matchup_index(matchup_index, games, args.page_workers)
+    except Exception as e:
+        log(f"Error fetching issues: {e}", 'ERROR')
+        increment_stat('errors')
+    log("")
+    
+    try:
+        # Update changed issues, then create the missing ones
+        with METRICS.span('create'):
+            # Crawled games fill the same slots as placeholders, so they update those issues
+            games = [slot_game(game_data, matchup_index) for game_data in games]
+            pending_games = reconcile_games(games, matchup_index, repo)
+            if args.graphql:
+                create_github_issues_batched(pending_games, batch_size=args.batch_size, repo=repo,
+                                             matchup_index=matchup_index)
+            else:
+                for game_data in pending_games:
+                    create_github_issue(game_data, repo, matchup_index)
+    finally:
+        matchup_index.save()
+    
+    log("")
+
+
+def process_repository(repo: str, games: List[Dict], args: argparse.Namespace, bracket_viz: str, year: int) -> Dict:
+    """Bring one repository's game issues up to date and add `year`'s bracket to its README."""
+    with _stats_lock:
+        repo_stats[repo] = {key: 0 for key in stats}
+    
+    seasons: Dict[int, List[Dict]] = {}
+    for game_data in games:
+        seasons.setdefault(game_data['season'], []).append(game_data)
+    for season, season_games in sorted(seasons.items()):
+        process_season(repo, season, season_games, args)
+    
+    # Update README with bracket
+    with METRICS.span('readme'):
+        update_readme_with_bracket(repo, bracket_viz, year)
+    
+    return {'repo': repo, **repo_stats[repo]}
+
+
+class GameWatcher:
+    """Polls the games that are live or about to start and pushes changed game data to their issues.
+    
+    Pages come through the page cache, which revalidates them with conditional
+    GETs, and an issue is only written when the content hash of its rendered
+    body changes.
+    """
+    
+    def __init__(self, repos: List[str], year: int):
+        self.repos = repos
+        self.year = year
+        self.indexes = {repo: MatchupIndex.load(repo, year) for repo in repos}
+        self.schedule: Dict[str, str] = {}
+        self.schedule_loaded_at: Optional[float] = None
+        # game path -> state and first pitch
+        self.games: Dict[str, Dict] = {}
+    
+    def load_schedule(self):
+        """Re-read the schedule when it is older than the idle interval; a failed read keeps the last one."""
+        if self.schedule_loaded_at is not None and time.monotonic() - self.schedule_loaded_at < WATCH_IDLE_INTERVAL:
+            return
+        schedule = parse_schedule_for_games(self.year)
+        if not schedule:
+            log(f"No games read from the schedule, trying again in {WATCH_IDLE_INTERVAL / 60:.0f} min", 'WARNING')
+        self.schedule = schedule or self.schedule
+        self.schedule_loaded_at = time.monotonic()
+    
+    def todays_paths(self, now: datetime) -> List[str]:
+        """Scheduled games dated today, plus yesterday's in case they ran past midnight."""
+        dates = {now.date().isoformat(), (now.date() - timedelta(days=1)).isoformat()}
+        return sorted(path for path in set(self.schedule.values()) if path.split('/')[2] in dates)
+    
+    def season_over(self, now: datetime) -> bool:
+        """Whether every scheduled game is in the past and none is live or about to start."""
+        # Without a schedule nothing is known yet, e.g. after a failed first read
+        if not self.schedule:
+            return False
+        today = now.date().isoformat()
+        return all(path.split('/')[2] < today for path in self.schedule.values()) and not any(
+            game['state'] in ('live', 'scheduled') for game in self.games.values())
+    
+    def due(self, path: str, now: datetime) -> bool:
+        """Whether a game needs polling: live, about to start, or not seen yet."""
+        game = self.games.get(path)
+        if not game:
+            return True
+        if game['state'] == 'live':
+            return True
+        if game['state'] == 'scheduled':
+            return not game['starts_at'] or (game['starts_at'] - now).total_seconds() <= WATCH_PREGAME_WINDOW
+        return False
+    
+    def poll(self, path: str) -> Optional[Dict]:
+        """Fetch a game page (revalidated through the page cache) and return its game data."""
+        html = fetch_url(f'{PLAINTEXTSPORTS_URL}{path}')
+        if not html:
+            return None
+        state, starts_at = parse_game_state(html, self.year)
+        self.games[path] = {'state': state, 'starts_at': starts_at}
+        with METRICS.span('parse'):
+            return parse_game_page(path, html)
+    
+    def push(self, game_data: Dict):
+        """Bring the game's issue in every repository up to date."""
+        for repo, matchup_index in self.indexes.items():
+            repo_game = slot_game(game_data, matchup_index)
+            with METRICS.span('create'):
+                if reconcile_games([repo_game], matchup_index, repo):
+                    create_github_issue(repo_game, repo, matchup_index)
+            matchup_index.save()
+    
+    def next_interval(self, now: datetime) -> float:
+        """Seconds until the next poll: short while a game is live, longer before first pitch, hours otherwise."""
+        states = [self.games[path] for path in self.todays_paths(now) if path in self.games]
+        if any(game['state'] == 'live' for game in states):
+            return WATCH_LIVE_INTERVAL
+        starts = [game['starts_at'] for game in states if game['state'] == 'scheduled' and game['starts_at']]
+        if any(game['state'] == 'scheduled' and not game['starts_at'] for game in states):
+            return WATCH_PREGAME_INTERVAL
+        if starts:
+            until = (min(starts) - now).total_seconds() - WATCH_PREGAME_WINDOW
+            return min(max(until, WATCH_PREGAME_INTERVAL), WATCH_IDLE_INTERVAL)
+        return WATCH_IDLE_INTERVAL
+    
+    def run(self, hours: Optional[float] = None):
+        """Poll until the season is over or `hours` have passed."""
+        deadline = time.monotonic() + hours * 3600 if hours else None
+        for repo, matchup_index in self.indexes.items():
+            log(f"Loading matchup index for {repo}")
+            sync_matchup_index(matchup_index, [])
+            matchup_index.save()
+        
+        while True:
+            now = datetime.now(EASTERN)
+            self.load_schedule()
+            due = [path for path in self.todays_paths(now) if self.due(path, now)]
+            for path in due:
+                game_data = self.poll(path)
+                if game_data:
+                    self.push(game_data)
+            
+            if self.season_over(now):
+                log("No games left on the schedule, stopping")
+                return
+            interval = self.next_interval(now)
+            if deadline is not None:
+                interval = min(interval, deadline - time.monotonic())
+                if interval <= 0:
+                    log("Watch time is up, stopping")
+                    return
+            log(f"Polled {len(due)} game(s); next poll in {interval / 60:.1f} min")
+            time.sleep(interval)
+
+
 def main():
+    args = parse_args()
+    
     if not GITHUB_TOKEN:
         log("❌ Error: GITHUB_TOKEN environment variable not set", 'ERROR')
         sys.exit(1)
     
     log("⚾🍿🌭 World Series Bracket Generator 🧤⚾")
-    log(f"Repository: {REPO_OWNER}/{REPO_NAME}")
-    log("")
-    
-    # Get current year
-    current_year = datetime.now().year
-    log(f"Processing year: {current_year}")
+    log(f"Repository: {', '.join(args.repos)}")
     log("")
     
-    # Get existing issues
-    existing_issues = get_existing_issues()
-    log("")
-    
-    # Parse schedule for actual game URLs
-    game_url_map = parse_schedule_for_games(current_year)
+    current_year = args.year or datetime.now().year
+    if args.backfill:
+        log(f"Backfilling years: {args.backfill[0]}-{args.backfill[-1]}")
+    else:
+        log(f"Processing year: {current_year}")
     log("")
     
-    # Generate all 53 possible playoff games
-    all_games = generate_all_playoff_games(current_year)
-    log("")
+    if args.watch:
+        # Long-running mode: only live and upcoming games are polled, and no README or new-season work
+        GameWatcher(args.repos, current_year).run(args.watch_hours)
+        log("")
+        print_statistics()
+        export_metrics()
+        return
     
-    # Process each generated game
-    log("Processing games...")
-    for game_info in all_games:
-        # Create the game data structure
-        game_data = fetch_game_data_for_generated_game(game_info, game_url_map)
-        
-        # Create title for duplicate checking
-        title = create_issue_title(game_data)
-        
-        # Check if issue already exists
-        if title in existing_issues:
-            log(f"Issue '{title}' already exists, skipping")
-            stats['games_skipped'] += 1
-            continue
+    # Games and the bracket come from plaintextsports.com once and are shared by every repository
+    if args.backfill:
+        # Crawl every season in worker processes; issues are still created here
+        with METRICS.span('crawl'):
+            games = backfill_seasons(args.backfill, season_workers=args.season_workers, workers=args.workers)
+        stats['games_found'] = len(games)
+    else:
+        # Parse schedule for actual game URLs
+        with METRICS.span('schedule'):
+            game_url_map = parse_schedule_for_games(current_year)
+        log("")
         
-        # Create issue
-        create_github_issue(game_data)
+        with METRICS.span('crawl'):
+            if args.crawl:
+                # Crawl the real game pages concurrently
+                games = crawl_game_pages(sorted(set(game_url_map.values())), max_workers=args.workers)
+                stats['games_found'] = len(games)
+            else:
+                # Generate all 53 possible playoff games and fill in the ones already scheduled
+                all_games = generate_all_playoff_games(current_year)
+                real_games = match_schedule_games(game_url_map, current_year, max_workers=args.workers)
+                bracket = build_bracket(real_games)
+                games = [fetch_game_data_for_generated_game(game_info, real_games, bracket) for game_info in all_games]
+    log("")
     
+    with METRICS.span('bracket'):
+        bracket_viz = fetch_bracket_from_site()
     log("")
     
-    # Update README with bracket
-    update_readme_with_bracket()
+    if len(args.repos) == 1:
+        process_repository(args.repos[0], games, args, bracket_viz, current_year)
+        results = None
+    else:
+        log(f"Processing {len(args.repos)} repositories with {args.repo_workers} worker(s)...")
+        results = run_for_repositories(args.repos, lambda repo: process_repository(repo, games, args, bracket_viz, current_year),
+                                       max_workers=args.repo_workers)
     
     log("")
-    print_statistics()
+    print_statistics(results)
+    export_metrics()
     
     log("")
     log("✅ Bracket generation complete!")
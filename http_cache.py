@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Persistent ETag / Last-Modified cache for GitHub API GET requests.
+Unchanged pages come back as 304 Not Modified (which GitHub does not count
+against the rate limit) and are served from the local copy. Listings with
+since= are asked for once per timestamp, so they are never stored, and
+entries left unused for HTTP_CACHE_MAX_AGE_DAYS are dropped.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+# Response headers worth keeping alongside a cached body
+CACHED_HEADERS = ['ETag', 'Last-Modified', 'Link', 'Content-Type']
+
+# Entries not used for this many days are removed when the cache is opened
+HTTP_CACHE_MAX_AGE_DAYS = float(os.environ.get('HTTP_CACHE_MAX_AGE_DAYS', '30'))
+
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response, served from the cache."""
+
+    def __init__(self, url: str, headers: Dict[str, str], text: str):
+        self.url = url
+        self.status_code = 200
+        self.headers = requests.structures.CaseInsensitiveDict(headers)
+        self.text = text
+        self.from_cache = True
+        self.ok = True
+
+    @property
+    def links(self) -> Dict[str, dict]:
+        links = {}
+        for link in requests.utils.parse_header_links(self.headers.get('Link', '')):
+            links[link.get('rel') or link.get('url')] = link
+        return links
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        pass
+
+
+class HttpCache:
+    """On-disk conditional-request cache keyed by URL."""
+
+    def __init__(self, cache_dir: Optional[str], max_age_days: float = HTTP_CACHE_MAX_AGE_DAYS):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.evict(max_age_days)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.cache_dir)
+
+    @staticmethod
+    def cacheable(url: str) -> bool:
+        """Whether a URL can come up again; since= deltas never do."""
+        return 'since' not in parse_qs(urlparse(url).query)
+
+    def evict(self, max_age_days: float) -> int:
+        """Remove entries not stored or revalidated within `max_age_days`; returns how many."""
+        cutoff = time.time() - max_age_days * 86400
+        removed = 0
+        for entry in os.scandir(self.cache_dir):
+            try:
+                if entry.name.endswith('.json') and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def _entry_path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def _load(self, url: str) -> Optional[dict]:
+        try:
+            with open(self._entry_path(url), encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get('url') == url else None
+
+    def _store(self, url: str, response: requests.Response):
+        entry = {
+            'url': url,
+            'headers': {name: response.headers[name] for name in CACHED_HEADERS if name in response.headers},
+            'body': response.text
+        }
+        path = self._entry_path(url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, session: requests.Session, url: str, headers: Optional[Dict[str, str]] = None, **kwargs):
+        """GET a URL, revalidating any cached copy with If-None-Match / If-Modified-Since."""
+        if not self.enabled or not self.cacheable(url):
+            return session.get(url, headers=headers, **kwargs)
+
+        entry = self._load(url)
+        request_headers = dict(headers or {})
+        if entry:
+            if 'ETag' in entry['headers']:
+                request_headers['If-None-Match'] = entry['headers']['ETag']
+            if 'Last-Modified' in entry['headers']:
+                request_headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+
+        response = session.get(url, headers=request_headers, **kwargs)
+
+        if response.status_code == 304 and entry:
+            self._count(hit=True)
+            # Revalidated entries stay fresh for eviction
+            try:
+                os.utime(self._entry_path(url))
+            except OSError:
+                pass
+            return CachedResponse(url, entry['headers'], entry['body'])
+
+        self._count(hit=False)
+        if response.status_code == 200 and ('ETag' in response.headers or 'Last-Modified' in response.headers):
+            self._store(url, response)
+        return response
+
+    def summary(self) -> str:
+        """One-line hit/miss summary."""
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        return f"{self.hits} hit(s), {self.misses} miss(es) ({rate:.0f}% hit rate)"
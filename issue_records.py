@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Compact issue records shared by the bracket scripts.
+The scripts only need an issue's number, title, state (and state reason),
+labels, updated_at, season and the hidden matchup key and content hash in its
+body, so each page of the issue listing is reduced to slotted records as soon
+as it is decoded and the full GitHub payloads (user objects, URLs, reactions,
+bodies) are dropped. Label names are interned once in a shared table and
+records keep a tuple of label IDs.
+"""
+
+import re
+import sys
+import hashlib
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Hidden markers identifying the bracket game an issue belongs to and the content it was rendered from
+MATCHUP_KEY_PATTERN = re.compile(r'<!-- matchup_key: (\S+) -->')
+CONTENT_HASH_PATTERN = re.compile(r'<!-- content_hash: ([0-9a-f]+) -->')
+# Matchup keys start with their season, e.g. '2025-ALWC-3v6-G1', since slots repeat every year
+SEASON_KEY_PATTERN = re.compile(r'^(\d{4})-(.+)$')
+
+
+def season_key(season: int, key: str) -> str:
+    """A bracket slot or game page key qualified with its season."""
+    return f'{season}-{key}'
+
+
+def key_season(key: str) -> Optional[int]:
+    """The season of a matchup key, or None for keys marked before they carried one."""
+    match = SEASON_KEY_PATTERN.match(key)
+    return int(match.group(1)) if match else None
+
+
+def slot_key(key: str) -> str:
+    """A matchup key without its season."""
+    match = SEASON_KEY_PATTERN.match(key)
+    return match.group(2) if match else key
+
+
+def matchup_marker(key: str) -> str:
+    """HTML comment carrying a game's matchup key in its issue body."""
+    return f'<!-- matchup_key: {key} -->'
+
+
+def parse_matchup_key(body: Optional[str]) -> Optional[str]:
+    """The matchup key marked in an issue body, if any."""
+    match = MATCHUP_KEY_PATTERN.search(body or '')
+    return match.group(1) if match else None
+
+
+def content_hash(title: str, body: str) -> str:
+    """Short digest of a rendered issue's title and body."""
+    return hashlib.sha256(f'{title}\n{body}'.encode()).hexdigest()[:16]
+
+
+def content_hash_marker(digest: str) -> str:
+    """HTML comment carrying the content hash in an issue body."""
+    return f'<!-- content_hash: {digest} -->'
+
+
+def parse_content_hash(body: Optional[str]) -> Optional[str]:
+    """The content hash marked in an issue body, if any."""
+    match = CONTENT_HASH_PATTERN.search(body or '')
+    return match.group(1) if match else None
+
+
+class LabelTable:
+    """Interns label names to small integer IDs."""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def intern(self, name: str) -> int:
+        label_id = self.ids.get(name)
+        if label_id is None:
+            with self._lock:
+                label_id = self.ids.get(name)
+                if label_id is None:
+                    label_id = len(self.names)
+                    self.names.append(sys.intern(name))
+                    self.ids[name] = label_id
+        return label_id
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+# One table for every record, so IDs are comparable across pages and repositories
+LABELS = LabelTable()
+
+
+class IssueRecord:
+    """The fields of a GitHub issue the bracket scripts use."""
+
+    __slots__ = ('number', 'title', 'state', 'label_ids', 'updated_at', 'matchup_key', 'content_hash',
+                 'state_reason', 'season')
+
+    def __init__(self, number: int, title: str, state: str, label_ids: Tuple[int, ...], updated_at: str,
+                 matchup_key: Optional[str] = None, content_hash: Optional[str] = None,
+                 state_reason: Optional[str] = None, season: Optional[int] = None):
+        self.number = number
+        self.title = title
+        self.state = state
+        self.label_ids = label_ids
+        self.updated_at = updated_at
+        self.matchup_key = matchup_key
+        self.content_hash = content_hash
+        self.state_reason = state_reason
+        self.season = season
+
+    @classmethod
+    def from_payload(cls, issue: Dict) -> 'IssueRecord':
+        """Build a record from a REST issue payload (or a webhook event's issue)."""
+        body = issue.get('body')
+        key = parse_matchup_key(body)
+        created = issue.get('created_at') or ''
+        season = key_season(key) if key else None
+        # Issues marked before keys carried a season belong to the season they were created in
+        if season is None and created[:4].isdigit():
+            season = int(created[:4])
+            key = season_key(season, key) if key else None
+        return cls(issue['number'], issue['title'], sys.intern(issue['state']),
+                   tuple(LABELS.intern(label['name']) for label in issue['labels']), issue['updated_at'],
+                   key, parse_content_hash(body), issue.get('state_reason'), season)
+
+    @property
+    def labels(self) -> Tuple[str, ...]:
+        """Label names."""
+        names = LABELS.names
+        return tuple(names[label_id] for label_id in self.label_ids)
+
+    def __repr__(self) -> str:
+        return f"IssueRecord(#{self.number} {self.title!r} {self.state})"
+
+
+def records_from_page(page: Iterable[Dict]) -> List[IssueRecord]:
+    """Reduce a decoded page of issue payloads to records."""
+    return [IssueRecord.from_payload(issue) for issue in page]
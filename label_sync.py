@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Label reconciliation shared by setup_labels.py and manage_players.py.
+The repository's labels are read through every page of the listing and
+compared with the labels a script wants; only the differences are sent:
+creates, updates of color or description, renames and (for a managed
+prefix such as player:) deletes. A rename is a PATCH with new_name, so the
+label stays on every issue it was on, and label names are matched without
+regard to case as GitHub does. Changes are sent concurrently through the
+scheduler, which keeps writes within the rate limits.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import quote
+
+from pagination import iter_pages
+
+# Label changes in flight at once (writes are still paced by the scheduler)
+LABEL_WORKERS = int(os.environ.get('LABEL_WORKERS', '4'))
+
+
+class LabelChange:
+    """One create, update, rename or delete."""
+
+    def __init__(self, action: str, name: str, data: Optional[Dict] = None):
+        self.action = action
+        self.name = name
+        self.data = data or {}
+
+    def describe(self) -> str:
+        if self.action == 'rename':
+            return f"{self.name} -> {self.data['new_name']}"
+        return self.name
+
+
+def normalize(label: Dict) -> Dict:
+    """Name, color (lowercase, no '#') and description of a label, dropping fields left as None."""
+    data = {'name': label['name'], 'color': (label.get('color') or '').lstrip('#').lower() or None,
+            'description': label.get('description')}
+    return {field: value for field, value in data.items() if value is not None}
+
+
+def plan_labels(existing: Dict[str, Dict], desired: Iterable[Dict], renames: Optional[Dict[str, str]] = None,
+                prune_prefix: Optional[str] = None) -> List[LabelChange]:
+    """The changes that turn the existing labels (keyed by lowercase name) into the desired ones.
+
+    A desired label whose color or description is None keeps the existing
+    value. `renames` maps old names to new ones; a desired label whose old
+    name exists is renamed rather than created. With `prune_prefix`, existing
+    labels with that prefix that are not desired are deleted, except the old
+    names in `renames`, whose labels carry picks.
+    """
+    old_names = {new.lower(): old for old, new in (renames or {}).items()}
+    changes = []
+    kept = set()
+    for label in desired:
+        data = normalize(label)
+        key = data['name'].lower()
+        current = existing.get(key)
+        if current is None and key in old_names and old_names[key].lower() in existing:
+            current = existing[old_names[key].lower()]
+        if current is None:
+            changes.append(LabelChange('create', data['name'], data))
+            continue
+
+        kept.add(current['name'].lower())
+        differs = {field: value for field, value in data.items()
+                   if field != 'name' and normalize(current).get(field) != value}
+        if current['name'] != data['name']:
+            changes.append(LabelChange('rename', current['name'], {'new_name': data['name'], **differs}))
+        elif differs:
+            changes.append(LabelChange('update', current['name'], differs))
+
+    if prune_prefix:
+        kept.update(old.lower() for old in old_names.values())
+        changes.extend(LabelChange('delete', label['name']) for key, label in sorted(existing.items())
+                       if key.startswith(prune_prefix.lower()) and key not in kept)
+    return changes
+
+
+class LabelSync:
+    """Reads a repository's labels and applies label changes to it."""
+
+    def __init__(self, scheduler, headers, labels_url: str, workers: int = LABEL_WORKERS):
+        self.scheduler = scheduler
+        self.headers = headers
+        self.labels_url = labels_url
+        self.workers = max(1, workers)
+
+    def label_url(self, name: str) -> str:
+        return f"{self.labels_url}/{quote(name, safe='')}"
+
+    def fetch_page(self, url: str):
+        response = self.scheduler.get(url, headers=self.headers)
+        response.raise_for_status()
+        return response
+
+    def fetch(self) -> Dict[str, Dict]:
+        """Every label in the repository, keyed by lowercase name."""
+        labels = {}
+        for response in iter_pages(self.fetch_page, f"{self.labels_url}?per_page=100", workers=1):
+            for label in response.json():
+                labels[label['name'].lower()] = label
+        return labels
+
+    def find(self, name: str) -> Optional[Dict]:
+        """Return a label by name, or None (used before retrying a create)."""
+        response = self.scheduler.get(self.label_url(name), headers=self.headers)
+        return response.json() if response.status_code == 200 else None
+
+    def send(self, change: LabelChange) -> bool:
+        """Apply one change; True when GitHub accepted it."""
+        if change.action == 'create':
+            response = self.scheduler.post(self.labels_url, headers=self.headers, json=change.data,
+                                           exists=lambda: self.find(change.name))
+            return isinstance(response, dict) or response.status_code == 201
+        if change.action == 'delete':
+            response = self.scheduler.delete(self.label_url(change.name), headers=self.headers)
+            # Already gone counts as done
+            return response.status_code in (204, 404)
+        response = self.scheduler.patch(self.label_url(change.name), headers=self.headers, json=change.data)
+        return response.status_code == 200
+
+    def apply(self, changes: List[LabelChange]) -> Dict[str, int]:
+        """Apply changes concurrently and print each outcome; returns counts per action (and failures)."""
+        counts = {'create': 0, 'update': 0, 'rename': 0, 'delete': 0, 'failed': 0}
+        if not changes:
+            return counts
+
+        def attempt(change: LabelChange) -> bool:
+            try:
+                return self.send(change)
+            except Exception as e:
+                print(f"   ✗ {change.action} {change.describe()}: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(changes))) as executor:
+            for change, ok in zip(changes, executor.map(attempt, changes)):
+                if ok:
+                    counts[change.action] += 1
+                    print(f"   ✓ {change.action.title()}d: {change.describe()}")
+                else:
+                    counts['failed'] += 1
+                    print(f"   ✗ Failed to {change.action}: {change.describe()}")
+        return counts
+
+    def sync(self, desired: Iterable[Dict], renames: Optional[Dict[str, str]] = None,
+             prune_prefix: Optional[str] = None) -> Dict[str, int]:
+        """Read the labels, plan the changes and apply them; returns counts per action plus 'unchanged'."""
+        existing = self.fetch()
+        desired = list(desired)
+        changes = plan_labels(existing, desired, renames, prune_prefix)
+        print(f"   {len(existing)} existing label(s), {len(changes)} change(s) needed")
+        counts = self.apply(changes)
+        counts['unchanged'] = len(desired) - sum(1 for change in changes if change.action != 'delete')
+        return counts
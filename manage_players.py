@@ -1,93 +1,119 @@
 #!/usr/bin/env python3
 """
 Manage player labels for the World Series bracket tracker.
-This script deletes existing player labels and creates new ones.
+This script brings the player labels in line with a list of players: missing
+players are created, renamed players keep their picks, and players no longer
+listed are removed. Players already set up are left untouched.
 """
 
 import os
 import sys
-from typing import List
-import requests
+import argparse
+from typing import Dict, List
+
+from label_sync import LABEL_WORKERS, LabelSync, plan_labels
+from rate_limit import RequestScheduler
+from run_metrics import RunMetrics
+from transport import GITHUB_API_URL, create_session
 
 GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
 REPO_OWNER = 'oraweb'
 REPO_NAME = 'world-series-bracket'
-BASE_URL = f'https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/labels'
+BASE_URL = f'{GITHUB_API_URL}/repos/{REPO_OWNER}/{REPO_NAME}/labels'
 
 HEADERS = {
     'Authorization': f'token {GITHUB_TOKEN}',
     'Accept': 'application/vnd.github.v3+json'
 }
 
-PLAYER_LABEL_COLORS = ['#bfdadc', '#c5def5', '#f9d0c4', '#d4c5f9', '#c2e0c6', '#fad8b8', '#bfd4f2', '#f9c5d5', '#d5f4e6', '#fbe4d5']
+SESSION = create_session()
+SCHEDULER = RequestScheduler(SESSION)
 
-def get_all_labels() -> List[dict]:
-    """Fetch all existing labels from the repository."""
-    response = requests.get(BASE_URL, headers=HEADERS)
-    response.raise_for_status()
-    return response.json()
+METRICS = RunMetrics('manage_players')
+METRICS.instrument(SESSION, SCHEDULER)
 
-def delete_player_labels():
-    """Delete all labels that start with 'player:'."""
-    print("🗑️  Deleting existing player labels...")
-    labels = get_all_labels()
-    deleted_count = 0
-    
-    for label in labels:
-        if label['name'].startswith('player:'):
-            delete_url = f"{BASE_URL}/{label['name']}"
-            response = requests.delete(delete_url, headers=HEADERS)
-            if response.status_code == 204:
-                print(f"   ✓ Deleted: {label['name']}")
-                deleted_count += 1
-            else:
-                print(f"   ✗ Failed to delete: {label['name']}")
-    
-    print(f"Deleted {deleted_count} player label(s)\n")
+PLAYER_LABEL_COLORS = ['#bfdadc', '#c5def5', '#f9d0c4', '#d4c5f9', '#c2e0c6', '#fad8b8', '#bfd4f2', '#f9c5d5', '#d5f4e6', '#fbe4d5']
 
-def create_player_labels(players: List[str]):
-    """Create new player labels."""
-    print("⚾ Creating new player labels...")
-    created_count = 0
-    
+PLAYER_PREFIX = 'player:'
+
+def player_labels(players: List[str]) -> List[dict]:
+    """Desired labels for the players; existing players keep whatever color they have."""
+    labels = []
     for idx, player in enumerate(players):
-        label_name = f"player:{player.lower()}"
-        color = PLAYER_LABEL_COLORS[idx % len(PLAYER_LABEL_COLORS)]
-        
-        label_data = {
-            'name': label_name,
-            'color': color.lstrip('#'),
+        labels.append({
+            'name': f"{PLAYER_PREFIX}{player.lower()}",
+            'color': PLAYER_LABEL_COLORS[idx % len(PLAYER_LABEL_COLORS)],
             'description': f'Player: {player}'
-        }
-        
-        response = requests.post(BASE_URL, headers=HEADERS, json=label_data)
-        if response.status_code == 201:
-            print(f"   ✓ Created: {label_name} ({color})")
-            created_count += 1
-        else:
-            print(f"   ✗ Failed to create: {label_name} - {response.text}")
+        })
+    return labels
+
+def sync_player_labels(players: List[str], renames: Dict[str, str], prune: bool = True, workers: int = LABEL_WORKERS) -> Dict[str, int]:
+    """Create, rename and (with `prune`) delete player labels so they match the players."""
+    label_sync = LabelSync(SCHEDULER, HEADERS, BASE_URL, workers=workers)
+    existing = label_sync.fetch()
+    
+    label_renames = {f"{PLAYER_PREFIX}{old.lower()}": f"{PLAYER_PREFIX}{new.lower()}" for old, new in renames.items()}
+    desired = player_labels(players)
+    for label in desired:
+        # Colors are only picked for new players, so reordering the list does not repaint everyone
+        if label['name'] in existing or label['name'] in label_renames.values():
+            label['color'] = None
     
-    print(f"Created {created_count} player label(s)\n")
+    changes = plan_labels(existing, desired, label_renames, PLAYER_PREFIX if prune else None)
+    print(f"   {sum(1 for label in existing.values() if label['name'].startswith(PLAYER_PREFIX))} existing player label(s), "
+          f"{len(changes)} change(s) needed")
+    return label_sync.apply(changes)
+
+def parse_rename(value: str):
+    old, sep, new = value.partition('=')
+    if not sep or not old or not new:
+        raise argparse.ArgumentTypeError(f"expected OLD=NEW, got '{value}'")
+    return old, new
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description='Sync the player labels with a list of players.')
+    parser.add_argument('players', nargs='*', default=['jack', 'marjorie', 'caroline'],
+                        help='Player names (default: jack marjorie caroline)')
+    parser.add_argument('--rename', type=parse_rename, action='append', default=[], metavar='OLD=NEW',
+                        help='Rename a player, keeping their picks (NEW must also be listed); may be repeated')
+    parser.add_argument('--keep-others', action='store_true',
+                        help='Keep player labels for players that are not listed instead of deleting them')
+    parser.add_argument('--workers', type=int, default=LABEL_WORKERS,
+                        help=f'Label changes sent concurrently (default: {LABEL_WORKERS})')
+    args = parser.parse_args(argv)
+    listed = {player.lower() for player in args.players}
+    unlisted = [f"{old}={new}" for old, new in args.rename if new.lower() not in listed]
+    if unlisted:
+        # Otherwise the old label would be pruned with all its picks instead of renamed
+        parser.error(f"--rename needs NEW among the players: {', '.join(unlisted)}")
+    return args
 
 def main():
+    args = parse_args()
+    
     if not GITHUB_TOKEN:
         print("❌ Error: GITHUB_TOKEN environment variable not set")
         sys.exit(1)
     
-    # Get players from command line arguments or use defaults
-    if len(sys.argv) > 1:
-        players = sys.argv[1:]
-    else:
-        players = ['jack', 'marjorie', 'caroline']
+    players = args.players
     
     print("⚾🍿🌭 World Series Bracket - Player Label Manager 🧤⚾\n")
     print(f"Repository: {REPO_OWNER}/{REPO_NAME}")
     print(f"Players: {', '.join(players)}\n")
     
-    delete_player_labels()
-    create_player_labels(players)
+    print("🏷️  Syncing player labels...")
+    with METRICS.span('labels'):
+        counts = sync_player_labels(players, dict(args.rename), prune=not args.keep_others, workers=args.workers)
+    print(f"Created {counts['create']}, renamed {counts['rename']}, updated {counts['update']}, "
+          f"deleted {counts['delete']} player label(s); {counts['failed']} failed\n")
     
+    print(f"⏱️  Throttling: {SCHEDULER.summary()}")
+    METRICS.set_counters(counts, prefix='labels_')
+    metrics_path = METRICS.write()
+    if metrics_path:
+        print(f"📈 Metrics written to {metrics_path}")
     print("✅ Player label management complete!")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Persistent matchup-key index for generate_bracket.py.
+Every game issue carries its matchup key as a hidden marker in the body; this
+index maps those keys to issue numbers per repository and season, so creating, finding
+and updating a game does not need a listing of the whole repository. Between
+runs it is revalidated with issues?since=<last sync>. The content hash each
+issue was last rendered with is kept too, so unchanged games need no write.
+"""
+
+import os
+import json
+import threading
+from typing import Dict, Iterable, Optional
+
+from issue_records import key_season
+
+# Where per-repository, per-season indexes are kept (empty keeps them in memory only)
+MATCHUP_INDEX_DIR = os.environ.get('MATCHUP_INDEX_DIR', '.bracket-state')
+
+
+class MatchupIndex:
+    """matchup_key -> issue number (and last rendered content hash) for one repository's season."""
+
+    def __init__(self, repo: str, year: int, directory: Optional[str] = MATCHUP_INDEX_DIR):
+        self.repo = repo
+        self.year = year
+        self.path = os.path.join(directory, repo, str(year), 'matchups.json') if directory else None
+        self.keys: Dict[str, int] = {}
+        self.hashes: Dict[str, str] = {}
+        self.last_synced: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, repo: str, year: int, directory: Optional[str] = MATCHUP_INDEX_DIR) -> 'MatchupIndex':
+        """Load a repository's index for a season, or start an empty one."""
+        index = cls(repo, year, directory)
+        if index.path:
+            try:
+                with open(index.path, encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                return index
+            if data.get('repo') == repo and data.get('year') == year:
+                index.keys = {key: int(number) for key, number in data.get('keys', {}).items()
+                              if key_season(key) == year}
+                index.hashes = {key: digest for key, digest in data.get('hashes', {}).items() if key in index.keys}
+                index.last_synced = data.get('last_synced')
+        return index
+
+    def save(self):
+        """Persist the index."""
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._lock:
+            data = {'repo': self.repo, 'year': self.year, 'last_synced': self.last_synced, 'keys': dict(self.keys),
+                    'hashes': dict(self.hashes)}
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def get(self, key: str) -> Optional[int]:
+        # Another season's issue is never this season's game, even for the same slot
+        return self.keys.get(key) if key_season(key) == self.year else None
+
+    def content_hash(self, key: str) -> Optional[str]:
+        return self.hashes.get(key)
+
+    def set(self, key: str, number: int, digest: Optional[str] = None):
+        with self._lock:
+            self.keys[key] = number
+            if digest:
+                self.hashes[key] = digest
+            else:
+                self.hashes.pop(key, None)
+
+    def discard(self, key: str):
+        with self._lock:
+            self.keys.pop(key, None)
+            self.hashes.pop(key, None)
+
+    def apply(self, issues: Iterable, titles: Optional[Dict[str, str]] = None) -> int:
+        """Index issues by their matchup marker; unmarked issues are adopted by title via `titles`.
+
+        Returns the number of keys added or moved.
+        """
+        changed = 0
+        for issue in issues:
+            if issue.season != self.year:
+                continue
+            key = issue.matchup_key or (titles or {}).get(issue.title)
+            if not key:
+                continue
+            if self.keys.get(key) == issue.number and self.hashes.get(key) == issue.content_hash:
+                continue
+            # A marked issue wins over one adopted by title
+            if not issue.matchup_key and key in self.keys:
+                continue
+            self.set(key, issue.number, issue.content_hash)
+            changed += 1
+        return changed
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self.keys)
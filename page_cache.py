@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Page cache for plaintextsports.com used by generate_bracket.py.
+Each page is kept for as long as its content can be trusted, which the caller
+decides from the page itself: a final game's page never changes, a scheduled
+game's changes at first pitch and a live game's changes every few seconds.
+Expired pages are revalidated with conditional GETs, and when the site errors
+the last copy is served instead (stale-if-error). Pages are kept in memory
+and, when PAGE_CACHE_DIR is set, on disk between runs.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Callable, Dict, Optional
+
+# How long an expired page may still be served while the site is failing
+PAGE_STALE_MAX = float(os.environ.get('PAGE_STALE_MAX', '86400'))
+
+COUNTERS = ('hits', 'revalidated', 'misses', 'stale')
+
+
+class PageCache:
+    """URL -> page text with a per-page expiry (None keeps a page forever)."""
+
+    def __init__(self, cache_dir: Optional[str] = None, stale_max: float = PAGE_STALE_MAX):
+        self.cache_dir = cache_dir
+        self.stale_max = stale_max
+        self.entries: Dict[str, dict] = {}
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.stale = 0
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _entry_path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def _load(self, url: str) -> Optional[dict]:
+        with self._lock:
+            entry = self.entries.get(url)
+        if entry or not self.cache_dir:
+            return entry
+        try:
+            with open(self._entry_path(url), encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('url') != url:
+            return None
+        with self._lock:
+            self.entries[url] = entry
+        return entry
+
+    def _store(self, entry: dict):
+        with self._lock:
+            self.entries[entry['url']] = entry
+        if not self.cache_dir:
+            return
+        path = self._entry_path(entry['url'])
+        # Backfill worker processes share the directory
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, url: str, fetch: Callable[[Dict[str, str]], object],
+            ttl_of: Callable[[str, str], Optional[float]]) -> str:
+        """Return a page's text, calling `fetch(headers)` only when the cached copy has expired.
+
+        `fetch` sends the GET with the given conditional headers and returns the
+        response; `ttl_of(url, text)` says how many seconds a page stays fresh
+        (None: forever). Raises if the page cannot be fetched and no copy is
+        recent enough to serve instead.
+        """
+        now = time.time()
+        entry = self._load(url)
+        if entry and (entry['expires_at'] is None or now < entry['expires_at']):
+            self._count('hits')
+            return entry['body']
+
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            response = fetch(headers)
+            if response.status_code == 304 and entry:
+                body = entry['body']
+                self._count('revalidated')
+            else:
+                response.raise_for_status()
+                body = response.text
+                self._count('misses')
+        except Exception:
+            if entry and now - entry['fetched_at'] <= self.stale_max:
+                self._count('stale')
+                return entry['body']
+            raise
+
+        ttl = ttl_of(url, body)
+        self._store({
+            'url': url,
+            'body': body,
+            'etag': response.headers.get('ETag') or (entry or {}).get('etag'),
+            'last_modified': response.headers.get('Last-Modified') or (entry or {}).get('last_modified'),
+            'fetched_at': now,
+            'expires_at': None if ttl is None else now + ttl
+        })
+        return body
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            return {counter: getattr(self, counter) for counter in COUNTERS}
+
+    def add_counts(self, counts: Dict[str, int]):
+        """Fold in counters from another process's cache (backfill workers)."""
+        with self._lock:
+            for counter in COUNTERS:
+                setattr(self, counter, getattr(self, counter) + counts.get(counter, 0))
+
+    def summary(self) -> str:
+        """One-line hit/miss summary."""
+        total = self.hits + self.revalidated + self.misses + self.stale
+        rate = ((self.hits + self.revalidated) / total * 100) if total else 0.0
+        return (f"{self.hits} hit(s), {self.revalidated} revalidated, {self.misses} miss(es), "
+                f"{self.stale} stale served ({rate:.0f}% hit rate)")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Streaming pagination for GitHub list endpoints.
+Pages are followed through the Link header's rel="next" URL, so a listing ends
+on its last page instead of requesting an extra empty one. The next page is
+fetched in the background while the caller works through the current one, and
+issues are yielded one at a time as compact records. With more than one page
+worker, the pages up to rel="last" are fetched concurrently once the first page
+is in and handed out in order.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from issue_records import IssueRecord, records_from_page
+
+# Concurrent page fetches once the last page is known (1 = follow rel="next" one page ahead)
+PAGE_WORKERS = int(os.environ.get('PAGE_WORKERS', '1'))
+
+
+def page_url(url: str, page: int) -> str:
+    """The same listing URL pointing at another page."""
+    parsed = urlparse(url)
+    query = [(key, value) for key, value in parse_qsl(parsed.query) if key != 'page'] + [('page', str(page))]
+    return urlunparse(parsed._replace(query=urlencode(query)))
+
+
+def last_page(response) -> Optional[int]:
+    """Page number of the response's rel="last" link, if it has one."""
+    link = response.links.get('last')
+    if not link:
+        return None
+    page = dict(parse_qsl(urlparse(link['url']).query)).get('page', '')
+    return int(page) if page.isdigit() else None
+
+
+def iter_pages(fetch: Callable[[str], object], url: str, prefetch: bool = True,
+               workers: int = PAGE_WORKERS) -> Iterator[object]:
+    """Yield each page's response, starting the request for page N+1 before page N is handed out.
+
+    `fetch(url)` returns a response (raising on errors) whose `links` holds the parsed Link header.
+    """
+    response = fetch(url)
+    last = last_page(response) if workers > 1 else None
+    if last and last > 1:
+        response = yield from fan_out(fetch, response, last, workers)
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    pending = None
+    try:
+        while True:
+            next_link = response.links.get('next')
+            if next_link and executor:
+                pending = executor.submit(fetch, next_link['url'])
+            yield response
+            if not next_link:
+                return
+            response = pending.result() if pending else fetch(next_link['url'])
+            pending = None
+    finally:
+        # The caller stopped early: drop a prefetch that has not started
+        if pending:
+            pending.cancel()
+        if executor:
+            executor.shutdown(wait=False)
+
+
+def fan_out(fetch: Callable[[str], object], first, last: int, workers: int):
+    """Yield pages 1..last-1 with up to `workers` requests in flight, then return the last page's response.
+
+    Only a bounded window of pages is fetched ahead, so memory stays flat however long the listing is.
+    """
+    urls = (page_url(first.links['last']['url'], page) for page in range(2, last + 1))
+    window = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for next_url in urls:
+                window.append(executor.submit(fetch, next_url))
+                if len(window) >= workers:
+                    break
+            yield first
+            while window:
+                response = window.popleft().result()
+                next_url = next(urls, None)
+                if next_url:
+                    window.append(executor.submit(fetch, next_url))
+                if not window:
+                    # The last page is followed through rel="next" in case issues were added meanwhile
+                    return response
+                yield response
+        finally:
+            for future in window:
+                future.cancel()
+
+
+def iter_issues(fetch: Callable[[str], object], url: str, prefetch: bool = True,
+                workers: int = PAGE_WORKERS) -> Iterator[IssueRecord]:
+    """Yield every issue of a paginated listing as a compact record."""
+    for response in iter_pages(fetch, url, prefetch, workers):
+        yield from records_from_page(response.json())
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo projection of the final league table for score_playoffs.py.
+A player scores for every completed game their label is on, so what is still
+uncertain is which of the open, picked games will actually be played: that
+depends only on how long each unfinished series runs. Each simulation draws
+every series' final length (every game a coin flip, conditioned on the games
+already played, which may have decided it already), marks the picked games
+it reaches as played and adds their round's points to the current totals.
+Simulations are run in chunks of NumPy arrays, identical outcomes within a
+chunk are scored once, and chunks can be spread over a process pool within a
+time budget.
+"""
+
+import os
+import time
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from math import comb
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from bracket_model import Bracket, placed_key
+from issue_records import key_season
+
+PROJECTION_SIMULATIONS = int(os.environ.get('PROJECTION_SIMULATIONS', '1000000'))
+# Simulations per chunk; bounds the chunk's outcomes x players score matrix
+PROJECTION_CHUNK = int(os.environ.get('PROJECTION_CHUNK', '8192'))
+# Seconds after which no more chunks are started
+PROJECTION_BUDGET = float(os.environ.get('PROJECTION_BUDGET', '60'))
+PROJECTION_WORKERS = int(os.environ.get('PROJECTION_WORKERS', '1'))
+
+
+class UnplacedGames(ValueError):
+    """Open picked games whose issue key cannot be placed in the bracket."""
+
+    def __init__(self, keys: List[str]):
+        super().__init__(f"{len(keys)} open picked game(s) cannot be placed in the bracket: {', '.join(keys)}")
+        self.keys = keys
+
+
+def length_distribution(best_of: int, played: int):
+    """Possible final lengths of a series that has reached game `played`, and their probabilities.
+
+    Once `played` games could have decided it, the series may already be over:
+    `played` itself is a possible length, weighted against the series still
+    being undecided after it.
+    """
+    need = best_of // 2 + 1
+    lengths = [length for length in range(max(need, played), best_of + 1)]
+    # Either team can take the deciding game: 2 * C(length - 1, need - 1) / 2^length
+    weights = [2 * comb(length - 1, need - 1) / 2 ** length for length in lengths]
+    total = sum(weights)
+    return lengths, [weight / total for weight in weights]
+
+
+class ProjectionModel:
+    """Current totals, each open picked game's series and points per player, and each series' length distribution.
+
+    Only the latest season's games are modelled; crawled games are placed in
+    the bracket by their slot. Raises UnplacedGames when an open picked game
+    cannot be placed, since leaving it out would understate its pickers.
+    """
+
+    def __init__(self, games: Iterable[Dict], totals: Dict[str, int], series_points: Dict[str, int]):
+        bracket = Bracket()
+        games = [{**game, 'key': placed_key(game['key']) or game['key'],
+                  'placed': placed_key(game['key']) is not None} for game in games]
+        # Earlier seasons are over; their points are already in the totals
+        season = max((key_season(game['key']) or 0 for game in games), default=0)
+        games = [game for game in games if key_season(game['key']) in (season, None)]
+        unplaced = sorted(game['key'] for game in games
+                          if game['status'] == 'open' and game['players'] and game['series'] in series_points
+                          and not (game['placed'] and bracket.series_for(game['key'])))
+        if unplaced:
+            raise UnplacedGames(unplaced)
+
+        played: Dict[str, int] = {}
+        decided = set()
+        for game in games:
+            series = bracket.series_for(game['key']) if game['placed'] else None
+            if not series:
+                continue
+            game_num = int(game['key'].rsplit('-G', 1)[1])
+            if game['status'] == 'played':
+                played[series.key] = max(played.get(series.key, 0), game_num)
+            elif game['status'] == 'pruned':
+                # generate_bracket.py only prunes games of a decided series
+                decided.add(series.key)
+
+        open_games = [game for game in games
+                      if game['status'] == 'open' and game['players'] and game['series'] in series_points]
+        names = list(totals)
+        for game in open_games:
+            for label in game['players']:
+                name = label.replace('player:', '')
+                if name not in totals and name not in names:
+                    names.append(name)
+        self.players = names
+        player_index = {name: index for index, name in enumerate(names)}
+        self.base = np.array([totals.get(name, 0) for name in names], dtype=np.float32)
+
+        # Only series with an open picked game need simulating
+        series_keys = sorted({bracket.series_for(game['key']).key for game in open_games})
+        series_index = {key: index for index, key in enumerate(series_keys)}
+        self.lengths = []
+        # Series whose last possible game is closed though nothing was pruned (games closed out of order)
+        self.settled: List[str] = []
+        for key in series_keys:
+            series = bracket.series[key]
+            if key in decided:
+                self.lengths.append(([played.get(key, 0)], [1.0]))
+            elif played.get(key, 0) >= series.best_of:
+                self.settled.append(key)
+                self.lengths.append(([series.best_of], [1.0]))
+            else:
+                self.lengths.append(length_distribution(series.best_of, played.get(key, 0)))
+
+        self.game_series = np.array([series_index[bracket.series_for(game['key']).key] for game in open_games],
+                                    dtype=np.int64)
+        self.game_nums = np.array([int(game['key'].rsplit('-G', 1)[1]) for game in open_games], dtype=np.int64)
+        self.weights = np.zeros((len(open_games), len(names)), dtype=np.float32)
+        for row, game in enumerate(open_games):
+            for label in game['players']:
+                self.weights[row, player_index[label.replace('player:', '')]] = series_points[game['series']]
+
+    def fingerprint(self) -> int:
+        """Seed derived from the inputs, so an unchanged pool projects to the same table."""
+        digest = hashlib.sha256()
+        for array in (self.base, self.game_series, self.game_nums, self.weights):
+            digest.update(array.tobytes())
+        digest.update(repr((self.players, self.lengths)).encode())
+        return int.from_bytes(digest.digest()[:8], 'little')
+
+
+def simulate_chunk(model: ProjectionModel, seed: int, chunk: int, size: int):
+    """Run `size` simulations; returns first-place shares per player and play counts per open game."""
+    rng = np.random.default_rng([seed, chunk])
+    num_games = len(model.game_nums)
+    lengths = np.empty((size, len(model.lengths)), dtype=np.int64)
+    for column, (support, probabilities) in enumerate(model.lengths):
+        lengths[:, column] = rng.choice(support, size=size, p=probabilities)
+    played = model.game_nums[None, :] <= lengths[:, model.game_series]
+
+    # Few series left means few distinct outcomes: score each one once, weighted by how often it came up
+    if num_games:
+        packed = np.packbits(played, axis=1)
+        _, first_rows, counts = np.unique(packed, axis=0, return_index=True, return_counts=True)
+        outcomes = played[first_rows]
+    else:
+        outcomes, counts = played[:1], np.array([size])
+
+    scores = model.base[None, :] + outcomes.astype(np.float32) @ model.weights
+    leaders = scores >= scores.max(axis=1, keepdims=True)
+    # Tied leaders share the first place
+    shares = counts / leaders.sum(axis=1)
+    return shares @ leaders, counts @ outcomes, size
+
+
+_worker_model: Optional[ProjectionModel] = None
+
+
+def _init_worker(model: ProjectionModel):
+    global _worker_model
+    _worker_model = model
+
+
+def _simulate_in_worker(seed: int, chunk: int, size: int):
+    return simulate_chunk(_worker_model, seed, chunk, size)
+
+
+def project(games: Iterable[Dict], totals: Dict[str, int], series_points: Dict[str, int],
+            simulations: int = PROJECTION_SIMULATIONS, workers: int = PROJECTION_WORKERS,
+            budget: float = PROJECTION_BUDGET, chunk_size: int = PROJECTION_CHUNK) -> Dict:
+    """Project each player's chance of finishing first and expected final points.
+
+    `games` are the per-issue game records ({'key', 'status', 'series',
+    'players'}) and `totals` the current points. Stops starting chunks once
+    `budget` seconds have passed, so fewer simulations may be run.
+    """
+    if np is None:
+        raise RuntimeError('projections need numpy')
+    started = time.monotonic()
+    model = ProjectionModel(games, totals, series_points)
+    if not model.players:
+        return {'players': {}, 'simulations': 0, 'open_games': 0, 'settled': model.settled,
+                'seconds': time.monotonic() - started}
+    seed = model.fingerprint()
+    # Without open picks the table is final and one simulation says everything
+    simulations = simulations if len(model.game_nums) else 1
+    sizes = [min(chunk_size, simulations - start) for start in range(0, simulations, chunk_size)]
+
+    first = np.zeros(len(model.players))
+    plays = np.zeros(len(model.game_nums))
+    run = 0
+
+    def add(result):
+        nonlocal first, plays, run
+        first = first + result[0]
+        plays = plays + result[1]
+        run += result[2]
+
+    if workers <= 1:
+        for chunk, size in enumerate(sizes):
+            if chunk and time.monotonic() - started > budget:
+                break
+            add(simulate_chunk(model, seed, chunk, size))
+    else:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker,
+                                 initargs=(model,)) as executor:
+            # One wave per worker count, so the budget is checked between waves
+            for wave in range(0, len(sizes), workers):
+                if wave and time.monotonic() - started > budget:
+                    break
+                futures = [executor.submit(_simulate_in_worker, seed, chunk, sizes[chunk])
+                           for chunk in range(wave, min(wave + workers, len(sizes)))]
+                for future in futures:
+                    add(future.result())
+
+    expected = model.base + (plays / run) @ model.weights
+    players = {name: {'first': float(first[index] / run), 'expected': float(expected[index])}
+               for index, name in enumerate(model.players)}
+    return {'players': players, 'simulations': run, 'open_games': len(model.game_nums),
+            'settled': model.settled, 'seconds': time.monotonic() - started}
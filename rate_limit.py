@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Rate-limit-aware request scheduler shared by the bracket scripts.
+Writes are paced with a token bucket, 403/429 rate-limit responses are retried
+after Retry-After / X-RateLimit-Reset or an exponential backoff, and retried
+creates are rechecked first so they never produce duplicates.
+"""
+
+import os
+import time
+import random
+import threading
+from typing import Callable, Optional
+
+import requests
+
+# GitHub asks for about one second between content-creating requests
+WRITE_RATE = float(os.environ.get('WRITE_RATE', '1.0'))
+WRITE_BURST = int(os.environ.get('WRITE_BURST', '1'))
+MAX_RETRIES = int(os.environ.get('MAX_RETRIES', '5'))
+# Longest single wait for a rate-limit reset before giving up on a request
+RATE_LIMIT_MAX_WAIT = float(os.environ.get('RATE_LIMIT_MAX_WAIT', '900'))
+
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'}
+SERVER_ERRORS = {500, 502, 503, 504}
+
+
+class RequestScheduler:
+    """Paces writes with a token bucket and backs off on primary and secondary rate limits."""
+
+    def __init__(self, session: requests.Session, write_rate: float = WRITE_RATE, write_burst: int = WRITE_BURST,
+                 max_retries: int = MAX_RETRIES, max_wait: float = RATE_LIMIT_MAX_WAIT):
+        self.session = session
+        self.write_rate = write_rate
+        self.write_burst = max(1, write_burst)
+        self.max_retries = max_retries
+        self.max_wait = max_wait
+        self.tokens = float(self.write_burst)
+        self.last_refill = time.monotonic()
+        self.paused_until = 0.0
+        self.throttled_seconds = 0.0
+        self.retries = 0
+        self.rate_limited = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def wait(self, seconds: float):
+        """Sleep for a throttling delay and account for it."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self.throttled_seconds += seconds
+        time.sleep(seconds)
+
+    def take_write_token(self):
+        """Block until the token bucket allows another write."""
+        if self.write_rate <= 0:
+            return
+        with self._write_lock:
+            now = time.monotonic()
+            self.tokens = min(self.write_burst, self.tokens + (now - self.last_refill) * self.write_rate)
+            self.last_refill = now
+            if self.tokens < 1:
+                delay = (1 - self.tokens) / self.write_rate
+                self.wait(delay)
+                self.last_refill = time.monotonic()
+                self.tokens = 1.0
+            self.tokens -= 1
+
+    def observe(self, response: requests.Response):
+        """Pause further requests when the primary rate limit is exhausted."""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining == '0' and reset:
+            delay = min(float(reset) - time.time() + 1, self.max_wait)
+            with self._lock:
+                self.paused_until = max(self.paused_until, time.monotonic() + delay)
+
+    def retry_delay(self, response: requests.Response, attempt: int, idempotent: bool) -> Optional[float]:
+        """Seconds to wait before retrying this response, or None if it should not be retried."""
+        status = response.status_code
+        if status in (403, 429):
+            retry_after = response.headers.get('Retry-After')
+            remaining = response.headers.get('X-RateLimit-Remaining')
+            reset = response.headers.get('X-RateLimit-Reset')
+            if retry_after:
+                return float(retry_after)
+            if remaining == '0' and reset:
+                return max(float(reset) - time.time() + 1, 1.0)
+            if status == 429 or 'rate limit' in response.text.lower():
+                # Secondary limit without Retry-After: wait at least a minute, then back off
+                return 60.0 * (2 ** attempt)
+            return None
+        if status in SERVER_ERRORS and idempotent:
+            return 2.0 ** attempt + random.random()
+        return None
+
+    def request(self, method: str, url: str, exists: Optional[Callable[[], object]] = None, **kwargs):
+        """Send a request through the scheduler.
+
+        For creates, `exists` rechecks (by title, key or name) whether an earlier
+        attempt already succeeded; its truthy result is returned instead of re-sending.
+        Non-idempotent requests without `exists` are only retried on rate-limit
+        rejections, which GitHub returns before doing any work.
+        """
+        method = method.upper()
+        is_write = method not in ('GET', 'HEAD', 'OPTIONS')
+        idempotent = method in IDEMPOTENT_METHODS or exists is not None
+        attempt = 0
+
+        while True:
+            with self._lock:
+                pause = self.paused_until - time.monotonic()
+            self.wait(pause)
+
+            if attempt and exists is not None:
+                existing = exists()
+                if existing:
+                    return existing
+
+            if is_write:
+                self.take_write_token()
+
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if not idempotent or attempt >= self.max_retries:
+                    raise
+                self.count_retry()
+                self.wait(2.0 ** attempt + random.random())
+                attempt += 1
+                continue
+
+            self.observe(response)
+            delay = self.retry_delay(response, attempt, idempotent)
+            if delay is None or attempt >= self.max_retries or delay > self.max_wait:
+                return response
+
+            if response.status_code in (403, 429):
+                with self._lock:
+                    self.rate_limited += 1
+            self.count_retry()
+            self.wait(delay)
+            attempt += 1
+
+    def count_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def get(self, url: str, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url: str, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def patch(self, url: str, **kwargs):
+        return self.request('PATCH', url, **kwargs)
+
+    def delete(self, url: str, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def summary(self) -> str:
+        """One-line throttling summary."""
+        return (f"{self.throttled_seconds:.1f}s throttled, {self.retries} retr{'y' if self.retries == 1 else 'ies'}, "
+                f"{self.rate_limited} rate-limit response(s)")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+README publishing shared by the bracket scripts.
+Each script owns a marked section of README.md and renders it into whatever
+the branch currently holds, so the generator's bracket and the scorer's league
+table no longer overwrite each other. Unchanged READMEs are not written at all;
+changed ones are committed through the git data API (tree, commit, ref update)
+and a ref update that lost a race is re-rendered on the new head and retried.
+"""
+
+import os
+import re
+import random
+import base64
+from typing import Callable, Optional
+
+from transport import GITHUB_API_URL
+
+README_PATH = 'README.md'
+README_BRANCH = os.environ.get('README_BRANCH', 'main')
+# Attempts at committing when another run moves the branch in between
+PUBLISH_RETRIES = int(os.environ.get('PUBLISH_RETRIES', '5'))
+
+
+def section_markers(name: str):
+    """Opening and closing HTML comments around a named README section."""
+    return f'<!-- section:{name} -->', f'<!-- /section:{name} -->'
+
+
+def section_pattern(name: str):
+    start, end = section_markers(name)
+    return re.compile(re.escape(start) + r'\n.*?' + re.escape(end) + r'\n?', re.DOTALL)
+
+
+def get_section(document: str, name: str) -> Optional[str]:
+    """The marked section (markers included) in a document, if present."""
+    match = section_pattern(name).search(document)
+    return match.group(0) if match else None
+
+
+def set_section(document: str, name: str, text: str) -> str:
+    """Replace a marked section, or insert it after the document's title when it is missing."""
+    start, end = section_markers(name)
+    block = f'{start}\n{text.strip()}\n{end}\n'
+    pattern = section_pattern(name)
+    if pattern.search(document):
+        return pattern.sub(lambda match: block, document, count=1)
+
+    lines = document.split('\n')
+    if lines[0].startswith('#'):
+        return '\n'.join([lines[0], '', block.rstrip('\n')] + lines[1:])
+    return f'{block}\n{document}'
+
+
+def keep_sections(current: str, document: str, *names: str) -> str:
+    """Carry sections owned by another script from the current README into a freshly rendered one."""
+    for name in names:
+        section = get_section(current, name)
+        if section:
+            start, end = section_markers(name)
+            document = set_section(document, name, section[len(start):].rsplit(end, 1)[0])
+    return document
+
+
+class ConflictError(Exception):
+    """The branch moved while a README commit was being prepared."""
+
+
+class ReadmePublisher:
+    """Commits README.md changes for one repository through the git data API."""
+
+    def __init__(self, scheduler, headers, repo: str, branch: str = README_BRANCH,
+                 on_request: Optional[Callable[[str], None]] = None):
+        self.scheduler = scheduler
+        self.headers = headers
+        self.url = f'{GITHUB_API_URL}/repos/{repo}'
+        self.branch = branch
+        # Called with a description before each API request, for scripts that count them
+        self.on_request = on_request or (lambda description: None)
+
+    def call(self, description: str, method: str, path: str, **kwargs):
+        self.on_request(description)
+        return self.scheduler.request(method, f'{self.url}/{path}', headers=self.headers, **kwargs)
+
+    def read(self):
+        """Head commit SHA, its tree SHA and the README text at that commit."""
+        response = self.call(f'Reading {self.branch} head', 'GET', f'git/ref/heads/{self.branch}')
+        response.raise_for_status()
+        head = response.json()['object']['sha']
+
+        response = self.call('Reading head commit', 'GET', f'git/commits/{head}')
+        response.raise_for_status()
+        tree = response.json()['tree']['sha']
+
+        response = self.call(f'Fetching current {README_PATH}', 'GET', f'contents/{README_PATH}', params={'ref': head})
+        if response.status_code == 404:
+            return head, tree, ''
+        response.raise_for_status()
+        return head, tree, base64.b64decode(response.json()['content']).decode()
+
+    def commit(self, head: str, tree: str, content: str, message: str) -> str:
+        """Commit new README content on top of `head` and move the branch to it."""
+        entry = {'path': README_PATH, 'mode': '100644', 'type': 'blob', 'content': content}
+        response = self.call(f'Writing {README_PATH} tree', 'POST', 'git/trees', json={'base_tree': tree, 'tree': [entry]})
+        response.raise_for_status()
+        new_tree = response.json()['sha']
+
+        response = self.call('Creating commit', 'POST', 'git/commits',
+                             json={'message': message, 'tree': new_tree, 'parents': [head]})
+        response.raise_for_status()
+        new_commit = response.json()['sha']
+
+        response = self.call(f'Moving {self.branch}', 'PATCH', f'git/refs/heads/{self.branch}',
+                             json={'sha': new_commit, 'force': False})
+        # A ref update that is not a fast-forward means another run committed first
+        if response.status_code in (409, 422):
+            raise ConflictError(response.json().get('message', 'not a fast forward'))
+        response.raise_for_status()
+        return new_commit
+
+    def publish(self, render: Callable[[str], str], message: str) -> Optional[str]:
+        """Render the README from its current content and commit it if it changed.
+
+        Returns the new commit SHA, or None when there was nothing to write.
+        """
+        attempt = 1
+        while True:
+            head, tree, current = self.read()
+            content = render(current)
+            if content == current:
+                return None
+            try:
+                return self.commit(head, tree, content, message)
+            except ConflictError:
+                if attempt >= PUBLISH_RETRIES:
+                    raise
+                # Jitter so runs that collided do not collide again
+                self.scheduler.wait(random.uniform(0.5, 1.0) * attempt)
+                attempt += 1
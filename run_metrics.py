@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Run metrics shared by the bracket scripts.
+Each script times its phases (listing, crawl, parse, create, README, ...)
+with spans, and every response on its session is recorded per endpoint: a
+latency histogram, bytes sent and received and error responses. Retries and
+throttling come from the request scheduler, and scripts add their own
+counters. When METRICS_DIR is set, a run ends by writing <script>.json (kept
+as a workflow artifact) and <script>.prom for a Prometheus textfile collector.
+"""
+
+import os
+import re
+import json
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+# Where <script>.json and <script>.prom are written (empty disables the files)
+METRICS_DIR = os.environ.get('METRICS_DIR', '')
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+SHA_PATTERN = re.compile(r'^[0-9a-f]{40}$')
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
+def endpoint(method: str, url: str) -> str:
+    """Method, host and path template of a request, e.g. 'GET api.github.com/repos/{owner}/{repo}/issues'."""
+    parsed = urlparse(url)
+    segments = [segment for segment in parsed.path.split('/') if segment]
+    template = []
+    for index, segment in enumerate(segments):
+        previous = segments[index - 1] if index else ''
+        if index in (1, 2) and segments[0] == 'repos':
+            template.append('{owner}' if index == 1 else '{repo}')
+        elif segment.isdigit():
+            template.append('{number}')
+        elif SHA_PATTERN.match(segment):
+            template.append('{sha}')
+        elif DATE_PATTERN.match(segment):
+            template.append('{date}')
+        elif DATE_PATTERN.match(previous):
+            template.append('{game}')
+        elif previous in ('labels', 'heads', 'runs', 'workflows', 'contents'):
+            template.append('{name}')
+        else:
+            template.append(segment)
+    return f"{method} {parsed.netloc}/{'/'.join(template)}"
+
+
+def escape(value) -> str:
+    """A Prometheus label value."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _add(target: Dict, source: Dict, sign: int = 1):
+    """Add (or subtract) nested counts from a snapshot section into another."""
+    for key, value in source.items():
+        if isinstance(value, dict):
+            _add(target.setdefault(key, {}), value, sign)
+        else:
+            target[key] = target.get(key, 0) + sign * value
+
+
+class RunMetrics:
+    """Phase spans, per-endpoint HTTP metrics and counters for one script run."""
+
+    def __init__(self, script: str):
+        self.script = script
+        self.started_at = time.time()
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.http: Dict[str, Dict] = {}
+        self.counters: Dict[str, float] = {}
+        self.scheduler = None
+        self._lock = threading.Lock()
+
+    def instrument(self, session, scheduler=None):
+        """Record every response on a requests session, and read retries and throttling from its scheduler."""
+        session.hooks['response'].append(self.observe_response)
+        self.scheduler = scheduler
+
+    @contextmanager
+    def span(self, phase: str) -> Iterator[None]:
+        """Time a phase; repeated and concurrent spans of a phase add up."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                entry = self.phases.setdefault(phase, {'count': 0, 'seconds': 0.0})
+                entry['count'] += 1
+                entry['seconds'] += elapsed
+
+    def count(self, name: str, amount: float = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def set_counters(self, counters: Dict[str, float], prefix: str = ''):
+        """Set counters kept elsewhere (a script's stats, a cache's hit counts)."""
+        with self._lock:
+            for name, value in counters.items():
+                self.counters[f'{prefix}{name}'] = value
+
+    def observe_response(self, response, *args, **kwargs):
+        """requests response hook."""
+        request = response.request
+        body = request.body or b''
+        # Hooks run before the session reads the body, so the download is timed here
+        started = time.perf_counter()
+        received = 0 if kwargs.get('stream') else len(response.content)
+        seconds = response.elapsed.total_seconds() + time.perf_counter() - started
+        key = endpoint(request.method, request.url)
+        with self._lock:
+            entry = self.http.get(key)
+            if entry is None:
+                entry = self.http[key] = {'count': 0, 'seconds': 0.0, 'errors': 0, 'bytes_in': 0, 'bytes_out': 0,
+                                          'buckets': {str(bound): 0 for bound in LATENCY_BUCKETS}}
+            entry['count'] += 1
+            entry['seconds'] += seconds
+            entry['errors'] += response.status_code >= 400
+            entry['bytes_out'] += len(body)
+            entry['bytes_in'] += received
+            for bound in LATENCY_BUCKETS:
+                if seconds <= bound:
+                    entry['buckets'][str(bound)] += 1
+        return response
+
+    def snapshot(self) -> Dict:
+        """Everything recorded so far as plain data."""
+        with self._lock:
+            data = json.loads(json.dumps({'phases': self.phases, 'http': self.http, 'counters': self.counters}))
+        if self.scheduler is not None:
+            data['counters'].update({'retries': self.scheduler.retries, 'rate_limited': self.scheduler.rate_limited,
+                                     'throttled_seconds': round(self.scheduler.throttled_seconds, 3)})
+        return {'script': self.script, 'started_at': self.started_at,
+                'duration_seconds': time.time() - self.started_at, **data}
+
+    def delta(self, before: Dict) -> Dict:
+        """What was recorded since an earlier snapshot (for worker processes to hand back)."""
+        current = self.snapshot()
+        for section in ('phases', 'http', 'counters'):
+            _add(current[section], before[section], -1)
+        return current
+
+    def merge(self, other: Dict):
+        """Fold in a snapshot or delta from another process."""
+        with self._lock:
+            _add(self.phases, other['phases'])
+            _add(self.http, other['http'])
+            _add(self.counters, {name: value for name, value in other['counters'].items()
+                                 if name not in ('retries', 'rate_limited', 'throttled_seconds')})
+
+    def phase_summary(self, limit: int = 5) -> str:
+        """The slowest phases, e.g. 'crawl 12.3s, create 4.1s'."""
+        with self._lock:
+            phases = sorted(self.phases.items(), key=lambda item: item[1]['seconds'], reverse=True)[:limit]
+        return ', '.join(f"{phase} {entry['seconds']:.1f}s" for phase, entry in phases) or 'none'
+
+    def prometheus(self, snapshot: Optional[Dict] = None) -> str:
+        """The snapshot in Prometheus text exposition format."""
+        data = snapshot or self.snapshot()
+        script = data['script']
+        lines = []
+
+        def metric(name: str, kind: str, help_text: str, samples):
+            lines.append(f'# HELP bracket_{name} {help_text}')
+            lines.append(f'# TYPE bracket_{name} {kind}')
+            for suffix, labels, value in samples:
+                rendered = ','.join(f'{key}="{escape(val)}"' for key, val in {'script': script, **labels}.items())
+                number = value if isinstance(value, int) else round(float(value), 6)
+                lines.append(f'bracket_{name}{suffix}{{{rendered}}} {number}')
+
+        metric('run_duration_seconds', 'gauge', 'Wall time of the last run.',
+               [('', {}, data['duration_seconds'])])
+        metric('run_timestamp_seconds', 'gauge', 'Start of the last run (Unix time).',
+               [('', {}, data['started_at'])])
+        metric('phase_seconds', 'gauge', 'Time spent in each phase, summed over concurrent spans.',
+               [('', {'phase': phase}, entry['seconds']) for phase, entry in sorted(data['phases'].items())])
+        metric('phase_spans', 'gauge', 'Spans recorded for each phase.',
+               [('', {'phase': phase}, entry['count']) for phase, entry in sorted(data['phases'].items())])
+
+        histogram = []
+        for key, entry in sorted(data['http'].items()):
+            for bound in LATENCY_BUCKETS:
+                histogram.append(('_bucket', {'endpoint': key, 'le': bound}, entry['buckets'][str(bound)]))
+            histogram.append(('_bucket', {'endpoint': key, 'le': '+Inf'}, entry['count']))
+            histogram.append(('_sum', {'endpoint': key}, entry['seconds']))
+            histogram.append(('_count', {'endpoint': key}, entry['count']))
+        metric('http_request_duration_seconds', 'histogram', 'Response latency per endpoint.', histogram)
+        for field, help_text in (('errors', 'Responses with a 4xx or 5xx status.'),
+                                 ('bytes_in', 'Response body bytes received.'),
+                                 ('bytes_out', 'Request body bytes sent.')):
+            metric(f'http_{field}', 'gauge', help_text,
+                   [('', {'endpoint': key}, entry[field]) for key, entry in sorted(data['http'].items())])
+        metric('counter', 'gauge', 'Script counters (stats, cache hits, retries, throttling).',
+               [('', {'name': name}, value) for name, value in sorted(data['counters'].items())])
+        return '\n'.join(lines) + '\n'
+
+    def write(self, directory: str = METRICS_DIR) -> Optional[str]:
+        """Write <script>.json and <script>.prom to `directory`; returns the JSON path, or None when disabled."""
+        if not directory:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        snapshot = self.snapshot()
+        base = os.path.join(directory, self.script)
+        for path, content in ((f'{base}.json', json.dumps(snapshot, indent=1, sort_keys=True)),
+                              (f'{base}.prom', self.prometheus(snapshot))):
+            # The textfile collector may read at any time, so files are replaced whole
+            tmp_path = f'{path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        return f'{base}.json'
@@ -5,21 +5,43 @@ Points are awarded based on series round and game wins.
 """
 
 import os
+import re
 import sys
-from collections import defaultdict
+import json
+import argparse
 from datetime import datetime
-import requests
+
+from elimination import outlook
+from http_cache import HttpCache
+from issue_records import IssueRecord, key_season
+from pagination import PAGE_WORKERS, iter_issues
+from projection import PROJECTION_BUDGET, PROJECTION_SIMULATIONS, PROJECTION_WORKERS, UnplacedGames, project
+from rate_limit import RequestScheduler
+from readme_publisher import ReadmePublisher, keep_sections
+from run_metrics import RunMetrics
+from scoring_engine import score_contributions, score_issues
+from tenants import REPO_WORKERS, run_for_repositories
+from transport import GITHUB_API_URL, create_session
 
 GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
 REPO_OWNER = 'oraweb'
 REPO_NAME = 'world-series-bracket'
-BASE_URL = f'https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}'
+REPO = f'{REPO_OWNER}/{REPO_NAME}'
 
 HEADERS = {
     'Authorization': f'token {GITHUB_TOKEN}',
     'Accept': 'application/vnd.github.v3+json'
 }
 
+SESSION = create_session()
+SCHEDULER = RequestScheduler(SESSION)
+
+METRICS = RunMetrics('score_playoffs')
+METRICS.instrument(SESSION, SCHEDULER)
+
+# Conditional-request cache for issue listings (enabled when HTTP_CACHE_DIR is set)
+HTTP_CACHE = HttpCache(os.environ.get('HTTP_CACHE_DIR'))
+
 # Scoring system
 SERIES_POINTS = {
     'series:wc': 1,   # Wild Card
@@ -28,68 +50,221 @@ SERIES_POINTS = {
     'series:ws': 4    # World Series
 }
 
-def get_all_issues():
-    """Fetch all issues (games) from the repository."""
-    issues = []
-    page = 1
-    
-    while True:
-        url = f"{BASE_URL}/issues?state=all&per_page=100&page={page}"
-        response = requests.get(url, headers=HEADERS)
-        response.raise_for_status()
-        
-        page_issues = response.json()
-        if not page_issues:
-            break;
-            
-        issues.extend(page_issues)
-        page += 1;
-    
-    return issues;
+# League table timestamp, ignored when deciding whether the README changed
+LAST_UPDATED_PATTERN = re.compile(r'\*\*Last Updated\*\*: [^\n]*');
+
+# Persisted score state for incremental runs
+SCORE_STATE_PATH = os.environ.get('SCORE_STATE_PATH', '.bracket-state/scores.json')
+
+# Workflow run statuses that mean a run has not finished yet
+PENDING_RUN_STATUSES = {'requested', 'waiting', 'pending', 'queued', 'in_progress'}
+
+def repo_url(repo):
+    """REST API base URL for an owner/name repository."""
+    return f'{GITHUB_API_URL}/repos/{repo}';
+
+def fetch_issues_page(url):
+    """GET one page of an issue listing."""
+    response = HTTP_CACHE.get(SCHEDULER, url, headers=HEADERS);
+    response.raise_for_status();
+    return response;
+
+def get_all_issues(since=None, repo=REPO, page_workers=PAGE_WORKERS):
+    """Stream all issues (games) as compact records, optionally only those updated since a timestamp."""
+    since_param = f"&since={since}" if since else "";
+    url = f"{repo_url(repo)}/issues?state=all&per_page=100{since_param}";
+    return iter_issues(fetch_issues_page, url, workers=page_workers);
 
 def extract_series_label(labels):
-    """Extract the series label from issue labels."""
+    """Extract the series label from issue label names."""
     for label in labels:
-        if label['name'].startswith('series:'):
-            return label['name']
+        if label.startswith('series:'):
+            return label
     return None;
 
 def extract_player_labels(labels):
-    """Extract all player labels from issue labels."""
-    return [label['name'] for label in labels if label['name'].startswith('player:')];
+    """Extract all player labels from issue label names."""
+    return [label for label in labels if label.startswith('player:')];
+
+def issue_contribution(issue):
+    """Return the series label and player labels a scored issue contributes, or None."""
+    # Only count closed issues (completed games); games closed as not needed were never played
+    if issue.state != 'closed' or issue.state_reason == 'not_planned':
+        return None;
+    
+    labels = issue.labels;
+    series_label = extract_series_label(labels);
+    player_labels = extract_player_labels(labels);
+    
+    if not series_label or not player_labels:
+        return None;
+    
+    return {'series': series_label, 'players': player_labels};
+
+def game_record(issue):
+    """Return the bracket game a marked issue stands for, its status and picks, or None."""
+    if not issue.matchup_key:
+        return None;
+    
+    if issue.state != 'closed':
+        status = 'open';
+    elif issue.state_reason == 'not_planned':
+        status = 'pruned';
+    else:
+        status = 'played';
+    
+    labels = issue.labels;
+    return {
+        'key': issue.matchup_key,
+        'status': status,
+        'series': extract_series_label(labels),
+        'players': extract_player_labels(labels)
+    };
+
+def scores_from_contributions(contributions):
+    """Aggregate per-issue contributions into player scores."""
+    return score_contributions(contributions, SERIES_POINTS);
 
 def calculate_scores(issues):
-    """Calculate player scores based on closed issues."""
-    player_scores = defaultdict(lambda: {'total': 0, 'wc': 0, 'ds': 0, 'cs': 0, 'ws': 0, 'games': 0})
+    """Calculate player scores based on closed issues (see scoring_engine)."""
+    return score_issues(issues, SERIES_POINTS);
+
+def utc_timestamp():
+    """Current UTC time in the ISO 8601 format GitHub expects for since=."""
+    return datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ');
+
+def load_score_state(path=SCORE_STATE_PATH):
+    """Load the persisted score state, or None if there is none."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            state = json.load(f);
+    except (OSError, ValueError):
+        return None;
+    
+    if 'last_synced' not in state or 'issues' not in state:
+        return None;
+    # State saved before game records were kept, or before their keys carried the season, is rebuilt once
+    if any('game' not in entry or entry['game'] and key_season(entry['game']['key']) is None
+           for entry in state['issues'].values()):
+        return None;
+    return state;
+
+def save_score_state(state, path=SCORE_STATE_PATH):
+    """Persist the score state."""
+    directory = os.path.dirname(path);
+    if directory:
+        os.makedirs(directory, exist_ok=True);
     
+    tmp_path = f"{path}.tmp";
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f);
+    os.replace(tmp_path, path);
+
+def apply_issue_updates(state, issues):
+    """Record each issue's contribution in the state, skipping snapshots older than the stored one."""
+    applied = 0;
     for issue in issues:
-        # Only count closed issues (completed games)
-        if issue['state'] != 'closed':
+        key = str(issue.number);
+        stored = state['issues'].get(key);
+        if stored and stored['updated_at'] > issue.updated_at:
             continue;
         
-        labels = issue['labels'];
-        series_label = extract_series_label(labels);
-        player_labels = extract_player_labels(labels);
-        
-        if not series_label or not player_labels:
-            continue;
-        
-        points = SERIES_POINTS.get(series_label, 0);
-        series_short = series_label.split(':')[1];  # wc, ds, cs, ws
-        
-        # Award points to each player who labeled this game
-        for player_label in player_labels:
-            player_name = player_label.replace('player:', '');
-            player_scores[player_name]['total'] += points;
-            player_scores[player_name][series_short] += points;
-            player_scores[player_name]['games'] += 1;
+        state['issues'][key] = {
+            'updated_at': issue.updated_at,
+            'contribution': issue_contribution(issue),
+            'game': game_record(issue)
+        };
+        applied += 1;
+    return applied;
+
+def scores_from_state(state):
+    """Calculate player scores from the per-issue contributions in the state."""
+    contributions = (entry['contribution'] for entry in state['issues'].values());
+    return scores_from_contributions(c for c in contributions if c);
+
+def build_score_state(issues, synced_at):
+    """Build a fresh score state from a full issue listing."""
+    state = {'last_synced': synced_at, 'issues': {}};
+    apply_issue_updates(state, issues);
+    return state;
+
+def get_event_issue(repo=REPO):
+    """Return the issue from the triggering event payload as a record, if there is one for this repository."""
+    event_path = os.environ.get('GITHUB_EVENT_PATH');
+    if not event_path:
+        return None;
+    
+    try:
+        with open(event_path, encoding='utf-8') as f:
+            event = json.load(f);
+    except (OSError, ValueError):
+        return None;
+    
+    event_repo = (event.get('repository') or {}).get('full_name');
+    if event_repo and event_repo != repo or not event.get('issue'):
+        return None;
+    return IssueRecord.from_payload(event['issue']);
+
+def newer_run_pending(repo=REPO):
+    """Whether a later run of this workflow is queued or running and will cover this run's event."""
+    run_id = os.environ.get('GITHUB_RUN_ID');
+    if not run_id or os.environ.get('GITHUB_REPOSITORY') != repo:
+        return False;
+    
+    response = SCHEDULER.get(f"{repo_url(repo)}/actions/runs/{run_id}", headers=HEADERS);
+    if response.status_code != 200:
+        return False;
+    workflow_id = response.json()['workflow_id'];
+    
+    response = SCHEDULER.get(f"{repo_url(repo)}/actions/workflows/{workflow_id}/runs?per_page=20", headers=HEADERS);
+    if response.status_code != 200:
+        return False;
+    return any(run['id'] > int(run_id) and run['status'] in PENDING_RUN_STATUSES
+               for run in response.json()['workflow_runs']);
+
+def coalesced_reason(state, repo=REPO):
+    """Why this run can stop early in --coalesce mode, or None if it has to score."""
+    event_issue = get_event_issue(repo);
+    if state and event_issue and event_issue.updated_at < state['last_synced']:
+        return f"issue #{event_issue.number} was already covered by the sync at {state['last_synced']}";
+    if newer_run_pending(repo):
+        return "a newer run is queued and will cover this event";
+    return None;
+
+def sync_score_state(state, repo=REPO, page_workers=PAGE_WORKERS, use_event=True):
+    """Apply only the changed issues to the state: the event's issue, then a since= delta."""
+    event_issue = get_event_issue(repo) if use_event else None;
+    if event_issue:
+        print(f"   Applying issue #{event_issue.number} from the triggering event");
+        apply_issue_updates(state, [event_issue]);
     
-    return player_scores;
+    # The delta also picks up events whose pending runs the concurrency group replaced
+    synced_at = utc_timestamp();
+    print(f"   Fetching issues updated since {state['last_synced']}");
+    changed = get_all_issues(since=state['last_synced'], repo=repo, page_workers=page_workers);
+    applied = apply_issue_updates(state, changed);
+    state['last_synced'] = synced_at;
+    print(f"   Applied {applied} changed issue(s)");
+
+def compare_scores(expected, actual):
+    """Return the players whose scores differ between two score tables."""
+    players = set(expected) | set(actual);
+    empty = {'total': 0, 'wc': 0, 'ds': 0, 'cs': 0, 'ws': 0, 'games': 0};
+    return sorted(p for p in players if dict(expected.get(p, empty)) != dict(actual.get(p, empty)));
 
-def generate_readme(player_scores):
-    """Generate the README.md content with league table."""
-    # Sort players by total score (descending)
-    sorted_players = sorted(player_scores.items(), key=lambda x: x[1]['total'], reverse=True);
+def generate_readme(player_scores, projection=None, limits=None):
+    """Generate the README.md content with league table, plus maximum points and projection columns when known."""
+    projected = projection['players'] if projection else {};
+    # Players with picks but no points yet can still finish first
+    empty = {'total': 0, 'wc': 0, 'ds': 0, 'cs': 0, 'ws': 0, 'games': 0};
+    player_scores = {**{player: empty for player in {**(limits or {}), **projected}}, **player_scores};
+    
+    # Sort players by total score (descending), then by projected points
+    sorted_players = sorted(player_scores.items(),
+                            key=lambda x: (x[1]['total'], projected.get(x[0], {}).get('expected', 0)), reverse=True);
+    
+    projection_header = (" Max |" if limits else "") + (" 1st % | Proj. |" if projection else "");
+    projection_rule = ("-----|" if limits else "") + ("-------|-------|" if projection else "");
     
     now = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC');
     
@@ -116,16 +291,30 @@ Track World Series baseball bracket games using GitHub issues following the 2025
 
 **Last Updated**: {now}
 
-| Rank | Player | Total Points | 🌟 WC | 🎯 DS | 🏅 CS | 🏆 WS | Games |
-|------|--------|--------------|-------|-------|-------|-------|-------|
+| Rank | Player | Total Points | 🌟 WC | 🎯 DS | 🏅 CS | 🏆 WS | Games |{projection_header}
+|------|--------|--------------|-------|-------|-------|-------|-------|{projection_rule}
 """;
     
     if sorted_players:
         for rank, (player, scores) in enumerate(sorted_players, 1):
             medal = "🥇" if rank == 1 else "🥈" if rank == 2 else "🥉" if rank == 3 else "  ";
-            readme += f"| {medal} {rank} | **{player.title()}** | **{scores['total']}** | {scores['wc']} | {scores['ds']} | {scores['cs']} | {scores['ws']} | {scores['games']} |\n";
+            readme += f"| {medal} {rank} | **{player.title()}** | **{scores['total']}** | {scores['wc']} | {scores['ds']} | {scores['cs']} | {scores['ws']} | {scores['games']} |";
+            if limits:
+                limit = limits.get(player, {'max': scores['total'], 'eliminated': False});
+                readme += f" {limit['max']}{' ❌' if limit['eliminated'] else ''} |";
+            if projection:
+                chances = projected.get(player, {'first': 0.0, 'expected': scores['total']});
+                readme += f" {chances['first'] * 100:.1f}% | {chances['expected']:.1f} |";
+            readme += "\n";
     else:
-        readme += "| - | *No games scored yet* | 0 | 0 | 0 | 0 | 0 | 0 |\n";
+        readme += ("| - | *No games scored yet* | 0 | 0 | 0 | 0 | 0 | 0 |" + (" - |" if limits else "")
+                   + (" - | - |" if projection else "") + "\n");
+    
+    if limits:
+        readme += "\n_Max is the most points still reachable from the open picked games; ❌ marks players who can no longer finish first._\n";
+    if projection:
+        readme += (f"\n_1st % and Proj. (expected final points) come from {projection['simulations']:,} simulation(s) "
+                   f"of the {projection['open_games']} open picked game(s), each game a coin flip._\n");
     
     readme += """
 ## 🏷️ Labels
@@ -159,7 +348,7 @@ Track World Series baseball bracket games using GitHub issues following the 2025
 
 ## 🤖 Automation
 
-- **Player Management**: Workflow dispatch to delete and recreate player labels
+- **Player Management**: Workflow dispatch to sync player labels with a list of players
 - **Scoring**: Automatically calculates and updates league table
 
 ---
@@ -169,50 +358,116 @@ Track World Series baseball bracket games using GitHub issues following the 2025
     
     return readme;
 
-def update_readme(content):
-    """Update the README.md file in the repository."""
-    # Get current README to get its SHA
-    url = f"{BASE_URL}/contents/README.md";
-    response = requests.get(url, headers=HEADERS);
+def render_readme(current, player_scores, projection=None, limits=None):
+    """Render the README around the current one's bracket section; an unchanged table keeps the current text."""
+    readme = keep_sections(current, generate_readme(player_scores, projection, limits), 'bracket');
+    # Only the timestamp moved: nothing worth a commit
+    if LAST_UPDATED_PATTERN.sub('', readme) == LAST_UPDATED_PATTERN.sub('', current):
+        return current;
+    return readme;
+
+def update_readme(player_scores, repo=REPO, projection=None, limits=None):
+    """Publish the league table to README.md, keeping the generator's bracket section."""
+    publisher = ReadmePublisher(SCHEDULER, HEADERS, repo);
+    commit = publisher.publish(lambda current: render_readme(current, player_scores, projection, limits),
+                               '📊 Update playoff scores and league table');
     
-    if response.status_code == 200:
-        current_file = response.json();
-        sha = current_file['sha'];
+    if commit:
+        print(f"✅ README.md updated in {commit[:7]}!");
     else:
-        sha = None;
-    
-    # Update or create README
-    import base64;
-    encoded_content = base64.b64encode(content.encode()).decode();
-    
-    data = {
-        'message': '📊 Update playoff scores and league table',
-        'content': encoded_content,
-        'branch': 'main'
-    };
-    
-    if sha:
-        data['sha'] = sha;
+        print("✅ README.md is already up to date");
+
+def parse_args(argv=None):
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description='Score the World Series bracket playoffs.');
+    parser.add_argument('--incremental', action='store_true',
+                        help='Apply only changed issues to the persisted score state');
+    parser.add_argument('--coalesce', action='store_true',
+                        help='Exit early when a newer run or the saved state already covers the triggering event, '
+                             'and otherwise sync every changed issue rather than only the event\'s; implies --incremental');
+    parser.add_argument('--verify', action='store_true',
+                        help='With --incremental, also rebuild from a full listing and compare');
+    parser.add_argument('--state', default=SCORE_STATE_PATH,
+                        help=f'Score state file (default: {SCORE_STATE_PATH}); with several --repos, '
+                             'each gets <dir>/<owner>/<name>/<file>');
+    parser.add_argument('--page-workers', type=int, default=PAGE_WORKERS,
+                        help=f'Issue pages fetched concurrently once the last page is known (default: {PAGE_WORKERS})');
+    parser.add_argument('--project', action='store_true',
+                        help='Simulate the open picked games and add first-place chances and expected points to the table');
+    parser.add_argument('--simulations', type=int, default=PROJECTION_SIMULATIONS,
+                        help=f'Simulations for --project (default: {PROJECTION_SIMULATIONS})');
+    parser.add_argument('--projection-budget', type=float, default=PROJECTION_BUDGET, metavar='SECONDS',
+                        help=f'Stop starting simulations after this many seconds (default: {PROJECTION_BUDGET:g})');
+    parser.add_argument('--projection-workers', type=int, default=PROJECTION_WORKERS,
+                        help=f'Processes running simulations (default: {PROJECTION_WORKERS})');
+    parser.add_argument('--repos', nargs='+', metavar='OWNER/NAME', default=[REPO],
+                        help=f'Pool repositories to score; several are scored concurrently (default: {REPO})');
+    parser.add_argument('--repo-workers', type=int, default=REPO_WORKERS,
+                        help=f'Repositories scored at the same time (default: {REPO_WORKERS})');
+    args = parser.parse_args(argv);
+    if args.coalesce:
+        args.incremental = True;
+    return args;
+
+def full_rebuild(repo=REPO, page_workers=PAGE_WORKERS):
+    """List every issue and build scores and a fresh score state from scratch."""
+    synced_at = utc_timestamp();
+    state = build_score_state((), synced_at);
     
-    response = requests.put(url, headers=HEADERS, json=data);
-    response.raise_for_status();
+    def recorded(issues):
+        # Each issue lands in the state as it streams past to the scorer
+        for issue in issues:
+            apply_issue_updates(state, (issue,));
+            yield issue;
     
-    print("✅ README.md updated successfully!");
+    print("📥 Fetching and scoring game issues...");
+    player_scores = calculate_scores(recorded(get_all_issues(repo=repo, page_workers=page_workers)));
+    print(f"   Found {len(state['issues'])} issue(s)\n");
+    return player_scores, state;
 
-def main():
-    if not GITHUB_TOKEN:
-        print("❌ Error: GITHUB_TOKEN environment variable not set");
-        sys.exit(1);
+def state_path_for(path, repo):
+    """Per-repository score state file for multi-tenant runs."""
+    directory, filename = os.path.split(path);
+    return os.path.join(directory, repo, filename);
+
+def score_repository(repo, args, state_path):
+    """Score one repository and publish its league table; returns a summary for the report."""
+    state = load_score_state(state_path) if args.incremental else None;
     
-    print("⚾🍿🌭 World Series Bracket - Playoff Scorer 🧤⚾\n");
-    print(f"Repository: {REPO_OWNER}/{REPO_NAME}\n");
+    if args.coalesce:
+        reason = coalesced_reason(state, repo);
+        if reason:
+            print(f"⏭️  Skipping: {reason}");
+            return {'repo': repo, 'skipped': reason};
     
-    print("📥 Fetching game issues...");
-    issues = get_all_issues();
-    print(f"   Found {len(issues)} issue(s)\n");
+    if state:
+        print("📥 Syncing score state...");
+        # A coalesced run covers a burst of events, so it reads every change since the high-water mark
+        with METRICS.span('listing'):
+            sync_score_state(state, repo, args.page_workers, use_event=not args.coalesce);
+        print(f"   Tracking {len(state['issues'])} issue(s)\n");
+        
+        print("🔢 Calculating scores...");
+        with METRICS.span('scoring'):
+            player_scores = scores_from_state(state);
+        
+        if args.verify:
+            print("🔍 Verifying against a full rebuild...");
+            with METRICS.span('verify'):
+                rebuilt_scores, rebuilt_state = full_rebuild(repo, args.page_workers);
+            mismatched = compare_scores(rebuilt_scores, player_scores);
+            if mismatched:
+                print(f"   ⚠️  Incremental state disagreed for: {', '.join(mismatched)}; using the rebuild");
+                player_scores, state = rebuilt_scores, rebuilt_state;
+            else:
+                print("   ✓ Incremental scores match the full rebuild");
+    else:
+        # Issues are scored as they stream in, so listing and scoring are one phase
+        with METRICS.span('listing'):
+            player_scores, state = full_rebuild(repo, args.page_workers);
     
-    print("🔢 Calculating scores...");
-    player_scores = calculate_scores(issues);
+    if args.incremental:
+        save_score_state(state, state_path);
     
     if player_scores:
         print("   Player Scores:");
@@ -221,12 +476,109 @@ def main():
     else:
         print("   No scores yet\n");
     
-    print("\n📝 Generating README.md...");
-    readme_content = generate_readme(player_scores);
+    with METRICS.span('limits'):
+        limits = calculate_limits(state, player_scores);
+    with METRICS.span('projection'):
+        projection = project_standings(state, player_scores, args) if args.project else None;
+    
+    print("\n📤 Publishing README.md...");
+    with METRICS.span('readme'):
+        update_readme(player_scores, repo, projection, limits);
+    METRICS.count('issues', len(state['issues']));
+    METRICS.count('players', len(player_scores));
+    
+    leader = max(player_scores.items(), key=lambda x: x[1]['total'], default=None);
+    return {
+        'repo': repo,
+        'issues': len(state['issues']),
+        'players': len(player_scores),
+        'leader': f"{leader[0].title()} ({leader[1]['total']})" if leader else '-'
+    };
+
+def calculate_limits(state, player_scores):
+    """Work out every player's maximum possible points and who is eliminated from the state's game records."""
+    print("\n🧮 Calculating maximum possible points...");
+    games = (entry['game'] for entry in state['issues'].values() if entry['game']);
+    totals = {player: scores['total'] for player, scores in player_scores.items()};
+    try:
+        limits = outlook(games, totals, SERIES_POINTS);
+    except UnplacedGames as e:
+        # Without those games' points the maximums would be too low and players wrongly eliminated
+        print(f"   ⚠️  Not showing maximum points: {e}");
+        return None;
+    except Exception as e:
+        print(f"   ⚠️  Calculation failed: {e}");
+        return None;
     
-    print("📤 Updating repository...");
-    update_readme(readme_content);
+    eliminated = sorted(player for player, limit in limits.items() if limit['eliminated']);
+    print(f"   {len(limits) - len(eliminated)} player(s) can still finish first, {len(eliminated)} eliminated");
+    return limits;
+
+def project_standings(state, player_scores, args):
+    """Run the Monte Carlo projection over the state's game records."""
+    print("\n🎲 Projecting final standings...");
+    games = (entry['game'] for entry in state['issues'].values() if entry['game']);
+    totals = {player: scores['total'] for player, scores in player_scores.items()};
+    try:
+        projection = project(games, totals, SERIES_POINTS, simulations=args.simulations,
+                             workers=args.projection_workers, budget=args.projection_budget);
+    except UnplacedGames as e:
+        print(f"   ⚠️  Not projecting: {e}");
+        return None;
+    except Exception as e:
+        print(f"   ⚠️  Projection failed: {e}");
+        return None;
+    
+    for series in projection['settled']:
+        print(f"   ℹ️  {series}: its last possible game is closed, treating the series as decided");
+    print(f"   {projection['simulations']:,} simulation(s) of {projection['open_games']} open picked game(s) "
+          f"in {projection['seconds']:.1f}s");
+    for player, chances in sorted(projection['players'].items(), key=lambda x: x[1]['first'], reverse=True)[:10]:
+        print(f"   - {player.title()}: {chances['first'] * 100:.1f}% to finish first, {chances['expected']:.1f} expected points");
+    return projection;
+
+def print_report(results):
+    """Print the per-repository summary of a multi-tenant run."""
+    print(f"\n📋 {'Repository':<34} {'Issues':>7} {'Players':>8}  Leader");
+    for result in results:
+        if 'error' in result:
+            print(f"   {result['repo']:<34} failed: {result['error']}");
+        elif 'skipped' in result:
+            print(f"   {result['repo']:<34} skipped: {result['skipped']}");
+        else:
+            print(f"   {result['repo']:<34} {result['issues']:>7} {result['players']:>8}  {result['leader']}");
+
+def main():
+    args = parse_args();
     
+    if not GITHUB_TOKEN:
+        print("❌ Error: GITHUB_TOKEN environment variable not set");
+        sys.exit(1);
+    
+    print("⚾🍿🌭 World Series Bracket - Playoff Scorer 🧤⚾\n");
+    print(f"Repository: {', '.join(args.repos)}\n");
+    
+    failed = False;
+    if len(args.repos) == 1:
+        score_repository(args.repos[0], args, args.state);
+    else:
+        print(f"Scoring {len(args.repos)} repositories with {args.repo_workers} worker(s)...\n");
+        results = run_for_repositories(args.repos, lambda repo: score_repository(repo, args, state_path_for(args.state, repo)),
+                                       max_workers=args.repo_workers);
+        print_report(results);
+        failed = any('error' in result for result in results);
+    
+    print(f"\n⏱️  Throttling: {SCHEDULER.summary()}");
+    if HTTP_CACHE.enabled:
+        print(f"🗄️  HTTP cache: {HTTP_CACHE.summary()}");
+        METRICS.set_counters({'hits': HTTP_CACHE.hits, 'misses': HTTP_CACHE.misses}, prefix='http_cache_');
+    print(f"🐢 Slowest phases: {METRICS.phase_summary()}");
+    metrics_path = METRICS.write();
+    if metrics_path:
+        print(f"📈 Metrics written to {metrics_path}");
+    
+    if failed:
+        sys.exit(1);
     print("\n🎉 Scoring complete!");
 
 
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Vectorized scoring engine for score_playoffs.py.
+Closed, labeled issues become a sparse players x games incidence (one entry per
+player label on a game) and a per-game points vector from the series round.
+Totals, per-round points and game counts each come from one weighted bincount
+over that incidence, so large pools and multi-season listings score in
+NumPy instead of a per-label Python loop. Without NumPy the same arrays are
+aggregated in Python.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from issue_records import LABELS, IssueRecord
+
+
+class Incidence:
+    """Sparse players x games incidence with each game's round index."""
+
+    def __init__(self, rounds: List[str]):
+        self.rounds = rounds
+        self.round_index = {series: index for index, series in enumerate(rounds)}
+        self.players: Dict[str, int] = {}
+        self.label_players: Dict[str, int] = {}
+        self.game_rounds = array('b')
+        self.entry_players = array('l')
+        self.entry_games = array('l')
+
+    def add_game(self, series: str, player_labels: Iterable[str]):
+        """Record one scored game and the player labels on it."""
+        game = len(self.game_rounds)
+        self.game_rounds.append(self.round_index[series])
+        for label in player_labels:
+            player = self.label_players.get(label)
+            if player is None:
+                name = label.replace('player:', '')
+                player = self.label_players[label] = self.players.setdefault(name, len(self.players))
+            self.entry_players.append(player)
+            self.entry_games.append(game)
+
+
+def build_incidence(issues: Iterable[IssueRecord], rounds: List[str]) -> Incidence:
+    """Scan each completed issue's label IDs once for its series and player labels."""
+    incidence = Incidence(rounds)
+    names = LABELS.names
+    # Label ID -> 'series', 'player' or None, classified once per distinct label
+    kinds: Dict[int, Optional[str]] = {}
+    for issue in issues:
+        # Issues closed as not planned are games the bracket ruled out
+        if issue.state != 'closed' or issue.state_reason == 'not_planned':
+            continue
+        series: Optional[str] = None
+        players = []
+        for label_id in issue.label_ids:
+            kind = kinds.get(label_id, '')
+            if kind == '':
+                name = names[label_id]
+                kind = kinds[label_id] = 'player' if name.startswith('player:') else 'series' if name.startswith('series:') else None
+            if kind == 'player':
+                players.append(names[label_id])
+            elif kind == 'series' and series is None:
+                series = names[label_id]
+        if series and players:
+            incidence.add_game(series, players)
+    return incidence
+
+
+def aggregate(incidence: Incidence, series_points: Dict[str, int]) -> Tuple[List[int], List[List[int]], List[int]]:
+    """Per-player totals, per-round points and game counts."""
+    num_players = len(incidence.players)
+    num_rounds = len(incidence.rounds)
+    points = [series_points[series] for series in incidence.rounds]
+
+    if np is not None and incidence.entry_players:
+        players = np.frombuffer(incidence.entry_players, dtype=np.dtype(f'i{incidence.entry_players.itemsize}'))
+        entry_rounds = np.frombuffer(incidence.game_rounds, dtype=np.int8).astype(np.int64)[
+            np.frombuffer(incidence.entry_games, dtype=players.dtype)]
+        entry_points = np.asarray(points, dtype=np.int64)[entry_rounds]
+
+        by_round = np.bincount(players * num_rounds + entry_rounds, weights=entry_points,
+                               minlength=num_players * num_rounds).astype(np.int64).reshape(num_players, num_rounds)
+        games = np.bincount(players, minlength=num_players)
+        return by_round.sum(axis=1).tolist(), by_round.tolist(), games.tolist()
+
+    by_round = [[0] * num_rounds for _ in range(num_players)]
+    games = [0] * num_players
+    game_rounds = incidence.game_rounds
+    for player, game in zip(incidence.entry_players, incidence.entry_games):
+        round_index = game_rounds[game]
+        by_round[player][round_index] += points[round_index]
+        games[player] += 1
+    return [sum(row) for row in by_round], by_round, games
+
+
+def score_incidence(incidence: Incidence, series_points: Dict[str, int]) -> Dict[str, Dict[str, int]]:
+    """Player score table in the shape calculate_scores returns, in first-seen player order."""
+    totals, by_round, games = aggregate(incidence, series_points)
+    short_names = [series.split(':')[1] for series in incidence.rounds]
+
+    scores = {}
+    for name, index in incidence.players.items():
+        entry = {'total': totals[index]}
+        entry.update(zip(short_names, by_round[index]))
+        entry['games'] = games[index]
+        scores[name] = entry
+    return scores
+
+
+def score_issues(issues: Iterable[IssueRecord], series_points: Dict[str, int]) -> Dict[str, Dict[str, int]]:
+    """Score issue records."""
+    return score_incidence(build_incidence(issues, list(series_points)), series_points)
+
+
+def score_contributions(contributions: Iterable[Dict], series_points: Dict[str, int]) -> Dict[str, Dict[str, int]]:
+    """Score per-issue contributions ({'series', 'players'}) from the incremental state."""
+    incidence = Incidence(list(series_points))
+    for contribution in contributions:
+        incidence.add_game(contribution['series'], contribution['players'])
+    return score_incidence(incidence, series_points)
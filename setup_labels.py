@@ -6,18 +6,28 @@ Creates series round labels and league labels.
 
 import os
 import sys
-import requests
+
+from label_sync import LabelSync
+from rate_limit import RequestScheduler
+from run_metrics import RunMetrics
+from transport import GITHUB_API_URL, create_session
 
 GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
 REPO_OWNER = 'oraweb'
 REPO_NAME = 'world-series-bracket'
-BASE_URL = f'https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/labels'
+BASE_URL = f'{GITHUB_API_URL}/repos/{REPO_OWNER}/{REPO_NAME}/labels'
 
 HEADERS = {
     'Authorization': f'token {GITHUB_TOKEN}',
     'Accept': 'application/vnd.github.v3+json'
 }
 
+SESSION = create_session()
+SCHEDULER = RequestScheduler(SESSION)
+
+METRICS = RunMetrics('setup_labels')
+METRICS.instrument(SESSION, SCHEDULER)
+
 # Define labels to create
 LABELS = [
     # Series round labels
@@ -54,27 +64,6 @@ LABELS = [
     }
 ]
 
-def get_all_labels():
-    """Fetch all existing labels from the repository."""
-    response = requests.get(BASE_URL, headers=HEADERS)
-    response.raise_for_status()
-    return response.json()
-
-def label_exists(label_name, existing_labels):
-    """Check if a label already exists."""
-    return any(label['name'] == label_name for label in existing_labels)
-
-def create_label(label_data):
-    """Create a single label."""
-    response = requests.post(BASE_URL, headers=HEADERS, json=label_data)
-    return response.status_code == 201
-
-def update_label(label_name, label_data):
-    """Update an existing label."""
-    url = f"{BASE_URL}/{label_name}"
-    response = requests.patch(url, headers=HEADERS, json=label_data)
-    return response.status_code == 200
-
 def main():
     if not GITHUB_TOKEN:
         print("❌ Error: GITHUB_TOKEN environment variable not set")
@@ -83,39 +72,20 @@ def main():
     print("⚾🍿🌭 World Series Bracket - Label Setup 🧤⚾\n")
     print(f"Repository: {REPO_OWNER}/{REPO_NAME}\n")
     
-    print("📥 Fetching existing labels...")
-    existing_labels = get_all_labels()
-    existing_names = {label['name'] for label in existing_labels}
-    print(f"   Found {len(existing_labels)} existing label(s)\n")
-    
     print("🏷️  Creating/updating labels...")
-    created_count = 0
-    updated_count = 0
-    
-    for label_info in LABELS:
-        label_name = label_info['name']
-        label_data = {
-            'name': label_name,
-            'color': label_info['color'],
-            'description': label_info['description']
-        }
-        
-        if label_name in existing_names:
-            if update_label(label_name, label_data):
-                print(f"   ✓ Updated: {label_name}")
-                updated_count += 1
-            else:
-                print(f"   ✗ Failed to update: {label_name}")
-        else:
-            if create_label(label_data):
-                print(f"   ✓ Created: {label_name}")
-                created_count += 1
-            else:
-                print(f"   ✗ Failed to create: {label_name}")
+    # Only labels that are missing or differ are written; other labels are left alone
+    with METRICS.span('labels'):
+        counts = LabelSync(SCHEDULER, HEADERS, BASE_URL).sync(LABELS)
     
-    print(f"\n✅ Setup complete!")
-    print(f"   Created: {created_count} label(s)")
-    print(f"   Updated: {updated_count} label(s)")
+    print("\n✅ Setup complete!")
+    print(f"   Created: {counts['create']} label(s)")
+    print(f"   Updated: {counts['update']} label(s)")
+    print(f"   Unchanged: {counts['unchanged']} label(s)")
+    print(f"   Throttling: {SCHEDULER.summary()}")
+    METRICS.set_counters(counts, prefix='labels_')
+    metrics_path = METRICS.write()
+    if metrics_path:
+        print(f"   Metrics written to {metrics_path}")
 
 if __name__ == '__main__':
     main()
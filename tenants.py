@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Multi-tenant runner shared by the bracket scripts.
+Processes several pool repositories concurrently in one process so they share
+the pooled session, the rate-limited scheduler and any crawl done up front.
+Output written from a repository's thread is tagged with its name.
+"""
+
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+# Repositories processed at the same time
+REPO_WORKERS = int(os.environ.get('REPO_WORKERS', '4'))
+
+_context = threading.local()
+
+
+def current_repository() -> Optional[str]:
+    """The repository the calling thread is working on, if any."""
+    return getattr(_context, 'repo', None)
+
+
+def bind_repository(function: Callable) -> Callable:
+    """Wrap a function so it runs as the calling thread's repository in whichever thread calls it."""
+    repo = current_repository()
+
+    def run(*args, **kwargs):
+        previous = current_repository()
+        _context.repo = repo
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _context.repo = previous
+
+    return run
+
+
+class TaggedStream:
+    """Wraps a text stream so complete lines from a repository's thread start with its name."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def write(self, text: str) -> int:
+        repo = current_repository()
+        if repo is None:
+            with self._lock:
+                return self.stream.write(text)
+
+        # Buffer per thread so concurrent repositories never split each other's lines
+        buffer = getattr(_context, 'buffer', '') + text
+        *lines, _context.buffer = buffer.split('\n')
+        if lines:
+            with self._lock:
+                self.stream.write(''.join(f"[{repo}] {line}\n" for line in lines))
+        return len(text)
+
+    def flush_thread(self):
+        """Write out a trailing partial line left by the calling thread."""
+        pending = getattr(_context, 'buffer', '')
+        _context.buffer = ''
+        if pending:
+            self.write(pending + '\n')
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def run_for_repositories(repos: List[str], process: Callable[[str], Dict],
+                         max_workers: int = REPO_WORKERS) -> List[Dict]:
+    """Run `process(repo)` for every repository concurrently and return the results in input order.
+
+    A repository whose run raises gets {'repo': repo, 'error': message} instead of a result.
+    """
+    stream = TaggedStream(sys.stdout)
+
+    def run(repo: str) -> Dict:
+        _context.repo = repo
+        try:
+            return process(repo)
+        except Exception as e:
+            print(f"❌ {e}")
+            return {'repo': repo, 'error': str(e)}
+        finally:
+            stream.flush_thread()
+            _context.repo = None
+
+    sys.stdout = stream
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(repos)))) as executor:
+            return list(executor.map(run, repos))
+    finally:
+        sys.stdout = stream.stream
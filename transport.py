@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Pluggable HTTP transport shared by the bracket scripts.
+Every script builds its session here so requests can be recorded to a cassette,
+replayed offline, or pointed at a local stand-in server via GITHUB_API_URL and
+PLAINTEXTSPORTS_URL.
+"""
+
+import os
+import json
+import base64
+import hashlib
+import threading
+from collections import defaultdict, deque
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+# live (default), record or replay
+HTTP_TRANSPORT = os.environ.get('HTTP_TRANSPORT', 'live')
+HTTP_CASSETTE = os.environ.get('HTTP_CASSETTE', 'cassette.jsonl')
+
+# Base URLs, overridable to drive the scripts against a local stand-in
+GITHUB_API_URL = os.environ.get('GITHUB_API_URL', 'https://api.github.com').rstrip('/')
+PLAINTEXTSPORTS_URL = os.environ.get('PLAINTEXTSPORTS_URL', 'https://plaintextsports.com').rstrip('/')
+
+
+def request_key(method: str, url: str, body) -> str:
+    """Identify a request by method, URL and a digest of its body."""
+    if isinstance(body, str):
+        body = body.encode()
+    digest = hashlib.sha256(body or b'').hexdigest()[:16]
+    return f"{method} {url} {digest}"
+
+
+def build_response(request: requests.PreparedRequest, status: int, headers: Dict[str, str], content: bytes) -> requests.Response:
+    """Build a requests.Response for a prepared request."""
+    response = requests.Response()
+    response.request = request
+    response.url = request.url
+    response.status_code = status
+    response.headers = requests.structures.CaseInsensitiveDict(headers)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers) or 'utf-8'
+    response._content = content
+    return response
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Sends requests over the network and appends every exchange to a cassette file."""
+
+    def __init__(self, cassette_path: str, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette_path = cassette_path
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        record = {
+            'key': request_key(request.method, request.url, request.body),
+            'status': response.status_code,
+            'headers': dict(response.headers),
+            'body': base64.b64encode(response.content).decode()
+        }
+        # Content is already decoded, so the encoding headers no longer apply
+        record['headers'].pop('Content-Encoding', None)
+        record['headers'].pop('Transfer-Encoding', None)
+        with self._lock:
+            with open(self.cassette_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + '\n')
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Serves responses from a cassette without touching the network.
+
+    Identical requests replay their recordings in order; the last one repeats.
+    Requests whose body changed since recording (timestamps in a README, say)
+    fall back to the recordings for the same method and URL.
+    """
+
+    def __init__(self, cassette_path: str):
+        super().__init__()
+        self._lock = threading.Lock()
+        self.recordings = defaultdict(deque)
+        self.by_url = defaultdict(deque)
+        with open(cassette_path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    self.recordings[record['key']].append(record)
+                    self.by_url[record['key'].rsplit(' ', 1)[0]].append(record)
+
+    @staticmethod
+    def next_record(queue: deque) -> dict:
+        return queue.popleft() if len(queue) > 1 else queue[0]
+
+    def send(self, request, **kwargs):
+        key = request_key(request.method, request.url, request.body)
+        with self._lock:
+            queue = self.recordings.get(key) or self.by_url.get(key.rsplit(' ', 1)[0])
+            if not queue:
+                raise requests.ConnectionError(f"No recorded response for {request.method} {request.url}", request=request)
+            record = self.next_record(queue)
+        return build_response(request, record['status'], record['headers'], base64.b64decode(record['body']))
+
+    def close(self):
+        pass
+
+
+def create_session(pool_maxsize: int = 10, mode: Optional[str] = None, cassette: Optional[str] = None) -> requests.Session:
+    """Create a pooled session using the configured transport (live, record or replay)."""
+    mode = mode or HTTP_TRANSPORT
+    cassette = cassette or HTTP_CASSETTE
+
+    if mode == 'replay':
+        adapter = ReplayAdapter(cassette)
+    elif mode == 'record':
+        adapter = RecordingAdapter(cassette, pool_connections=4, pool_maxsize=pool_maxsize)
+    elif mode == 'live':
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+    else:
+        raise ValueError(f"Unknown HTTP_TRANSPORT '{mode}' (expected live, record or replay)")
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session